@@ -0,0 +1,124 @@
+"""
+Comparación de `classify_batch` con la clasificación frame a frame de `HandRecog`.
+
+Clasifica la mano con lateralidad `--label` de una sesión grabada (o de datos
+sintéticos) por los dos caminos, comprueba que las máscaras de dedos, los gestos
+sin confirmar y los confirmados coinciden exactamente y mide los frames por
+segundo de cada uno.
+
+Uso:
+    python -m benchmarks.batch_recognition
+    python -m benchmarks.batch_recognition --session sesion.gcs
+    python -m benchmarks.batch_recognition --frames 200000
+
+El proceso termina con código 1 si algún frame no coincide.
+"""
+import argparse
+import sys
+import time
+import numpy as np
+
+from benchmarks.hotpaths import synthetic_frames
+from src.enums.gesture_enums import HLabel
+from src.frame_results import results_from_frame
+from src.hand_recognition import HandRecog, classify_batch
+from src.session_recorder import LABEL_LEFT, LABEL_RIGHT, load_session
+
+
+def session_hand(frames, label=LABEL_RIGHT):
+    """
+    Extrae de una sesión los landmarks `(N, 21, 3)`, la presencia `(N,)` y la
+    confianza `(N,)` de la mano con lateralidad `label`.
+    """
+    n = len(frames)
+    landmarks = np.zeros((n, 21, 3), dtype=np.float32)
+    present = np.zeros(n, dtype=bool)
+    confidence = np.ones(n, dtype=np.float64)
+    hands = np.arange(frames['label'].shape[1])
+    match = (frames['label'] == label) & (hands < frames['num_hands'][:, None])
+    rows = np.flatnonzero(match.any(axis=1))
+    slots = match[rows].argmax(axis=1)
+    landmarks[rows] = frames['landmarks'][rows, slots]
+    present[rows] = True
+    confidence[rows] = np.abs(frames['score'][rows, slots])
+    return landmarks, present, confidence
+
+
+def session_hand_results(frames, label, present):
+    """Reconstruye los landmarks de MediaPipe de la mano `label` en cada frame (None si no está)."""
+    hands = [None] * len(frames)
+    for i in np.flatnonzero(present):
+        frame = frames[i]
+        slot = [h for h in range(int(frame['num_hands'])) if frame['label'][h] == label][0]
+        hands[i] = results_from_frame(frame).multi_hand_landmarks[slot]
+    return hands
+
+
+def per_frame(frames, label, present, confidence):
+    """Clasifica frame a frame con `HandRecog`; devuelve (máscaras, gestos sin confirmar, confirmados)."""
+    n = len(frames)
+    fingers = np.zeros(n, dtype=np.int64)
+    raw = np.zeros(n, dtype=np.int64)
+    gestures = np.zeros(n, dtype=np.int64)
+    # Los landmarks de MediaPipe se reconstruyen antes de medir
+    hands = session_hand_results(frames, label, present)
+    timestamps = frames['t'].tolist()
+    confidence = confidence.tolist()
+
+    hr = HandRecog(HLabel.MAJOR)
+    start = time.perf_counter()
+    for i in range(n):
+        hr.update_hand_result(hands[i])
+        hr.set_finger_state()
+        gestures[i] = hr.get_gesture(timestamps[i], confidence[i])
+        if hands[i] is not None:
+            fingers[i] = hr.finger
+            raw[i] = hr.prev_gesture
+        else:
+            raw[i] = gestures[i]
+    elapsed = time.perf_counter() - start
+    return fingers, raw, gestures, elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clasificación por lotes frente a frame a frame.")
+    parser.add_argument("--session", help="archivo de sesión grabado (por defecto, datos sintéticos)")
+    parser.add_argument("--frames", type=int, default=20000, help="frames sintéticos")
+    parser.add_argument("--label", choices=("Right", "Left"), default="Right",
+                        help="lateralidad de la mano clasificada")
+    args = parser.parse_args(argv)
+
+    if args.session:
+        frames = load_session(args.session)
+    else:
+        # Cada postura se repite varios frames para que los gestos lleguen a confirmarse
+        frames = np.repeat(synthetic_frames(max(1, args.frames // 6)), 6)
+        frames['t'] = np.arange(len(frames)) / 15
+        frames['score'] = np.random.default_rng(1).uniform(0.2, 1.0, frames['score'].shape)
+    label = LABEL_RIGHT if args.label == "Right" else LABEL_LEFT
+    landmarks, present, confidence = session_hand(frames, label)
+
+    fingers, raw, gestures, frame_elapsed = per_frame(frames, label, present, confidence)
+    start = time.perf_counter()
+    batch = classify_batch(landmarks, frames['t'], confidence, present)
+    batch_elapsed = time.perf_counter() - start
+
+    n = len(frames)
+    print(f"{n} frames, {int(present.sum())} con mano")
+    print(f"frame a frame: {n / frame_elapsed:12.0f} frames/s")
+    print(f"por lotes:     {n / batch_elapsed:12.0f} frames/s ({frame_elapsed / batch_elapsed:.0f}x)")
+    mismatches = 0
+    for name, expected, actual in (("máscaras", fingers, batch.fingers), ("gestos sin confirmar", raw, batch.raw),
+                                   ("gestos confirmados", gestures, batch.gestures)):
+        diff = np.flatnonzero(expected != actual)
+        mismatches += len(diff)
+        if len(diff):
+            print(f"DIFERENCIAS en {name}: {len(diff)} frames, el primero en {diff[0]}")
+    if mismatches:
+        return 1
+    print("Resultados idénticos.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Evaluación de los filtros de cursor sobre trazas de landmarks.
+
+Pasa la posición del landmark 9 de la mano principal (la misma que usa
+`Controller.get_position`) por cada filtro de `src.cursor_filters` y mide:
+
+- temblor: RMS del movimiento del cursor por frame mientras la mano está quieta (px);
+- retardo: desfase entre la velocidad del cursor y la de la mano (ms, negativo
+  si el cursor se adelanta gracias a la predicción).
+
+Uso:
+    python -m benchmarks.cursor_filters
+    python -m benchmarks.cursor_filters --session sesion.gcs
+    python -m benchmarks.cursor_filters --session sesion.gcs --lead 0.05
+"""
+import argparse
+import sys
+import numpy as np
+
+from config.settings import CURSOR_PREDICTION_LEAD
+from src.cursor_filters import FILTERS, evaluate_filter
+from src.gesture_handlers import cursor_filter_from_settings
+from src.session_recorder import LABEL_RIGHT, load_session
+
+# Landmark seguido por el cursor
+_POINT = 9
+
+
+def session_trace(frames, screen_size=(1920, 1080), label=LABEL_RIGHT):
+    """
+    Extrae de una sesión la traza (t, x, y) en píxeles de pantalla del landmark 9
+    de la mano con lateralidad `label`. Los frames sin esa mano quedan en NaN.
+    """
+    n = len(frames)
+    xs = np.full(n, np.nan)
+    ys = np.full(n, np.nan)
+    for i in range(n):
+        frame = frames[i]
+        for hand in range(int(frame['num_hands'])):
+            if frame['label'][hand] == label:
+                xs[i] = int(frame['landmarks'][hand, _POINT, 0] * screen_size[0])
+                ys[i] = int(frame['landmarks'][hand, _POINT, 1] * screen_size[1])
+                break
+    return np.asarray(frames['t'], dtype=np.float64), xs, ys
+
+
+def synthetic_trace(count=900, fps=15, noise_px=3.0, seed=0, screen_size=(1920, 1080)):
+    """
+    Genera una traza sintética: tramos de reposo alternados con movimientos
+    suaves entre puntos al azar, más ruido gaussiano de detección.
+    """
+    rng = np.random.default_rng(seed)
+    t = np.arange(count) / fps
+    xs = np.empty(count)
+    ys = np.empty(count)
+    pos = np.array(screen_size, dtype=np.float64) / 2
+    i = 0
+    while i < count:
+        rest = int(rng.integers(fps // 2, 2 * fps))
+        xs[i:i + rest], ys[i:i + rest] = pos
+        i += rest
+        target = rng.uniform(0.2, 0.8, 2) * screen_size
+        steps = int(rng.integers(fps // 3, fps))
+        # Perfil de velocidad en campana (mínimo jerk)
+        s = np.linspace(0, 1, steps + 1)[1:]
+        s = 10 * s ** 3 - 15 * s ** 4 + 6 * s ** 5
+        path = pos + np.outer(s, target - pos)
+        xs[i:i + steps], ys[i:i + steps] = path[:count - i].T
+        i += steps
+        pos = target
+    xs += rng.normal(0, noise_px, count)
+    ys += rng.normal(0, noise_px, count)
+    return t, np.round(xs), np.round(ys)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Temblor y retardo de los filtros de cursor.")
+    parser.add_argument("--session", help="archivo de sesión grabado (por defecto, traza sintética)")
+    parser.add_argument("--lead", type=float, default=CURSOR_PREDICTION_LEAD,
+                        help="segundos de predicción pasados a los filtros")
+    args = parser.parse_args(argv)
+
+    if args.session:
+        t, xs, ys = session_trace(load_session(args.session))
+    else:
+        t, xs, ys = synthetic_trace()
+    if np.isnan(xs).all():
+        print("La sesión no contiene la mano principal.")
+        return 1
+
+    print(f"{'filtro':10} {'temblor px':>11} {'retardo ms':>11} {'correlación':>12}")
+    for name in FILTERS:
+        lead = 0.0 if name == "legacy" else args.lead
+        report = evaluate_filter(cursor_filter_from_settings(name), t, xs, ys, lead=lead)
+        print(f"{name:10} {report['jitter_px']:11.2f} {report['lag_ms']:11.0f} {report['correlation']:12.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Rendimiento del flujo de eventos (`src.event_stream`).
+
+Publica `--batches` lotes de `--events` eventos y los recibe con
+`--subscribers` procesos suscriptores. Informa el costo de `flush` en el
+publicador, lotes y eventos por segundo, y por suscriptor los lotes recibidos,
+los descartados y la latencia de entrega (desde el `flush` hasta que el
+suscriptor tiene el lote decodificado). Con `--slow` se agrega un suscriptor
+que tarda en leer, para comprobar que sus descartes no frenan al publicador ni
+a los demás.
+
+Uso:
+    python -m benchmarks.event_stream
+    python -m benchmarks.event_stream --rate 60 --batches 600
+    python -m benchmarks.event_stream --subscribers 4 --slow
+"""
+import argparse
+import multiprocessing as mp_proc
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+from src.event_stream import EventPublisher, EventSubscriber, HAND_MAJOR, PINCH_CONTROLS
+
+_CTX = mp_proc.get_context("spawn")
+
+
+def _subscriber_main(path, delay, results):
+    """Proceso suscriptor: lee hasta que el publicador cierra y devuelve sus estadísticas."""
+    latencies = []
+    batches = events = 0
+    with EventSubscriber(path) as sub:
+        results.put("ready")
+        for batch in sub:
+            latencies.append(time.time() - batch.timestamp)
+            batches += 1
+            events += len(batch.events)
+            if delay:
+                time.sleep(delay)
+        results.put((batches, events, sub.missed, np.array(latencies)))
+
+
+def run(batches, events_per_batch, subscribers, slow=False, rate=0.0):
+    """Ejecuta el benchmark e imprime los resultados."""
+    path = os.path.join(tempfile.mkdtemp(), "events.sock")
+    publisher = EventPublisher(path).start()
+    results = _CTX.Queue()
+    delays = [0.0] * subscribers + ([0.002] if slow else [])
+    processes = [_CTX.Process(target=_subscriber_main, args=(path, delay, results), daemon=True)
+                 for delay in delays]
+    for process in processes:
+        process.start()
+    for _ in processes:
+        results.get()
+    deadline = time.monotonic() + 10.0
+    while publisher.subscribers < len(processes) and time.monotonic() < deadline:
+        publisher.flush(0.0)  # Acepta las conexiones
+        time.sleep(0.01)
+
+    flush_ns = np.zeros(batches, dtype=np.int64)
+    interval = 1.0 / rate if rate else 0.0
+    next_time = time.perf_counter()
+    start = time.perf_counter()
+    for i in range(batches):
+        if interval:
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        # Un frame típico: cambio de gesto, destino del cursor y pinza
+        for k in range(events_per_batch):
+            kind = k % 3
+            if kind == 0:
+                publisher.gesture(HAND_MAJOR, 8, 1)
+            elif kind == 1:
+                publisher.cursor(960.0 + k, 540.0)
+            else:
+                publisher.pinch(PINCH_CONTROLS[1], 0.6, 0.3)
+        t0 = time.perf_counter_ns()
+        publisher.flush(time.time())
+        flush_ns[i] = time.perf_counter_ns() - t0
+    elapsed = time.perf_counter() - start
+    dropped = publisher.batches_dropped
+    publisher.stop()
+    stats = [results.get(timeout=30) for _ in processes]
+    for process in processes:
+        process.join(timeout=5)
+
+    print(f"{batches} lotes de {events_per_batch} eventos, {len(processes)} suscriptores"
+          + (" (uno lento)" if slow else ""))
+    print(f"publicador: {batches / elapsed:12.0f} lotes/s {batches * events_per_batch / elapsed:12.0f} eventos/s")
+    print(f"flush:      p50 {np.percentile(flush_ns, 50) / 1e3:8.1f} µs  p99 {np.percentile(flush_ns, 99) / 1e3:8.1f} µs")
+    print(f"lotes descartados por suscriptores lentos: {dropped}\n")
+    print(f"{'suscriptor':12} {'lotes':>9} {'perdidos':>9} {'p50 µs':>9} {'p99 µs':>9} {'máx µs':>9}")
+    for idx, (received, _, missed, latencies) in enumerate(stats):
+        name = f"{idx}" + (" (lento)" if slow and idx == len(stats) - 1 else "")
+        if len(latencies):
+            p50, p99 = np.percentile(latencies, (50, 99)) * 1e6
+            worst = latencies.max() * 1e6
+        else:
+            p50 = p99 = worst = float("nan")
+        print(f"{name:12} {received:9d} {missed:9d} {p50:9.0f} {p99:9.0f} {worst:9.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rendimiento del flujo de eventos.")
+    parser.add_argument("--batches", type=int, default=100000, help="lotes publicados")
+    parser.add_argument("--events", type=int, default=3, help="eventos por lote")
+    parser.add_argument("--subscribers", type=int, default=2, help="suscriptores que leen sin pausa")
+    parser.add_argument("--slow", action="store_true", help="agrega un suscriptor que tarda 2 ms por lote")
+    parser.add_argument("--rate", type=float, default=0.0,
+                        help="lotes por segundo (0 tan rápido como sea posible)")
+    args = parser.parse_args(argv)
+    run(args.batches, args.events, args.subscribers, args.slow, args.rate)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Costo y memoria asignada por frame del camino de imagen del bucle principal.
+
+Compara el camino original (voltear, convertir a RGB para MediaPipe y volver
+a BGR para la vista previa, con imágenes nuevas en cada paso) con el de
+`FramePreprocessor` (volteo y conversión en una pasada sobre buffers
+reutilizados, y BGR solo para los frames que se muestran). Para cada
+resolución informa ms por frame y bytes asignados por frame en régimen estable
+(pico medido con `tracemalloc`, que también registra los arrays de NumPy y de
+OpenCV). Con `--video` mide además la lectura de frames con y sin buffer de
+captura reutilizado.
+
+Uso:
+    python -m benchmarks.frame_path
+    python -m benchmarks.frame_path --size 1920x1080 --size 640x480 --preview-every 2
+    python -m benchmarks.frame_path --video grabacion.mp4
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+import cv2
+import numpy as np
+
+from src.frame_buffers import FramePreprocessor
+
+
+def legacy_path(frame, preview):
+    """Camino original: copia volteada, copia RGB y, si se muestra, otra copia BGR."""
+    image = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
+    image.flags.writeable = False
+    if preview:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    return image
+
+
+def pooled_path(preprocessor):
+    """Camino con buffers reutilizados de `preprocessor`."""
+    def run(frame, preview):
+        image = preprocessor.model_input(frame)
+        image.flags.writeable = False
+        image.flags.writeable = True
+        if preview:
+            image = preprocessor.preview(image)
+        return image
+    return run
+
+
+def _measure(func, frames, preview_every, iterations):
+    """Devuelve (ms por frame, pico de bytes asignados por frame en régimen estable)."""
+    n = len(frames)
+    for i in range(10):  # Calentamiento: los buffers se asignan aquí
+        func(frames[i % n], True)
+    start = time.perf_counter()
+    for i in range(iterations):
+        func(frames[i % n], preview_every and i % preview_every == 0)
+    ms = 1000 * (time.perf_counter() - start) / iterations
+    peak = 0
+    tracemalloc.start()
+    for i in range(min(iterations, 100)):
+        tracemalloc.clear_traces()
+        func(frames[i % n], preview_every and i % preview_every == 0)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+    return ms, peak
+
+
+def measure_capture(path, frames=300):
+    """Lee `frames` frames de un video con y sin buffer reutilizado; devuelve {modo: (ms, bytes)}."""
+    results = {}
+    for mode in ("nuevo", "reutilizado"):
+        cap = cv2.VideoCapture(path)
+        if not cap.isOpened():
+            raise RuntimeError(f"No se pudo abrir el video {path!r}.")
+        buffer = None
+        count = 0
+        peak = 0
+        start = time.perf_counter()
+        tracemalloc.start()
+        while count < frames:
+            tracemalloc.clear_traces()
+            success, image = cap.read(buffer if mode == "reutilizado" else None)
+            if not success:
+                break
+            if count >= 10:
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+            buffer = image
+            count += 1
+        tracemalloc.stop()
+        elapsed = time.perf_counter() - start
+        cap.release()
+        results[mode] = (1000 * elapsed / max(count, 1), peak)
+    return results
+
+
+def _parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Costo y memoria por frame del camino de imagen.")
+    parser.add_argument("--size", action="append", type=_parse_size, metavar="ANCHOxALTO",
+                        help="resolución del frame (se puede repetir); por defecto 640x480, 1280x720 y 1920x1080")
+    parser.add_argument("--iterations", type=int, default=300, help="frames medidos por camino")
+    parser.add_argument("--preview-every", type=int, default=1,
+                        help="se muestra uno de cada N frames (0 sin vista previa)")
+    parser.add_argument("--video", help="video para medir también la lectura de frames")
+    args = parser.parse_args(argv)
+    sizes = args.size or [(640, 480), (1280, 720), (1920, 1080)]
+
+    rng = np.random.default_rng(0)
+    print(f"{'resolución':12} {'camino':14} {'ms/frame':>9} {'bytes/frame':>12}")
+    for width, height in sizes:
+        frames = [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(4)]
+        preprocessor = FramePreprocessor()
+        for name, func in (("original", legacy_path), ("buffers", pooled_path(preprocessor))):
+            ms, peak = _measure(func, frames, args.preview_every, args.iterations)
+            print(f"{f'{width}x{height}':12} {name:14} {ms:9.2f} {peak:12d}")
+        pool = preprocessor.pool
+        print(f"{'':12} buffers asignados: {pool.allocations} ({pool.nbytes / 1e6:.1f} MB), "
+              f"reutilizados: {pool.reuses}")
+
+    if args.video:
+        print(f"\nlectura de {args.video}")
+        for mode, (ms, peak) in measure_capture(args.video).items():
+            print(f"{'':12} {mode:14} {ms:9.2f} {peak:12d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,356 @@
+"""
+Micro-benchmarks de las rutas que se ejecutan en cada frame.
+
+Mide `HandRecog.update_hand_result`, `HandRecog.set_finger_state`,
+`HandRecog.get_gesture`, `GestureSession.classify_hands`,
+`Controller.get_position` y `Controller.pinch_control` sobre landmarks sintéticos
+o sobre una sesión grabada, sin cámara ni GPU.
+
+Si MediaPipe está instalado, mide además el camino completo de `HandRecog`
+(update + set_finger_state + get_gesture) sobre los protobufs que entrega
+`hands.process`, junto a `BaselineHandRecog`, la implementación original que
+leía cada landmark del protobuf, e imprime la comparación.
+
+Uso:
+    python -m benchmarks.hotpaths
+    python -m benchmarks.hotpaths --session sesion.gcs
+    python -m benchmarks.hotpaths --save baseline.json
+    python -m benchmarks.hotpaths --compare baseline.json --tolerance 0.25
+
+Con `--compare`, el proceso termina con código 1 si alguna medida empeora más
+que la tolerancia respecto a la línea base.
+"""
+import argparse
+import json
+import math
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+from src.enums.gesture_enums import Gest, HLabel
+from src.gesture_handlers import Controller
+from src.gesture_session import GestureSession
+from src.hand_recognition import HandRecog
+from src.session_recorder import LABEL_LEFT, LABEL_RIGHT, load_session, session_dtype
+from src.session_replay import results_from_frame
+from src.system_backends import recording_backends
+
+# Medidas comparadas contra la línea base
+COMPARED_METRICS = ("ns_per_call", "p50_ns", "p99_ns")
+
+
+def synthetic_frames(count=512, seed=0):
+    """
+    Genera frames sintéticos con dos manos: una mano base con ruido, dedos
+    doblados al azar y desplazamiento lento, para recorrer varias ramas del
+    clasificador.
+    """
+    rng = np.random.default_rng(seed)
+    frames = np.zeros(count, dtype=session_dtype(2))
+    base = np.zeros((21, 3), dtype=np.float32)
+    base[:, 0] = np.linspace(0.40, 0.60, 21)
+    base[:, 1] = np.linspace(0.80, 0.40, 21)
+    for i in range(count):
+        frames['t'][i] = i / 15
+        frames['num_hands'][i] = 2
+        frames['label'][i] = (LABEL_RIGHT, LABEL_LEFT)
+        frames['score'][i] = (0.95, 0.9)
+        for hand in range(2):
+            lm = base + rng.normal(0, 0.01, base.shape).astype(np.float32)
+            lm[:, 0] += 0.3 * hand + 0.001 * (i % 100)
+            folded = rng.random(4) < 0.5
+            for finger, tip in enumerate((8, 12, 16, 20)):
+                if folded[finger]:
+                    lm[tip, 1] = lm[tip - 3, 1] + 0.02
+            frames['landmarks'][i, hand] = lm
+    return frames
+
+
+def protobuf_hands(frames):
+    """
+    Convierte la primera mano de cada frame con manos en un
+    `NormalizedLandmarkList` de MediaPipe, como los de `hands.process`.
+
+    Returns
+    -------
+    list(tuple) o None
+        Argumentos `(landmarks,)` por frame, o None si MediaPipe no está instalado.
+    """
+    try:
+        from mediapipe.framework.formats import landmark_pb2
+    except ImportError:
+        return None
+    hands = []
+    for frame in frames:
+        if not frame['num_hands']:
+            continue
+        hand = landmark_pb2.NormalizedLandmarkList()
+        for x, y, z in frame['landmarks'][0].tolist():
+            point = hand.landmark.add()
+            point.x, point.y, point.z = x, y, z
+        hands.append((hand,))
+    return hands
+
+
+class BaselineHandRecog:
+    """
+    `HandRecog` antes de vectorizarse: lee cada landmark del protobuf en cada
+    distancia y confirma el gesto tras 5 frames iguales. Solo para comparar.
+    """
+
+    def __init__(self, hand_label):
+        self.finger = 0
+        self.ori_gesture = Gest.PALM
+        self.prev_gesture = Gest.PALM
+        self.frame_count = 0
+        self.hand_result = None
+        self.hand_label = hand_label
+
+    def update_hand_result(self, hand_result):
+        self.hand_result = hand_result
+
+    def get_signed_dist(self, point):
+        a = self.hand_result.landmark[point[0]]
+        b = self.hand_result.landmark[point[1]]
+        dist = math.sqrt((a.x - b.x) ** 2 + (a.y - b.y) ** 2)
+        return dist if a.y < b.y else -dist
+
+    def get_dist(self, point):
+        a = self.hand_result.landmark[point[0]]
+        b = self.hand_result.landmark[point[1]]
+        return math.sqrt((a.x - b.x) ** 2 + (a.y - b.y) ** 2)
+
+    def get_dz(self, point):
+        return abs(self.hand_result.landmark[point[0]].z - self.hand_result.landmark[point[1]].z)
+
+    def set_finger_state(self):
+        if not self.hand_result or not self.hand_result.landmark:
+            return
+        self.finger = 0
+        for point in ([8, 5, 0], [12, 9, 0], [16, 13, 0], [20, 17, 0]):
+            dist = max(self.get_signed_dist(point[:2]), 0.01)
+            dist2 = max(self.get_signed_dist(point[1:]), 0.01)
+            ratio = round(dist / dist2, 1)
+            self.finger = (self.finger << 1) | (1 if ratio > 0.5 else 0)
+
+    def get_gesture(self):
+        if not self.hand_result or not self.hand_result.landmark:
+            return Gest.PALM
+        if self.finger in [Gest.LAST3, Gest.LAST4] and self.get_dist([8, 4]) < 0.05:
+            current_gesture = Gest.PINCH_MAJOR
+        elif self.finger == 0b01110:
+            current_gesture = Gest.THREE_FINGER_SCROLL
+        elif Gest.FIRST2 == self.finger:
+            ratio = self.get_dist([8, 12]) / self.get_dist([5, 9])
+            if ratio > 1.7:
+                current_gesture = Gest.V_GEST
+            elif self.get_dz([8, 12]) < 0.1:
+                current_gesture = Gest.TWO_FINGER_CLOSED
+            else:
+                current_gesture = Gest.MID
+        else:
+            current_gesture = self.finger
+        if current_gesture == self.prev_gesture:
+            self.frame_count += 1
+        else:
+            self.frame_count = 0
+        self.prev_gesture = current_gesture
+        if self.frame_count > 4:
+            self.ori_gesture = current_gesture
+        return self.ori_gesture
+
+
+def _measure(func, args_list, iterations):
+    """Ejecuta `func(*args)` recorriendo `args_list` y devuelve los tiempos por llamada en ns."""
+    clock = time.perf_counter_ns
+    # Costo del propio temporizador, que se descuenta de cada medida
+    overhead = min(-(clock() - clock()) for _ in range(1000))
+    samples = np.empty(iterations, dtype=np.int64)
+    n = len(args_list)
+    for i in range(iterations):
+        args = args_list[i % n]
+        t0 = clock()
+        func(*args)
+        samples[i] = clock() - t0
+    np.subtract(samples, overhead, out=samples)
+    np.maximum(samples, 0, out=samples)
+    return samples
+
+
+def _peak_alloc(func, args_list, calls=200):
+    """Devuelve el pico de memoria asignada (bytes) por llamada medido con `tracemalloc`."""
+    n = len(args_list)
+    peak = 0
+    tracemalloc.start()
+    for i in range(calls):
+        args = args_list[i % n]
+        # `clear_traces` también reinicia el pico, así cada llamada se mide desde cero
+        tracemalloc.clear_traces()
+        func(*args)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+    return peak
+
+
+def bench(name, func, args_list, iterations):
+    """Mide una función y devuelve un diccionario con sus estadísticas."""
+    # Calentamiento
+    for args in args_list[:50]:
+        func(*args)
+    start = time.perf_counter()
+    samples = _measure(func, args_list, iterations)
+    total = time.perf_counter() - start
+    return {
+        "name": name,
+        "calls": iterations,
+        "calls_per_s": iterations / total,
+        "ns_per_call": float(samples.mean()),
+        "p50_ns": float(np.percentile(samples, 50)),
+        "p99_ns": float(np.percentile(samples, 99)),
+        "peak_alloc_bytes": _peak_alloc(func, args_list),
+    }
+
+
+def run_benchmarks(frames, iterations=20000):
+    """Ejecuta todos los benchmarks sobre `frames` y devuelve la lista de resultados."""
+    results = [results_from_frame(frame) for frame in frames]
+    results = [r for r in results if r.multi_hand_landmarks]
+    if not results:
+        raise ValueError("La sesión no contiene frames con manos.")
+    hands = [(r.multi_hand_landmarks[0],) for r in results]
+
+    controller = Controller(backends=recording_backends(record=False))
+    session = GestureSession(controller=controller)
+    hr = HandRecog(HLabel.MAJOR)
+
+    def update_and_set(hand_result):
+        hr.update_hand_result(hand_result)
+        hr.set_finger_state()
+
+    # Para medir cada etapa por separado se prepara el estado de las anteriores
+    prepared = []
+    for (hand,) in hands:
+        prep = HandRecog(HLabel.MAJOR)
+        prep.update_hand_result(hand)
+        prep.set_finger_state()
+        prepared.append((prep,))
+
+    def position(hand_result):
+        # Cada llamada avanza un frame para que el filtro de cursor no repita su salida
+        controller.set_frame_time(controller.frame_time + 1 / 15)
+        return controller.get_position(hand_result)
+
+    def pinch(hand_result):
+        controller.set_frame_time(controller.frame_time + 1 / 15)
+        controller.pinch_control(hand_result, controller.scrollHorizontal, controller.scrollVertical)
+
+    controller.pinch_control_init(hands[0][0])
+    benchmarks = [
+        bench("HandRecog.update_hand_result", hr.update_hand_result, hands, iterations),
+        bench("HandRecog.set_finger_state", HandRecog.set_finger_state, prepared, iterations),
+        bench("HandRecog.get_gesture", HandRecog.get_gesture, prepared, iterations),
+        bench("HandRecog.update+set_finger_state", update_and_set, hands, iterations),
+        bench("GestureSession.classify_hands", session.classify_hands,
+              [(r,) for r in results], iterations),
+        bench("Controller.get_position", position, hands, iterations),
+        bench("Controller.pinch_control", pinch, hands, iterations),
+    ]
+
+    protobufs = protobuf_hands(frames)
+    if protobufs:
+        benchmarks.append(bench("protobuf HandRecog.update+set+get", _full_path(HandRecog(HLabel.MAJOR)),
+                                protobufs, iterations))
+        benchmarks.append(bench("protobuf BaselineHandRecog.update+set+get",
+                                _full_path(BaselineHandRecog(HLabel.MAJOR)), protobufs, iterations))
+    return benchmarks
+
+
+def _full_path(recog):
+    """Camino completo de un frame: update_hand_result, set_finger_state y get_gesture."""
+    def run(hand_result):
+        recog.update_hand_result(hand_result)
+        recog.set_finger_state()
+        return recog.get_gesture()
+    return run
+
+
+def print_baseline_comparison(results):
+    """Imprime la mejora de `HandRecog` frente a `BaselineHandRecog` sobre protobufs."""
+    by_name = {r["name"]: r for r in results}
+    current = by_name.get("protobuf HandRecog.update+set+get")
+    baseline = by_name.get("protobuf BaselineHandRecog.update+set+get")
+    if current is None or baseline is None:
+        print("\nMediaPipe no está instalado: se omite la comparación sobre protobufs.")
+        return
+    print("\nHandRecog frente a la implementación original, sobre protobufs de MediaPipe:")
+    for metric in COMPARED_METRICS:
+        print(f"  {metric:12} {baseline[metric]:9.0f} -> {current[metric]:9.0f} ns "
+              f"({baseline[metric] / max(current[metric], 1):.2f}x)")
+    print(f"  {'pico B':12} {baseline['peak_alloc_bytes']:9d} -> {current['peak_alloc_bytes']:9d}")
+
+
+def compare(current, baseline, tolerance):
+    """
+    Compara los resultados con una línea base.
+
+    Returns
+    -------
+    list(str)
+        Descripción de cada regresión encontrada.
+    """
+    base = {r["name"]: r for r in baseline}
+    regressions = []
+    for result in current:
+        ref = base.get(result["name"])
+        if ref is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if ref[metric] > 0 and result[metric] > ref[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{result['name']} {metric}: {result[metric]:.0f} ns "
+                    f"(base {ref[metric]:.0f} ns, +{100 * (result[metric] / ref[metric] - 1):.0f}%)"
+                )
+    return regressions
+
+
+def print_table(results):
+    """Imprime los resultados en forma de tabla."""
+    print(f"{'benchmark':42} {'ns/llamada':>11} {'p50 ns':>9} {'p99 ns':>9} {'llamadas/s':>11} {'pico B':>8}")
+    for r in results:
+        print(f"{r['name']:42} {r['ns_per_call']:11.0f} {r['p50_ns']:9.0f} {r['p99_ns']:9.0f} "
+              f"{r['calls_per_s']:11.0f} {r['peak_alloc_bytes']:8d}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de las rutas críticas por frame.")
+    parser.add_argument("--session", help="archivo de sesión grabado (por defecto, datos sintéticos)")
+    parser.add_argument("--iterations", type=int, default=20000, help="llamadas medidas por benchmark")
+    parser.add_argument("--save", metavar="JSON", help="guarda los resultados como línea base")
+    parser.add_argument("--compare", metavar="JSON", help="compara contra una línea base guardada")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="empeoramiento relativo permitido frente a la línea base")
+    args = parser.parse_args(argv)
+
+    frames = load_session(args.session) if args.session else synthetic_frames()
+    results = run_benchmarks(frames, args.iterations)
+    print_table(results)
+    print_baseline_comparison(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nREGRESIONES respecto a la línea base:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nSin regresiones respecto a la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Entrenamiento y evaluación del clasificador aprendido de gestos.
+
+Los datos son sesiones grabadas con `--record` en las que se mantiene un solo
+gesto; cada una se indica como GESTO=archivo, con el nombre del gesto en `Gest`.
+Se descartan `--trim` segundos al principio y al final de cada sesión (la mano
+entrando o saliendo del gesto).
+
+`train` entrena con la primera parte de cada sesión, reserva la última
+fracción `--holdout` para evaluar y guarda el modelo. `evaluate` compara un
+modelo guardado con las reglas de `GESTURE_RULES` sobre otras sesiones: precisión
+por gesto sin confirmar y costo por mano de `HandRecog.get_gesture` con cada
+camino. Ambos comprueban además que `classify` (frame a frame) dé el mismo
+gesto que `predict` (por lotes) y terminan con código 1 si no.
+
+Uso:
+    python -m benchmarks.learned_classifier train --out gestos.npz V_GEST=v.gcs FIST=puno.gcs PALM=palma.gcs
+    python -m benchmarks.learned_classifier train --kind knn --out gestos.npz V_GEST=v.gcs FIST=puno.gcs
+    python -m benchmarks.learned_classifier evaluate --model gestos.npz V_GEST=v2.gcs FIST=puno2.gcs
+
+Para usar el modelo: `python main.py --classifier gestos.npz` o `GESTURE_CLASSIFIER_PATH`
+en config/gestures.py.
+"""
+import argparse
+import sys
+import numpy as np
+
+from benchmarks.batch_recognition import session_hand, session_hand_results
+from benchmarks.hotpaths import bench, print_table
+from src.enums.gesture_enums import Gest, HLabel
+from src.hand_recognition import HandRecog, classify_batch
+from src.learned_classifier import CLASSIFIERS, hand_features, load_classifier, make_classifier
+from src.session_recorder import LABEL_LEFT, LABEL_RIGHT, load_session
+
+
+def load_labeled(specs, label=LABEL_RIGHT, trim=0.5, holdout=0.0):
+    """
+    Carga sesiones etiquetadas GESTO=archivo.
+
+    Returns
+    -------
+    tuple(dict, dict)
+        Conjuntos de entrenamiento y de prueba, cada uno con `landmarks`
+        `(N, 21, 3)`, `labels` `(N,)` y `hands` (landmarks de MediaPipe, para
+        medir el camino frame a frame).
+    """
+    parts = {"train": [], "test": []}
+    for spec in specs:
+        name, sep, path = spec.partition("=")
+        if not sep:
+            raise ValueError(f"Se esperaba GESTO=archivo: {spec!r}")
+        try:
+            gesture = Gest[name]
+        except KeyError:
+            raise ValueError(f"Gesto desconocido: {name!r}")
+        frames = load_session(path)
+        landmarks, present, _ = session_hand(frames, label)
+        t = frames['t']
+        if len(t):
+            present &= (t >= t[0] + trim) & (t <= t[-1] - trim)
+        rows = np.flatnonzero(present)
+        split = len(rows) - int(round(len(rows) * holdout))
+        hands = session_hand_results(frames, label, present)
+        for part, idx in (("train", rows[:split]), ("test", rows[split:])):
+            parts[part].append((landmarks[idx], np.full(len(idx), int(gesture)), [hands[i] for i in idx]))
+
+    def merge(items):
+        return {
+            "landmarks": np.concatenate([lm for lm, _, _ in items]) if items else np.zeros((0, 21, 3)),
+            "labels": np.concatenate([y for _, y, _ in items]) if items else np.zeros(0, dtype=np.int64),
+            "hands": [h for _, _, hands in items for h in hands],
+        }
+    return merge(parts["train"]), merge(parts["test"])
+
+
+def _name(value):
+    try:
+        return Gest(value).name
+    except ValueError:
+        return str(value)
+
+
+def classify_mismatches(classifier, landmarks, predicted=None):
+    """
+    Cuenta (e informa) las manos en que `classify`, el camino de ejecución, no
+    coincide con `predict`, el de la evaluación.
+    """
+    if predicted is None:
+        predicted = classifier.predict(hand_features(landmarks))
+    per_hand = np.array([int(classifier.classify(lm)) for lm in landmarks], dtype=np.int64)
+    mismatches = int(np.count_nonzero(per_hand != predicted))
+    if mismatches:
+        print(f"classify difiere de predict en {mismatches} de {len(landmarks)} frames.\n")
+    return mismatches
+
+
+def report(classifier, data, iterations=5000):
+    """
+    Imprime la precisión por gesto y el costo por mano de las reglas y del
+    modelo. Devuelve el resultado de `classify_mismatches`.
+    """
+    labels = data["labels"]
+    if not len(labels):
+        print("Sin frames de prueba.")
+        return 0
+    landmarks = data["landmarks"]
+    # Gestos sin confirmar: la confirmación por tiempo es igual en ambos caminos
+    rules = classify_batch(landmarks, np.zeros(len(labels))).raw
+    learned = classifier.predict(hand_features(landmarks))
+
+    print(f"{'gesto':22} {'frames':>7} {'reglas':>8} {'modelo':>8}")
+    for gesture in np.unique(labels):
+        sel = labels == gesture
+        print(f"{_name(gesture):22} {int(sel.sum()):7d} {np.mean(rules[sel] == gesture):8.1%} "
+              f"{np.mean(learned[sel] == gesture):8.1%}")
+    print(f"{'total':22} {len(labels):7d} {np.mean(rules == labels):8.1%} {np.mean(learned == labels):8.1%}\n")
+
+    mismatches = classify_mismatches(classifier, landmarks, learned)
+
+    hands = [(hand,) for hand in data["hands"][:2000]]
+    rules_hr = HandRecog(HLabel.MAJOR)
+    learned_hr = HandRecog(HLabel.MAJOR, classifier)
+
+    def per_hand(hr):
+        def run(hand):
+            hr.update_hand_result(hand)
+            hr.set_finger_state()
+            return hr.get_gesture(0.0)
+        return run
+
+    print_table([
+        bench("HandRecog (reglas)", per_hand(rules_hr), hands, iterations),
+        bench(f"HandRecog ({classifier.kind})", per_hand(learned_hr), hands, iterations),
+        bench(f"{type(classifier).__name__}.classify", classifier.classify,
+              [(lm,) for lm in landmarks[:2000]], iterations),
+    ])
+    return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Clasificador aprendido de gestos.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    train = sub.add_parser("train", help="entrena y guarda un modelo")
+    train.add_argument("--kind", choices=sorted(CLASSIFIERS), default="mlp", help="tipo de clasificador")
+    train.add_argument("--out", required=True, help="archivo .npz del modelo")
+    train.add_argument("--holdout", type=float, default=0.25,
+                       help="fracción final de cada sesión reservada para evaluar")
+    evaluate = sub.add_parser("evaluate", help="compara un modelo con las reglas")
+    evaluate.add_argument("--model", required=True, help="archivo .npz del modelo")
+    for cmd in (train, evaluate):
+        cmd.add_argument("sessions", nargs="+", metavar="GESTO=archivo", help="sesiones etiquetadas")
+        cmd.add_argument("--label", choices=("Right", "Left"), default="Right",
+                         help="lateralidad de la mano usada")
+        cmd.add_argument("--trim", type=float, default=0.5,
+                         help="segundos descartados al inicio y al final de cada sesión")
+        cmd.add_argument("--iterations", type=int, default=5000, help="llamadas medidas por benchmark")
+    args = parser.parse_args(argv)
+
+    label = LABEL_RIGHT if args.label == "Right" else LABEL_LEFT
+    if args.command == "train":
+        train_data, test_data = load_labeled(args.sessions, label, args.trim, args.holdout)
+        if not len(train_data["labels"]):
+            print("Sin frames de entrenamiento.")
+            return 1
+        classifier = make_classifier(args.kind)
+        classifier.fit(hand_features(train_data["landmarks"]), train_data["labels"])
+        classifier.save(args.out)
+        print(f"Modelo {args.kind} entrenado con {len(train_data['labels'])} frames, guardado en {args.out}\n")
+        if classify_mismatches(classifier, train_data["landmarks"]):
+            return 1
+    else:
+        classifier = load_classifier(args.model)
+        _, test_data = load_labeled(args.sessions, label, args.trim, holdout=1.0)
+    return 1 if report(classifier, test_data, args.iterations) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
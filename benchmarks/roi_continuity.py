@@ -0,0 +1,158 @@
+"""
+Continuidad de los landmarks con región de interés al cambiar la entrada del modelo.
+
+Reproduce un video o una secuencia de imágenes con manos dos veces: con el
+modelo sobre el frame completo en cada frame (referencia) y con `RoiTracker`,
+que alterna recortes y frames completos (manos perdidas, refrescos periódicos,
+manos que no caben en un recorte) y cambia de caja cuando las manos se acercan
+a su borde. Para cada frame con la misma cantidad de manos en ambos caminos
+calcula el error medio en píxeles de los landmarks respecto a la referencia, y
+lo informa por separado para los frames justo después de un cambio de entrada
+y para el resto, junto con las manos perdidas tras un cambio.
+
+Con `--single-model` un único modelo recibe recortes y frames completos (el
+comportamiento anterior a `RoiHands`), para comparar.
+
+Uso:
+    python -m benchmarks.roi_continuity --source manos.mp4
+    python -m benchmarks.roi_continuity --source 'frames/*.png' --single-model
+
+El proceso termina con código 1 si el p99 del error tras un cambio supera
+`--tolerance` píxeles o si tras un cambio se pierde alguna mano.
+"""
+import argparse
+import sys
+import numpy as np
+
+from src.frame_buffers import FramePreprocessor
+from src.frame_sources import open_source
+from src.landmarks import landmarks_to_array
+from src.roi import RoiHands, RoiTracker
+from src.startup import create_hands_model
+from config.settings import (
+    MAX_NUM_HANDS,
+    MIN_DETECTION_CONFIDENCE,
+    MIN_TRACKING_CONFIDENCE,
+    ROI_MARGIN,
+    ROI_MAX_SIDE,
+    ROI_FULL_FRAME_INTERVAL
+)
+
+
+class _SingleModel:
+    """Un solo modelo para recortes y frames completos, con la interfaz de `RoiHands`."""
+
+    def __init__(self, hands):
+        self.hands = hands
+
+    def process(self, image, box=None, frame_shape=None):
+        return self.hands.process(image)
+
+    def close(self):
+        self.hands.close()
+
+
+def _hand_arrays(results):
+    """Landmarks de cada mano como arreglos `(21, 3)`, o lista vacía."""
+    if not results.multi_hand_landmarks:
+        return []
+    return [landmarks_to_array(hand) for hand in results.multi_hand_landmarks]
+
+
+def _frame_error(reference, hands, width, height):
+    """Error medio en píxeles emparejando cada mano con la de referencia más cercana (por la muñeca)."""
+    scale = np.array([width, height], dtype=np.float64)
+    errors = []
+    for hand in hands:
+        ref = min(reference, key=lambda r: np.linalg.norm((r[0, :2] - hand[0, :2]) * scale))
+        errors.append(np.linalg.norm((ref[:, :2] - hand[:, :2]) * scale, axis=1).mean())
+    return float(np.mean(errors))
+
+
+def run(source, single_model=False, max_frames=None):
+    """
+    Devuelve (errores tras un cambio, errores estables, manos perdidas tras un
+    cambio, cambios de entrada).
+    """
+    def create():
+        return create_hands_model(MAX_NUM_HANDS, MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE)
+
+    reference = create()
+    hands = _SingleModel(create()) if single_model else RoiHands(create(), create())
+    roi = RoiTracker(margin=ROI_MARGIN, max_side=ROI_MAX_SIDE, full_frame_interval=ROI_FULL_FRAME_INTERVAL)
+    frames = FramePreprocessor()
+    after_switch, stable = [], []
+    lost = 0
+    switches = 0
+    previous_box = None
+    count = 0
+    try:
+        while max_frames is None or count < max_frames:
+            success, frame, _ = source.read()
+            if not success:
+                break
+            count += 1
+            image = frames.model_input(frame)
+            image.flags.writeable = False
+            ref_hands = _hand_arrays(reference.process(image))
+
+            model_input, box = roi.prepare(image)
+            results = hands.process(model_input, box, image.shape)
+            roi.finish(results, box, image.shape)
+            roi_hands = _hand_arrays(results)
+            switched = count > 1 and box != previous_box
+            previous_box = box
+            image.flags.writeable = True
+
+            if switched:
+                switches += 1
+                if len(roi_hands) < len(ref_hands):
+                    lost += 1
+            if ref_hands and len(roi_hands) == len(ref_hands):
+                height, width = image.shape[:2]
+                error = _frame_error(ref_hands, roi_hands, width, height)
+                (after_switch if switched else stable).append(error)
+    finally:
+        reference.close()
+        hands.close()
+    return after_switch, stable, lost, switches
+
+
+def _describe(name, errors):
+    if not errors:
+        print(f"{name:22} sin frames comparables")
+        return
+    print(f"{name:22} {len(errors):6d} frames  p50 {np.percentile(errors, 50):6.2f} px  "
+          f"p99 {np.percentile(errors, 99):6.2f} px  máx {max(errors):6.2f} px")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Continuidad de landmarks con región de interés.")
+    parser.add_argument("--source", required=True, help="video, carpeta o patrón de imágenes con manos")
+    parser.add_argument("--frames", type=int, help="máximo de frames a procesar")
+    parser.add_argument("--single-model", action="store_true",
+                        help="un solo modelo para recortes y frames completos (comportamiento anterior)")
+    parser.add_argument("--tolerance", type=float, default=10.0,
+                        help="p99 máximo del error tras un cambio de entrada, en píxeles")
+    args = parser.parse_args(argv)
+
+    source = open_source(args.source, realtime=False)
+    if not source.isOpened():
+        print(f"No se pudo abrir {args.source!r}.")
+        return 1
+    try:
+        after_switch, stable, lost, switches = run(source, args.single_model, args.frames)
+    finally:
+        source.release()
+
+    print(f"cambios de entrada: {switches}, manos perdidas tras un cambio: {lost}")
+    _describe("tras un cambio", after_switch)
+    _describe("estables", stable)
+    if lost or (after_switch and np.percentile(after_switch, 99) > args.tolerance):
+        print("\nDISCONTINUIDAD tras los cambios de entrada.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
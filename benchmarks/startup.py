@@ -0,0 +1,158 @@
+"""
+Tiempo de arranque.
+
+Mide en procesos nuevos (sin módulos ya cargados) el tiempo de importar los
+módulos de entrada y si alguno carga MediaPipe de forma anticipada. Con
+`--camera` mide además el arranque completo de `GestureController` hasta el
+primer frame procesado, desglosado por fases (cámara abierta, backends y modelo
+listos, primer frame); la fuente puede ser un índice de cámara o un video.
+
+Uso:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --camera 0
+    python -m benchmarks.startup --camera prueba.mp4 --repeat 3
+    python -m benchmarks.startup --save startup.json
+    python -m benchmarks.startup --compare startup.json --tolerance 0.25
+
+Con `--compare`, el proceso termina con código 1 si alguna medida empeora más
+que la tolerancia respecto a la línea base.
+"""
+import argparse
+import json
+import subprocess
+import sys
+import numpy as np
+
+# Módulos de entrada cuyo tiempo de importación se mide
+IMPORTED_MODULES = (
+    "src.gesture_controller",
+    "src.session_replay",
+    "src.gesture_handlers",
+    "src.hand_recognition",
+)
+
+# Diferencias menores que esta (ms) no cuentan como regresión
+MIN_REGRESSION_MS = 5.0
+
+_IMPORT_CHILD = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"ms": 1000 * (time.perf_counter() - start), "mediapipe": "mediapipe" in sys.modules}}))
+"""
+
+_CONTROLLER_CHILD = """
+import time
+origin = time.perf_counter()
+import json, threading
+from src.gesture_controller import GestureController
+from src.gesture_handlers import Controller
+from src.system_backends import recording_backends
+
+gc = GestureController(camera_index={camera!r}, headless=True, pipeline=False,
+                       controller=Controller(backends=recording_backends(record=False)),
+                       startup_origin=origin)
+
+def stop_after_first_frame():
+    while "first_frame" not in gc.startup.phases:
+        time.sleep(0.001)
+    gc.stop()
+
+threading.Thread(target=stop_after_first_frame, daemon=True).start()
+gc.start()
+print(json.dumps({{name: 1000 * t for name, t in gc.startup.phases.items()}}))
+"""
+
+
+def _run_child(code, timeout):
+    """Ejecuta `code` en un intérprete nuevo y devuelve el JSON de su última línea."""
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         timeout=timeout, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def measure_imports(modules=IMPORTED_MODULES, repeat=5, timeout=120):
+    """Tiempo mediano (ms) de importar cada módulo en un proceso nuevo."""
+    results = []
+    for module in modules:
+        runs = [_run_child(_IMPORT_CHILD.format(module=module), timeout) for _ in range(repeat)]
+        results.append({
+            "name": f"import {module}",
+            "ms": float(np.median([r["ms"] for r in runs])),
+            "mediapipe": runs[0]["mediapipe"],
+        })
+    return results
+
+
+def measure_controller(camera, repeat=3, timeout=120):
+    """Tiempo mediano (ms) desde el inicio del proceso hasta cada fase del arranque."""
+    runs = [_run_child(_CONTROLLER_CHILD.format(camera=camera), timeout) for _ in range(repeat)]
+    phases = [name for name in runs[0] if all(name in r for r in runs)]
+    return [{"name": f"arranque {name}", "ms": float(np.median([r[name] for r in runs]))}
+            for name in phases]
+
+
+def compare(current, baseline, tolerance):
+    """
+    Compara los resultados con una línea base.
+
+    Returns
+    -------
+    list(str)
+        Descripción de cada regresión encontrada.
+    """
+    base = {r["name"]: r for r in baseline}
+    regressions = []
+    for result in current:
+        ref = base.get(result["name"])
+        if ref is None:
+            continue
+        if result["ms"] > ref["ms"] * (1 + tolerance) and result["ms"] - ref["ms"] > MIN_REGRESSION_MS:
+            regressions.append(f"{result['name']}: {result['ms']:.0f} ms (base {ref['ms']:.0f} ms)")
+        if result.get("mediapipe") and not ref.get("mediapipe"):
+            regressions.append(f"{result['name']}: ahora importa MediaPipe")
+    return regressions
+
+
+def print_table(results):
+    """Imprime los resultados en forma de tabla."""
+    print(f"{'medida':42} {'ms':>9}")
+    for r in results:
+        note = "  (carga MediaPipe)" if r.get("mediapipe") else ""
+        print(f"{r['name']:42} {r['ms']:9.1f}{note}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tiempo de arranque.")
+    parser.add_argument("--camera", metavar="FUENTE",
+                        help="índice de cámara o video para medir el arranque hasta el primer frame")
+    parser.add_argument("--repeat", type=int, default=5, help="procesos medidos por medida")
+    parser.add_argument("--save", metavar="JSON", help="guarda los resultados como línea base")
+    parser.add_argument("--compare", metavar="JSON", help="compara contra una línea base guardada")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="empeoramiento relativo permitido frente a la línea base")
+    args = parser.parse_args(argv)
+
+    results = measure_imports(repeat=args.repeat)
+    if args.camera is not None:
+        camera = int(args.camera) if args.camera.isdigit() else args.camera
+        results += measure_controller(camera, repeat=args.repeat)
+    print_table(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nREGRESIONES respecto a la línea base:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\nSin regresiones respecto a la línea base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
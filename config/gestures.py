@@ -0,0 +1,60 @@
+# Reglas de reconocimiento de gestos y acciones asociadas
+#
+# Máscara de dedos levantados: Pulgar (16), Índice (8), Medio (4), Anular (2), Meñique (1).
+# Las máscaras sin regla se reconocen como el gesto con ese mismo valor en `Gest`.
+
+# Reglas de gesto por máscara de dedos
+GESTURE_RULES = [
+    # Pinza índice-pulgar con los demás dedos levantados
+    {"fingers": [0b00111, 0b01111], "rule": "pinch", "gesture": "PINCH_MAJOR", "max_dist": 0.05},
+    # Índice, medio y anular levantados
+    {"fingers": [0b01110], "rule": "fixed", "gesture": "THREE_FINGER_SCROLL"},
+    # Índice y medio levantados: V separada, juntos o solo el medio
+    {"fingers": [0b01100], "rule": "v_shape", "spread_ratio": 1.7, "closed_dz": 0.1,
+     "open": "V_GEST", "closed": "TWO_FINGER_CLOSED", "other": "MID"},
+]
+
+# Acción ejecutada por cada gesto de la mano principal (ver `HANDLER_TYPES` en src/gesture_handlers.py)
+GESTURE_BINDINGS = {
+    "V_GEST": "move",  # Mover el cursor y habilitar los clics
+    "FIST": "drag",  # Arrastrar con el botón izquierdo presionado
+    "MID": "left_click",  # Clic izquierdo tras una V
+    "INDEX": "right_click",  # Clic derecho tras una V
+    "TWO_FINGER_CLOSED": "double_click",  # Doble clic tras una V
+    "THREE_FINGER_SCROLL": "scroll",  # Scroll vertical u horizontal
+    "PINCH_MAJOR": "levels",  # Brillo (horizontal) o volumen (vertical)
+}
+
+# Tiempo (s) que un gesto debe mantenerse, ponderado por la confianza de la
+# detección, antes de confirmarse. Los clics usan tiempos cortos para responder rápido.
+GESTURE_DWELL = {
+    "MID": 0.05,
+    "INDEX": 0.05,
+    "TWO_FINGER_CLOSED": 0.08,
+    "V_GEST": 0.1,
+    "FIST": 0.15,
+    "PINCH_MAJOR": 0.15,
+    "THREE_FINGER_SCROLL": 0.15,
+    "PALM": 0.15,
+}
+GESTURE_DWELL_DEFAULT = 0.25  # Gestos sin valor en GESTURE_DWELL (máscaras ambiguas)
+GESTURE_DWELL_MAX_STEP = 0.1  # Evidencia máxima (s) que aporta un solo frame
+GESTURE_MIN_CONFIDENCE = 0.25  # Peso mínimo de un frame con confianza baja
+# Segundos con la pinza estable entre dos pasos de volumen, brillo o scroll.
+# 0.33 equivale a los 5 frames estables del original a 15 FPS.
+PINCH_STEP_INTERVAL = 0.33
+
+# Control de la pinza y del scroll con tres dedos.
+# 'continuous': en cada frame, a un ritmo proporcional al desplazamiento de la mano desde el inicio del gesto.
+# 'step': un paso fijo (120 de scroll o pinchlv/50 de nivel) cada PINCH_STEP_INTERVAL con la pinza estable.
+PINCH_MODE = "step"
+PINCH_DEADZONE = 0.3  # Desplazamiento sin efecto alrededor del inicio (en décimas del ancho o alto de la imagen)
+PINCH_VELOCITY_LEAD = 0.3  # Segundos de velocidad de la mano hacia afuera sumados al desplazamiento
+PINCH_SCROLL_RATE = 2400  # Unidades de scroll por segundo por décima de desplazamiento (120 = una muesca)
+PINCH_SCROLL_QUANTUM = 40  # Scroll mínimo enviado al sistema; el resto se acumula para el frame siguiente
+PINCH_LEVEL_RATE = 0.5  # Fracción de volumen o brillo por segundo por décima de desplazamiento
+PINCH_LEVEL_QUANTUM = 0.01  # Cambio mínimo de volumen o brillo enviado al sistema
+
+# Modelo entrenado (.npz) que reemplaza a GESTURE_RULES, ver benchmarks/learned_classifier.py.
+# None usa las reglas.
+GESTURE_CLASSIFIER_PATH = None
@@ -0,0 +1,84 @@
+# Configuración general del sistema de control por gestos
+
+# Cámara
+CAMERA_INDEX = 0  # Índice de la cámara utilizada por OpenCV
+TARGET_FPS = 15  # Frames por segundo procesados por el bucle principal con manos a la vista
+IDLE_FPS = 3  # Frames por segundo cuando no hay manos a la vista
+IDLE_AFTER = 2.0  # Segundos sin manos antes de pasar a IDLE_FPS
+IDLE_CAPTURE_SIZE = None  # Resolución (ancho, alto) de captura en reposo, None la mantiene
+CAPTURE_TIMEOUT = 1.0  # Segundos máximos de espera por un frame nuevo
+FRAME_SOURCE = None  # Video, carpeta o patrón de imágenes ('frames/*.png') en lugar de la cámara; None usa CAMERA_INDEX
+SOURCE_FAST = False  # Procesar videos e imágenes tan rápido como sea posible, sin ritmo de FPS ni descartar frames
+SOURCE_FPS = 30  # Frames por segundo de una secuencia de imágenes (los videos usan los suyos)
+SOURCE_READ_AHEAD = 8  # Frames decodificados por adelantado de un video o secuencia de imágenes
+SOURCE_DECODE_WORKERS = 4  # Hilos que decodifican una secuencia de imágenes
+
+# MediaPipe
+MIN_DETECTION_CONFIDENCE = 0.5  # Confianza mínima para detectar una mano
+MIN_TRACKING_CONFIDENCE = 0.5  # Confianza mínima para seguir una mano
+MAX_NUM_HANDS = 2  # Número máximo de manos detectadas
+
+# Perfiles de rendimiento: resolución de captura, FPS objetivo, manos, complejidad del modelo y dibujo de landmarks
+PERFORMANCE_PROFILES = {
+    "low_power": {"capture_size": (320, 240), "target_fps": 8, "max_num_hands": 1,
+                  "model_complexity": 0, "overlay": False},
+    "balanced": {"capture_size": (640, 480), "target_fps": 15, "max_num_hands": 2,
+                 "model_complexity": 0, "overlay": True},
+    "low_latency": {"capture_size": (640, 480), "target_fps": 30, "max_num_hands": 2,
+                    "model_complexity": 1, "overlay": True},
+}
+PROFILE_LEVELS = ("low_power", "balanced", "low_latency")  # Orden de menor a mayor costo para el regulador
+PERFORMANCE_PROFILE = None  # Perfil inicial; None usa TARGET_FPS, MAX_NUM_HANDS y la resolución de la cámara
+CPU_BUDGET = None  # Fracción de un núcleo que puede usar el proceso (p. ej. 0.5); None desactiva el regulador
+LATENCY_BUDGET = 0.1  # Segundos máximos de latencia media entre la captura y el fin del procesamiento
+GOVERNOR_INTERVAL = 2.0  # Segundos de medida entre decisiones del regulador
+GOVERNOR_HEADROOM = 0.6  # Se sube de nivel solo si el uso está por debajo de esta fracción del presupuesto
+GOVERNOR_RAISE_AFTER = 3  # Intervalos holgados seguidos necesarios para subir de nivel
+
+# Pipeline multiproceso (captura e inferencia en procesos separados)
+PIPELINE_ENABLED = False  # Ejecutar captura y MediaPipe en procesos aparte
+PIPELINE_WORKERS = 1  # Procesos de inferencia
+PIPELINE_SLOTS = 6  # Slots del anillo de memoria compartida para los frames
+PIPELINE_MAX_FRAME_SIZE = (1920, 1080)  # (ancho, alto) máximo de un frame en memoria compartida
+PIPELINE_READ_FAILURE_TIMEOUT = 5.0  # Segundos que la cámara puede fallar al leer antes de detener el pipeline
+
+# Región de interés (recorte de la entrada de MediaPipe alrededor de las manos)
+ROI_ENABLED = False  # Recortar la entrada usando los landmarks del frame anterior
+ROI_MARGIN = 0.3  # Margen alrededor de las manos, como fracción de su tamaño
+ROI_MAX_SIDE = 320  # Lado máximo en píxeles del recorte enviado al modelo
+ROI_FULL_FRAME_INTERVAL = 30  # Cada cuántos frames se procesa el frame completo
+
+# Seguimiento de landmarks con flujo óptico entre ejecuciones del modelo
+FLOW_DETECT_EVERY = 1  # MediaPipe se ejecuta cada N frames y entre medias los landmarks se siguen con flujo óptico (1 lo desactiva)
+FLOW_SCALE = 0.5  # Escala de la imagen en gris sobre la que se calcula el flujo
+FLOW_WIN_SIZE = 21  # Lado en píxeles (de la imagen reducida) de la ventana de Lucas-Kanade
+FLOW_PYRAMID_LEVELS = 2  # Niveles de la pirámide de Lucas-Kanade, además de la imagen reducida
+FLOW_MAX_FB_ERROR = 1.5  # Error máximo ida y vuelta (px de la imagen reducida) de un punto bien seguido
+FLOW_MIN_CONFIDENCE = 0.7  # Fracción mínima de puntos bien seguidos por mano; por debajo se vuelve a detectar
+FLOW_MAX_SCALE_CHANGE = 0.25  # Cambio relativo máximo del tamaño de la palma desde la última detección
+FLOW_MAX_INTENSITY_CHANGE = 25  # Cambio mediano máximo del gris bajo los puntos de una mano desde la última detección
+
+# Interfaz
+WINDOW_NAME = "Gesture Controller"  # Título de la ventana de vista previa
+HEADLESS = False  # Sin ventana ni dibujo de landmarks (kioscos, servicios)
+PREVIEW_EVERY_N = 1  # Dibujar la vista previa solo cada N frames procesados
+PREVIEW_MAX_FPS = None  # Límite de FPS de la vista previa (None sin límite)
+
+# Métricas
+METRICS_ENABLED = False  # Temporizadores por etapa y contadores del bucle principal
+METRICS_LOG_INTERVAL = 10.0  # Segundos entre líneas de log con las métricas
+METRICS_PORT = None  # Puerto local para consultar las métricas por HTTP (None lo desactiva)
+
+# Flujo de eventos para otras aplicaciones
+EVENTS_SOCKET = None  # Ruta del socket Unix donde publicar gestos, cursor y pinza (None lo desactiva)
+EVENTS_ONLY = False  # Solo publicar eventos, sin mover el cursor real ni cambiar volumen o brillo
+
+# Cursor
+CURSOR_FILTER = "one_euro"  # Filtro del cursor: 'one_euro', 'kalman' o 'legacy' (razón por tramos original)
+CURSOR_GAIN = 1.5  # Píxeles de cursor por píxel de movimiento de la mano (no aplica a 'legacy')
+CURSOR_PREDICTION_LEAD = 0.03  # Segundos extra de predicción por la latencia de la acción y del sistema
+CURSOR_MOVE_DURATION = 0.0  # Duración de cada movimiento del cursor en segundos (0 lo mueve al instante)
+ONE_EURO_MIN_CUTOFF = 0.5  # Frecuencia de corte mínima (Hz): menor = menos temblor en reposo
+ONE_EURO_BETA = 0.01  # Aumento del corte con la velocidad: mayor = menos retardo al moverse rápido
+KALMAN_PROCESS_NOISE = 5e4  # Ruido de aceleración (px²/s³): mayor = sigue antes los cambios
+KALMAN_MEASUREMENT_NOISE = 25.0  # Varianza de la medida (px²): mayor = más suavizado
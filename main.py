@@ -1,5 +1,87 @@
-from src.gesture_controller import GestureController
+import time
+
+# Origen de la medida del arranque, antes de cualquier otra importación
+STARTUP_ORIGIN = time.perf_counter()
+
+import argparse
+import logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Control por gestos basado en visión artificial.")
+    parser.add_argument("--record", metavar="ARCHIVO",
+                        help="graba los landmarks de cada frame en un archivo de sesión")
+    parser.add_argument("--replay", metavar="ARCHIVO", nargs="+",
+                        help="reproduce una o varias sesiones grabadas sin cámara ni modelo")
+    parser.add_argument("--jobs", type=int, metavar="N",
+                        help="con varias sesiones en --replay, cuántas reproducir a la vez")
+    parser.add_argument("--realtime", action="store_true",
+                        help="con --replay, respeta los tiempos originales de la sesión")
+    parser.add_argument("--metrics", action="store_true", default=None,
+                        help="registra tiempos por etapa y los escribe periódicamente en el log")
+    parser.add_argument("--metrics-port", type=int, metavar="PUERTO",
+                        help="publica las métricas en http://127.0.0.1:PUERTO/metrics")
+    parser.add_argument("--headless", action="store_true", default=None,
+                        help="sin ventana ni dibujo de landmarks; se sale con Ctrl+C")
+    parser.add_argument("--preview-every", type=int, metavar="N",
+                        help="dibuja la vista previa solo cada N frames")
+    parser.add_argument("--preview-fps", type=float, metavar="FPS",
+                        help="limita los FPS de la vista previa")
+    parser.add_argument("--roi", action="store_true", default=None,
+                        help="recorta la entrada del modelo alrededor de las manos detectadas")
+    parser.add_argument("--detect-every", type=int, metavar="N",
+                        help="ejecuta MediaPipe cada N frames y sigue las manos con flujo óptico entre medias")
+    parser.add_argument("--pinch-mode", choices=("step", "continuous"),
+                        help="scroll, volumen y brillo en pasos fijos o a un ritmo proporcional al desplazamiento")
+    parser.add_argument("--classifier", metavar="MODELO",
+                        help="usa un modelo de gestos entrenado en lugar de las reglas")
+    parser.add_argument("--source", metavar="FUENTE",
+                        help="video, carpeta o patrón de imágenes (o índice de cámara) en lugar de la cámara")
+    parser.add_argument("--fast", action="store_true", default=None,
+                        help="con --source de archivo, procesa tan rápido como sea posible")
+    parser.add_argument("--pipeline", action="store_true", default=None,
+                        help="ejecuta la captura y MediaPipe en procesos separados")
+    parser.add_argument("--profile", metavar="PERFIL",
+                        help="perfil de rendimiento inicial (low_power, balanced, low_latency)")
+    parser.add_argument("--events", metavar="SOCKET",
+                        help="publica gestos, cursor y pinza en un socket Unix para otras aplicaciones")
+    parser.add_argument("--events-only", action="store_true", default=None,
+                        help="con --events, no mueve el cursor real ni cambia volumen o brillo")
+    parser.add_argument("--cpu-budget", type=float, metavar="FRACCIÓN",
+                        help="fracción de un núcleo que puede usar el proceso; activa el cambio automático de perfil")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    gc = GestureController()
-    gc.start()
\ No newline at end of file
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+    if args.replay:
+        from src.session_replay import replay_many
+        from src.learned_classifier import load_classifier
+        classifier = load_classifier(args.classifier) if args.classifier else None
+        reports = replay_many(args.replay, workers=args.jobs, realtime=args.realtime, classifier=classifier)
+        for path, report in zip(args.replay, reports):
+            print(f"{path}: {report.summary()}")
+    else:
+        from src.gesture_controller import GestureController
+        gc = GestureController(
+            record_path=args.record,
+            metrics=args.metrics,
+            metrics_port=args.metrics_port,
+            headless=args.headless,
+            preview_every_n=args.preview_every,
+            preview_max_fps=args.preview_fps,
+            roi=args.roi,
+            pipeline=args.pipeline,
+            classifier_path=args.classifier,
+            startup_origin=STARTUP_ORIGIN,
+            profile=args.profile,
+            cpu_budget=args.cpu_budget,
+            events_path=args.events,
+            events_only=args.events_only,
+            source=args.source,
+            fast=args.fast,
+            detect_every=args.detect_every,
+            pinch_mode=args.pinch_mode
+        )
+        gc.start()
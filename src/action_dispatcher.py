@@ -0,0 +1,126 @@
+import threading
+from collections import deque
+
+
+class ActionDispatcher:
+    """
+    Ejecuta las acciones sobre el sistema operativo (cursor, clics, scroll, volumen,
+    brillo) en un hilo separado del bucle de visión.
+
+    Las acciones se encolan con `submit` y el hilo las ejecuta en orden. Una acción
+    continua (`coalesce=True`) reemplaza a la última acción pendiente si tiene la
+    misma clave, de modo que varios movimientos consecutivos del cursor se reducen
+    al destino más reciente. Solo deben fusionarse acciones que lleven un estado
+    absoluto o que apliquen lo acumulado hasta el momento (como los pasos de
+    scroll, volumen y brillo del `Controller`); las acciones discretas (clics)
+    nunca se fusionan.
+
+    Si el hilo no se ha iniciado, `submit` ejecuta la acción de inmediato en el hilo
+    que la llama.
+
+    Atributos
+    ----------
+    maxsize : int
+        número máximo de acciones pendientes.
+    executed : int
+        número de acciones ejecutadas.
+    coalesced : int
+        número de acciones reemplazadas por una más reciente de la misma clave.
+    dropped : int
+        número de acciones descartadas por tener la cola llena.
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.executed = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self._queue = deque()  # Elementos [clave, función, argumentos, fusionable]
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    @property
+    def running(self):
+        """True mientras el hilo de despacho esté activo."""
+        return self._running
+
+    def start(self):
+        """Inicia el hilo de despacho."""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ActionDispatcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        """Ejecuta las acciones pendientes y detiene el hilo de despacho."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def pending(self):
+        """Devuelve el número de acciones en espera."""
+        with self._cond:
+            return len(self._queue)
+
+    def submit(self, key, func, *args, coalesce=False):
+        """
+        Encola una acción para ejecutarla en el hilo de despacho.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifica el tipo de acción para fusionar acciones consecutivas.
+        func : callable
+            Función que realiza la acción sobre el sistema.
+        *args :
+            Argumentos para `func`.
+        coalesce : bool, optional
+            Si es True, la acción reemplaza a la última pendiente con la misma clave.
+        """
+        if not self._running:
+            self._execute(func, args)
+            return
+
+        with self._cond:
+            if coalesce and self._queue and self._queue[-1][0] == key and self._queue[-1][3]:
+                self._queue[-1] = [key, func, args, True]
+                self.coalesced += 1
+                return
+
+            if len(self._queue) >= self.maxsize:
+                # Se sacrifica la acción continua más antigua; los clics se conservan
+                for idx, item in enumerate(self._queue):
+                    if item[3]:
+                        del self._queue[idx]
+                        break
+                else:
+                    self.dropped += 1
+                    return
+                self.dropped += 1
+
+            self._queue.append([key, func, args, coalesce])
+            self._cond.notify()
+
+    def _run(self):
+        """Bucle del hilo de despacho."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or not self._running)
+                if not self._queue:
+                    return
+                _, func, args, _ = self._queue.popleft()
+            self._execute(func, args)
+
+    def _execute(self, func, args):
+        """Ejecuta una acción sin dejar que un error detenga el despacho."""
+        try:
+            func(*args)
+        except Exception as exc:
+            print(f"Error al ejecutar la acción {getattr(func, '__name__', func)}: {exc}")
+        self.executed += 1
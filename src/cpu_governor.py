@@ -0,0 +1,214 @@
+import time
+from config.settings import (
+    PERFORMANCE_PROFILES,
+    PROFILE_LEVELS,
+    LATENCY_BUDGET,
+    GOVERNOR_INTERVAL,
+    GOVERNOR_HEADROOM,
+    GOVERNOR_RAISE_AFTER
+)
+
+
+class PerformanceProfile:
+    """
+    Conjunto de parámetros que fijan el costo del bucle de visión.
+
+    Atributos
+    ----------
+    name : str
+        nombre del perfil en `PERFORMANCE_PROFILES`.
+    capture_size : tuple(int, int)
+        (ancho, alto) de captura, None para mantener la resolución de la cámara.
+    target_fps : float
+        frames por segundo procesados con manos a la vista.
+    max_num_hands : int
+        número máximo de manos que detecta MediaPipe.
+    model_complexity : int
+        complejidad del modelo de landmarks de MediaPipe (0 ligero, 1 completo).
+    overlay : bool
+        True para dibujar landmarks y gestos en la vista previa.
+    """
+
+    __slots__ = ("name", "capture_size", "target_fps", "max_num_hands", "model_complexity", "overlay")
+
+    def __init__(self, name, capture_size=None, target_fps=15, max_num_hands=2, model_complexity=1,
+                 overlay=True):
+        self.name = name
+        self.capture_size = tuple(capture_size) if capture_size is not None else None
+        self.target_fps = target_fps
+        self.max_num_hands = max_num_hands
+        self.model_complexity = model_complexity
+        self.overlay = overlay
+
+    @property
+    def model_params(self):
+        """Parámetros que obligan a crear otro modelo de MediaPipe si cambian."""
+        return self.max_num_hands, self.model_complexity
+
+    def __repr__(self):
+        return f"PerformanceProfile({self.name!r})"
+
+
+def load_profiles(profiles=None, levels=None):
+    """
+    Crea los perfiles de la configuración en orden de menor a mayor costo.
+
+    Parameters
+    ----------
+    profiles : dict, optional
+        {nombre: parámetros}. Por defecto `PERFORMANCE_PROFILES`.
+    levels : sequence(str), optional
+        Nombres en orden de costo. Por defecto `PROFILE_LEVELS`.
+
+    Returns
+    -------
+    list(PerformanceProfile)
+    """
+    profiles = PERFORMANCE_PROFILES if profiles is None else profiles
+    levels = PROFILE_LEVELS if levels is None else levels
+    result = []
+    for name in levels:
+        try:
+            params = profiles[name]
+        except KeyError:
+            raise ValueError(f"Perfil de rendimiento desconocido: {name!r} (disponibles: {', '.join(profiles)})")
+        result.append(PerformanceProfile(name, **params))
+    return result
+
+
+def get_profile(name, profiles=None, levels=None):
+    """Devuelve el perfil `name` de la configuración."""
+    for profile in load_profiles(profiles, levels):
+        if profile.name == name:
+            return profile
+    raise ValueError(f"Perfil de rendimiento desconocido: {name!r}")
+
+
+class CpuGovernor:
+    """
+    Regula el perfil de rendimiento para mantener el proceso dentro de un
+    presupuesto de CPU y de latencia.
+
+    Cada `interval` segundos compara el tiempo de CPU del proceso
+    (`time.process_time`, todos sus hilos) con el tiempo transcurrido y la
+    latencia media de los frames con los presupuestos. Si alguno se supera baja
+    un nivel; si ambos quedan por debajo de `headroom` durante `raise_after`
+    intervalos seguidos sube uno. Cada vez que se abandona un nivel por exceso,
+    volver a él exige el doble de intervalos holgados (hasta 8 veces), para no
+    oscilar entre dos niveles en equipos justo en el límite.
+
+    Atributos
+    ----------
+    levels : list(PerformanceProfile)
+        perfiles de menor a mayor costo.
+    level : int
+        índice del perfil actual en `levels`.
+    cpu_budget : float
+        fracción de un núcleo que puede usar el proceso.
+    latency_budget : float
+        segundos máximos de latencia media por frame.
+    cpu_usage : float
+        uso de CPU medido en el último intervalo, None antes del primero.
+    latency : float
+        latencia media medida en el último intervalo, None antes del primero.
+    changes : int
+        número de cambios de perfil.
+    """
+
+    def __init__(self, levels, cpu_budget, latency_budget=LATENCY_BUDGET, interval=GOVERNOR_INTERVAL,
+                 headroom=GOVERNOR_HEADROOM, raise_after=GOVERNOR_RAISE_AFTER, initial=None,
+                 clock=time.monotonic, cpu_clock=time.process_time):
+        """
+        Parameters
+        ----------
+        levels : list(PerformanceProfile)
+            Perfiles de menor a mayor costo.
+        cpu_budget : float
+            Fracción de un núcleo que puede usar el proceso (1.0 = un núcleo entero).
+        initial : str, optional
+            Nombre del perfil inicial. Por defecto el nivel intermedio.
+        clock, cpu_clock : callable, optional
+            Relojes de tiempo transcurrido y de CPU del proceso.
+        """
+        if not levels:
+            raise ValueError("El regulador necesita al menos un perfil")
+        self.levels = list(levels)
+        self.cpu_budget = cpu_budget
+        self.latency_budget = latency_budget
+        self.interval = interval
+        self.headroom = headroom
+        self.raise_after = raise_after
+        names = [profile.name for profile in self.levels]
+        self.level = names.index(initial) if initial is not None else (len(self.levels) - 1) // 2
+        self.cpu_usage = None
+        self.latency = None
+        self.changes = 0
+        self._clock = clock
+        self._cpu_clock = cpu_clock
+        self._penalty = [1] * len(self.levels)
+        self._good_intervals = 0
+        self.reset()
+
+    @property
+    def profile(self):
+        """Perfil actual."""
+        return self.levels[self.level]
+
+    def reset(self):
+        """
+        Empieza un intervalo de medida nuevo, descartando el actual (tras un
+        cambio de perfil o al salir del reposo, cuando la carga no es comparable).
+        """
+        self._start = self._clock()
+        self._cpu_start = self._cpu_clock()
+        self._latency_sum = 0.0
+        self._frames = 0
+
+    def update(self, latency):
+        """
+        Registra un frame procesado y decide si hay que cambiar de perfil.
+
+        Parameters
+        ----------
+        latency : float
+            Segundos entre la captura del frame y el fin de su procesamiento.
+
+        Returns
+        -------
+        PerformanceProfile
+            El perfil nuevo si cambió en esta llamada, None en caso contrario.
+        """
+        self._latency_sum += latency
+        self._frames += 1
+        now = self._clock()
+        elapsed = now - self._start
+        if elapsed < self.interval:
+            return None
+
+        self.cpu_usage = (self._cpu_clock() - self._cpu_start) / elapsed
+        self.latency = self._latency_sum / self._frames
+        self.reset()
+
+        over = self.cpu_usage > self.cpu_budget or self.latency > self.latency_budget
+        if over:
+            self._good_intervals = 0
+            if self.level == 0:
+                return None
+            self._penalty[self.level] = min(2 * self._penalty[self.level], 8)
+            return self._set_level(self.level - 1)
+
+        relaxed = (self.cpu_usage < self.cpu_budget * self.headroom
+                   and self.latency < self.latency_budget * self.headroom)
+        if not relaxed or self.level == len(self.levels) - 1:
+            self._good_intervals = 0
+            return None
+        self._good_intervals += 1
+        if self._good_intervals < self.raise_after * self._penalty[self.level + 1]:
+            return None
+        self._good_intervals = 0
+        return self._set_level(self.level + 1)
+
+    def _set_level(self, level):
+        self.level = level
+        self.changes += 1
+        return self.profile
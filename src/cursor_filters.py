@@ -0,0 +1,325 @@
+import math
+import numpy as np
+
+
+class CursorFilter:
+    """
+    Interfaz de los filtros de cursor usados por `Controller.get_position`.
+
+    `update` recibe la posición de la mano en píxeles de pantalla y devuelve una
+    posición filtrada. `Controller` mueve el cursor según la diferencia entre dos
+    salidas consecutivas multiplicada por `gain`, por lo que la salida no necesita
+    coincidir con la posición absoluta del cursor.
+
+    Atributos
+    ----------
+    gain : float
+        factor aplicado al desplazamiento de la salida para mover el cursor.
+    """
+
+    gain = 1.0
+
+    def reset(self):
+        """Olvida el estado; se llama cuando la mano se pierde y vuelve a aparecer."""
+        raise NotImplementedError
+
+    def update(self, x, y, t, lead=0.0):
+        """
+        Filtra una nueva posición.
+
+        Parameters
+        ----------
+        x, y : float
+            Posición de la mano en píxeles de pantalla.
+        t : float
+            Instante de captura del frame, en segundos.
+        lead : float, optional
+            Segundos que se debe adelantar la predicción para compensar la
+            latencia del pipeline.
+
+        Returns
+        -------
+        tuple(float, float)
+        """
+        raise NotImplementedError
+
+
+class LegacyRatioFilter(CursorFilter):
+    """
+    Suavizado original de `get_position`: el desplazamiento de la mano se anula
+    por debajo de 5 px, se escala por 0.07·dist hasta 30 px y por 2.1 por encima.
+    No usa el tiempo ni predice.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._prev = None
+        self._out = (0.0, 0.0)
+
+    def update(self, x, y, t, lead=0.0):
+        if self._prev is None:
+            self._prev = (x, y)
+            self._out = (x, y)
+            return self._out
+        delta_x = x - self._prev[0]
+        delta_y = y - self._prev[1]
+        self._prev = (x, y)
+
+        distsq = delta_x**2 + delta_y**2
+        if distsq <= 25:
+            ratio = 0
+        elif distsq <= 900:
+            ratio = 0.07 * (distsq ** (1 / 2))
+        else:
+            ratio = 2.1
+        self._out = (self._out[0] + delta_x * ratio, self._out[1] + delta_y * ratio)
+        return self._out
+
+
+class _LowPass:
+    """Filtro exponencial de primer orden usado por `OneEuroFilter`."""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = None
+
+    def apply(self, value, alpha):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value = alpha * value + (1 - alpha) * self.value
+        return self.value
+
+
+def _alpha(cutoff, dt):
+    tau = 1.0 / (2 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilter(CursorFilter):
+    """
+    Filtro One Euro (Casiez et al., 2012) por eje.
+
+    La frecuencia de corte crece con la velocidad: a baja velocidad filtra
+    fuerte (menos temblor) y a alta velocidad casi no filtra (menos retardo).
+    La salida se extrapola `lead` segundos con la velocidad filtrada.
+
+    Atributos
+    ----------
+    min_cutoff : float
+        frecuencia de corte mínima (Hz); menor = menos temblor en reposo.
+    beta : float
+        aumento de la frecuencia de corte por unidad de velocidad; mayor = menos retardo.
+    d_cutoff : float
+        frecuencia de corte del filtro de la velocidad (Hz).
+    """
+
+    def __init__(self, min_cutoff=0.5, beta=0.01, d_cutoff=1.0, gain=1.5):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.gain = gain
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._x = [_LowPass(), _LowPass()]
+        self._dx = [_LowPass(), _LowPass()]
+
+    def update(self, x, y, t, lead=0.0):
+        if self._t is None:
+            self._t = t
+            for axis, value in enumerate((x, y)):
+                self._x[axis].apply(value, 1.0)
+                self._dx[axis].apply(0.0, 1.0)
+            return x, y
+        if t <= self._t:
+            # Mismo frame (o reloj no monótono): se repite la última salida, con
+            # el mismo adelanto que en un frame nuevo para que el cursor no retroceda
+            return tuple(self._x[axis].value + self._dx[axis].value * lead for axis in range(2))
+
+        dt = t - self._t
+        self._t = t
+        out = []
+        for axis, value in enumerate((x, y)):
+            lp, dlp = self._x[axis], self._dx[axis]
+            speed = dlp.apply((value - lp.value) / dt, _alpha(self.d_cutoff, dt))
+            cutoff = self.min_cutoff + self.beta * abs(speed)
+            filtered = lp.apply(value, _alpha(cutoff, dt))
+            out.append(filtered + speed * lead)
+        return out[0], out[1]
+
+
+class KalmanCVFilter(CursorFilter):
+    """
+    Filtro de Kalman de velocidad constante, independiente por eje, con estado
+    (posición, velocidad).
+
+    Atributos
+    ----------
+    process_noise : float
+        densidad espectral de la aceleración (px²/s³); mayor = sigue antes los cambios.
+    measurement_noise : float
+        varianza de la medida (px²); mayor = más suavizado.
+    """
+
+    def __init__(self, process_noise=5e4, measurement_noise=25.0, gain=1.5):
+        self.process_noise = process_noise
+        self.measurement_noise = measurement_noise
+        self.gain = gain
+        self.reset()
+
+    def reset(self):
+        self._t = None
+        self._state = np.zeros((2, 2))  # Por eje: [posición, velocidad]
+        self._cov = np.zeros((2, 2, 2))  # Por eje: covarianza 2x2
+
+    def update(self, x, y, t, lead=0.0):
+        z = (x, y)
+        if self._t is None:
+            self._t = t
+            for axis in range(2):
+                self._state[axis] = (z[axis], 0.0)
+                self._cov[axis] = ((self.measurement_noise, 0.0), (0.0, 1e6))
+            return x, y
+
+        if t <= self._t:
+            # Mismo frame (o reloj no monótono): se repite la última estimación,
+            # adelantada igual que en un frame nuevo
+            return tuple(p + v * lead for p, v in self._state)
+
+        dt = t - self._t
+        self._t = t
+        q = self.process_noise
+        q11 = q * dt ** 3 / 3
+        q12 = q * dt ** 2 / 2
+        q22 = q * dt
+        out = []
+        for axis in range(2):
+            p, v = self._state[axis]
+            (c11, c12), (_, c22) = self._cov[axis]
+            # Predicción
+            p = p + v * dt
+            c11, c12, c22 = (c11 + 2 * dt * c12 + dt * dt * c22 + q11,
+                             c12 + dt * c22 + q12,
+                             c22 + q22)
+            # Corrección con la medida de posición
+            s = c11 + self.measurement_noise
+            k1, k2 = c11 / s, c12 / s
+            residual = z[axis] - p
+            p += k1 * residual
+            v += k2 * residual
+            c11, c12, c22 = (1 - k1) * c11, (1 - k1) * c12, c22 - k2 * c12
+            self._state[axis] = (p, v)
+            self._cov[axis] = ((c11, c12), (c12, c22))
+            out.append(p + v * lead)
+        return out[0], out[1]
+
+
+FILTERS = {
+    "legacy": LegacyRatioFilter,
+    "one_euro": OneEuroFilter,
+    "kalman": KalmanCVFilter,
+}
+
+
+def make_filter(name, **params):
+    """
+    Crea un filtro de cursor por nombre: 'legacy', 'one_euro' o 'kalman'.
+
+    Parameters
+    ----------
+    name : str
+        Nombre del filtro.
+    **params :
+        Parámetros del constructor del filtro.
+    """
+    try:
+        cls = FILTERS[name]
+    except KeyError:
+        raise ValueError(f"Filtro de cursor desconocido: {name!r}. Opciones: {', '.join(FILTERS)}")
+    return cls(**params)
+
+
+def evaluate_filter(cursor_filter, times, xs, ys, lead=0.0, still_px=10.0, max_lag=10):
+    """
+    Mide el temblor y el retardo de un filtro sobre una traza de posiciones.
+
+    Parameters
+    ----------
+    cursor_filter : CursorFilter
+    times, xs, ys : array-like
+        Instantes (s) y posiciones de la mano en píxeles de pantalla. Un valor
+        NaN en `xs` indica un frame sin mano (se reinicia el filtro).
+    lead : float, optional
+        Predicción en segundos pasada a `update`.
+    still_px : float, optional
+        Desplazamiento máximo de la mano en ±5 frames para considerarla quieta.
+    max_lag : int, optional
+        Desfase máximo (frames) explorado al estimar el retardo.
+
+    Returns
+    -------
+    dict
+        jitter_px: RMS del movimiento del cursor por frame mientras la mano está quieta.
+        lag_ms: desfase entre la velocidad del cursor y la de la mano que maximiza
+        su correlación (negativo si el cursor se adelanta).
+        correlation: correlación de las velocidades con ese desfase.
+    """
+    times = np.asarray(times, dtype=np.float64)
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n = len(times)
+    out = np.full((n, 2), np.nan)
+    cursor_filter.reset()
+    lost = True
+    for i in range(n):
+        if np.isnan(xs[i]):
+            lost = True
+            continue
+        if lost:
+            cursor_filter.reset()
+            lost = False
+        out[i] = cursor_filter.update(xs[i], ys[i], times[i], lead)
+
+    raw = np.stack((xs, ys), axis=1)
+    raw_vel = np.diff(raw, axis=0)
+    out_vel = np.diff(out, axis=0) * cursor_filter.gain
+    valid = ~(np.isnan(raw_vel).any(axis=1) | np.isnan(out_vel).any(axis=1))
+
+    # Temblor: movimiento del cursor con la mano casi quieta
+    still = np.zeros(len(raw_vel), dtype=bool)
+    for i in range(5, len(raw) - 5):
+        window = raw[i - 5:i + 6]
+        if not np.isnan(window).any():
+            still[i - 1] = np.ptp(window, axis=0).max() <= still_px
+    jitter_mask = valid & still
+    jitter = float(np.sqrt((out_vel[jitter_mask] ** 2).sum(axis=1).mean())) if jitter_mask.any() else float("nan")
+
+    # Retardo: desfase que mejor alinea la velocidad del cursor con la de la mano
+    lags = np.arange(-max_lag, max_lag + 1)
+    corrs = np.full(len(lags), -np.inf)
+    for k, lag in enumerate(lags):
+        if lag >= 0:
+            a, b, m = out_vel[lag:], raw_vel[:len(raw_vel) - lag], valid[lag:] & valid[:len(valid) - lag]
+        else:
+            a, b, m = out_vel[:lag], raw_vel[-lag:], valid[:lag] & valid[-lag:]
+        if m.sum() < 3:
+            continue
+        corrs[k] = (a[m] * b[m]).sum() / (np.linalg.norm(a[m]) * np.linalg.norm(b[m]) + 1e-12)
+    k = int(np.argmax(corrs))
+    best_lag = float(lags[k])
+    if 0 < k < len(lags) - 1 and np.isfinite(corrs[k - 1:k + 2]).all():
+        # Interpolación parabólica del pico para obtener un desfase fraccionario
+        c0, c1, c2 = corrs[k - 1:k + 2]
+        denom = c0 - 2 * c1 + c2
+        if denom < 0:
+            best_lag += 0.5 * (c0 - c2) / denom
+    if not corrs[k] > 0:
+        # El cursor no se movió (o no acompaña a la mano): el retardo no está definido
+        best_lag = float("nan")
+    frame_dt = float(np.median(np.diff(times))) if n > 1 else 0.0
+    return {"jitter_px": jitter, "lag_ms": best_lag * frame_dt * 1000.0, "correlation": float(corrs[k])}
@@ -0,0 +1,322 @@
+import os
+import select
+import socket
+import struct
+import time
+import numpy as np
+
+# Formato de cada lote (un lote por frame), en little-endian:
+#   cabecera de 16 bytes: magia b"GE", versión (uint8), número de eventos (uint8),
+#                         secuencia del lote (uint32), instante de captura del frame (float64)
+#   eventos de 12 bytes: tipo (uint8), mano (uint8), código (int16), x (float32), y (float32)
+MAGIC = b"GE"
+VERSION = 1
+HEADER = struct.Struct("<2sBBId")
+EVENT = struct.Struct("<BBhff")
+EVENT_DTYPE = np.dtype([("type", "u1"), ("hand", "u1"), ("code", "<i2"), ("x", "<f4"), ("y", "<f4")])
+MAX_EVENTS = 255  # Eventos por lote; si un frame produce más, se envían varios lotes
+
+# Tipos de evento
+EVENT_GESTURE = 1  # code: gesto nuevo (NO_HAND si la mano desapareció); x: gesto anterior
+EVENT_CURSOR = 2  # x, y: destino del cursor en píxeles de pantalla
+EVENT_PINCH = 3  # code: índice en PINCH_CONTROLS; x: desplazamiento actual;
+#                    y: último paso aplicado (modo "step") o cantidad enviada en este frame (modo "continuous")
+
+# Mano de los eventos de gesto
+HAND_MAJOR = 0
+HAND_MINOR = 1
+NO_HAND = -1
+
+# Controles continuos de la pinza, por el nombre del método de `Controller`
+PINCH_CONTROLS = ("scrollHorizontal", "scrollVertical", "changesystembrightness", "changesystemvolume")
+_PINCH_CODES = {name: code for code, name in enumerate(PINCH_CONTROLS)}
+
+
+def _check_unix_sockets():
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Los sockets Unix no están disponibles en esta plataforma.")
+
+
+class _Subscriber:
+    """Conexión de un suscriptor y el resto de un lote que no cupo en su buffer."""
+
+    __slots__ = ("sock", "pending", "dropped")
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.pending = b""
+        self.dropped = 0
+
+
+class EventPublisher:
+    """
+    Publica los eventos de gestos en un socket Unix de flujo para otras
+    aplicaciones locales, sin pasar por el cursor ni el audio del sistema.
+
+    Los eventos de un frame se acumulan en un buffer preasignado y `flush` los
+    envía como un solo lote binario a cada suscriptor. Los envíos nunca
+    bloquean: si el buffer del socket de un suscriptor está lleno, los lotes
+    siguientes se descartan para él (y se cuentan en `batches_dropped`) hasta
+    que termine de recibir el lote a medias; los demás suscriptores no se ven
+    afectados. Las conexiones nuevas se aceptan en cada `flush`, después de
+    enviar el lote, sin hilos.
+
+    Atributos
+    ----------
+    path : str
+        ruta del socket.
+    batches_sent : int
+        lotes entregados, sumando todos los suscriptores.
+    batches_dropped : int
+        lotes descartados por suscriptores lentos.
+    seq : int
+        secuencia del último lote; los suscriptores detectan descartes por saltos.
+    """
+
+    def __init__(self, path):
+        _check_unix_sockets()
+        self.path = path
+        self.batches_sent = 0
+        self.batches_dropped = 0
+        self.seq = 0
+        self._server = None
+        self._subscribers = []
+        self._buffer = bytearray(HEADER.size + MAX_EVENTS * EVENT.size)
+        self._view = memoryview(self._buffer)
+        self._count = 0
+
+    def start(self):
+        """Crea el socket (reemplazando uno viejo en la misma ruta) y empieza a aceptar suscriptores."""
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.path)
+        server.listen(8)
+        server.setblocking(False)
+        self._server = server
+        return self
+
+    def stop(self):
+        """Cierra las conexiones y elimina el socket."""
+        for sub in self._subscribers:
+            sub.sock.close()
+        self._subscribers = []
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    @property
+    def subscribers(self):
+        """Número de suscriptores conectados."""
+        return len(self._subscribers)
+
+    def _emit(self, kind, hand, code, x, y, timestamp):
+        if self._count == MAX_EVENTS:
+            self.flush(timestamp)
+        EVENT.pack_into(self._buffer, HEADER.size + self._count * EVENT.size, kind, hand, code, x, y)
+        self._count += 1
+
+    def gesture(self, hand, gesture, previous, timestamp=0.0):
+        """Registra un cambio de gesto confirmado de la mano `hand` (HAND_MAJOR o HAND_MINOR)."""
+        self._emit(EVENT_GESTURE, hand, int(gesture), float(int(previous)), 0.0, timestamp)
+
+    def cursor(self, x, y, timestamp=0.0):
+        """Registra el destino del cursor calculado en este frame."""
+        self._emit(EVENT_CURSOR, HAND_MAJOR, 0, x, y, timestamp)
+
+    def pinch(self, control, level, applied, timestamp=0.0):
+        """Registra el desplazamiento de pinza del control `control` (nombre en PINCH_CONTROLS)."""
+        self._emit(EVENT_PINCH, HAND_MAJOR, _PINCH_CODES.get(control, -1), level, applied, timestamp)
+
+    def flush(self, timestamp):
+        """
+        Envía los eventos acumulados como un lote y después acepta las
+        conexiones pendientes, para no retrasar la entrega con `accept`. Sin
+        eventos solo acepta conexiones.
+
+        Parameters
+        ----------
+        timestamp : float
+            Instante de captura del frame (`time.time()`).
+        """
+        count = self._count
+        self._count = 0
+        if count and self._subscribers:
+            self._send(count, timestamp)
+        if self._server is not None:
+            self._accept()
+
+    def _send(self, count, timestamp):
+        self.seq = (self.seq + 1) & 0xFFFFFFFF
+        HEADER.pack_into(self._buffer, 0, MAGIC, VERSION, count, self.seq, timestamp)
+        data = self._view[:HEADER.size + count * EVENT.size]
+        closed = None
+        for sub in self._subscribers:
+            try:
+                if sub.pending:
+                    # Un lote anterior quedó a medias: se completa antes de enviar otro
+                    sent = sub.sock.send(sub.pending)
+                    sub.pending = sub.pending[sent:]
+                    if sub.pending:
+                        sub.dropped += 1
+                        self.batches_dropped += 1
+                        continue
+                sent = sub.sock.send(data)
+                if sent < len(data):
+                    sub.pending = bytes(data[sent:])
+                self.batches_sent += 1
+            except BlockingIOError:
+                sub.dropped += 1
+                self.batches_dropped += 1
+            except OSError:
+                # El suscriptor cerró la conexión
+                sub.sock.close()
+                closed = closed or []
+                closed.append(sub)
+        if closed:
+            self._subscribers = [sub for sub in self._subscribers if sub not in closed]
+
+    def _accept(self):
+        while True:
+            try:
+                conn, _ = self._server.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            conn.setblocking(False)
+            self._subscribers.append(_Subscriber(conn))
+
+
+class EventBatch:
+    """
+    Lote de eventos de un frame recibido por `EventSubscriber`.
+
+    Atributos
+    ----------
+    seq : int
+        secuencia del lote.
+    timestamp : float
+        instante de captura del frame (`time.time()` del publicador).
+    events : ndarray
+        eventos con el dtype `EVENT_DTYPE` (campos type, hand, code, x, y).
+    """
+
+    __slots__ = ("seq", "timestamp", "events")
+
+    def __init__(self, seq, timestamp, events):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.events = events
+
+
+class EventSubscriber:
+    """
+    Cliente del flujo de eventos de `EventPublisher`.
+
+    Ejemplo::
+
+        with EventSubscriber("/tmp/gestures.sock") as sub:
+            for batch in sub:
+                for event in batch.events:
+                    if event["type"] == EVENT_GESTURE:
+                        print(event["hand"], event["code"])
+
+    Atributos
+    ----------
+    missed : int
+        lotes que el publicador descartó para este suscriptor (saltos de secuencia).
+    """
+
+    def __init__(self, path, timeout=5.0):
+        """
+        Parameters
+        ----------
+        path : str
+            Ruta del socket del publicador.
+        timeout : float, optional
+            Segundos máximos de espera al conectar.
+        """
+        _check_unix_sockets()
+        self.missed = 0
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._sock.connect(path)
+                break
+            except (FileNotFoundError, ConnectionRefusedError):
+                # El publicador todavía no creó el socket
+                if time.monotonic() >= deadline:
+                    self._sock.close()
+                    raise
+                time.sleep(0.05)
+        self._buffer = bytearray()
+        self._last_seq = None
+
+    def close(self):
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            batch = self.read()
+            if batch is None:
+                return
+            yield batch
+
+    def fileno(self):
+        """Descriptor del socket, para esperar eventos con `select` junto a otros."""
+        return self._sock.fileno()
+
+    def read(self, timeout=None):
+        """
+        Espera el siguiente lote.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Segundos máximos de espera; None espera indefinidamente.
+
+        Returns
+        -------
+        EventBatch
+            El lote recibido, o None si el publicador cerró la conexión o venció el plazo.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            batch = self._parse()
+            if batch is not None:
+                return batch
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not select.select([self._sock], [], [], remaining)[0]:
+                    return None
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                return None
+            self._buffer += chunk
+
+    def _parse(self):
+        buffer = self._buffer
+        if len(buffer) < HEADER.size:
+            return None
+        magic, version, count, seq, timestamp = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Flujo de eventos no reconocido (magia {magic!r}, versión {version})")
+        size = HEADER.size + count * EVENT.size
+        if len(buffer) < size:
+            return None
+        events = np.frombuffer(bytes(buffer[HEADER.size:size]), dtype=EVENT_DTYPE)
+        del buffer[:size]
+        if self._last_seq is not None:
+            self.missed += (seq - self._last_seq - 1) & 0xFFFFFFFF
+        self._last_seq = seq
+        return EventBatch(seq, timestamp, events)
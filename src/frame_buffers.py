@@ -0,0 +1,112 @@
+import cv2
+import numpy as np
+
+
+class FrameBufferPool:
+    """
+    Arrays preasignados que se reutilizan de un frame al siguiente como
+    destino (`dst`) de las operaciones de OpenCV, en lugar de crear imágenes
+    nuevas en cada frame.
+
+    Cada buffer se identifica por un nombre; solo se vuelve a asignar si cambia
+    su forma (por ejemplo, al cambiar la resolución de captura), así que en
+    régimen estable el camino de cada frame no asigna memoria.
+
+    Atributos
+    ----------
+    allocations : int
+        buffers asignados desde el inicio (incluye las reasignaciones por cambio de forma).
+    allocated_bytes : int
+        bytes asignados desde el inicio.
+    reuses : int
+        veces que se entregó un buffer ya existente.
+    """
+
+    def __init__(self):
+        self.allocations = 0
+        self.allocated_bytes = 0
+        self.reuses = 0
+        self._buffers = {}
+
+    def get(self, name, shape, dtype=np.uint8):
+        """
+        Devuelve el buffer `name` con forma `shape`, creándolo si no existe o
+        si su forma cambió. Su contenido es el que dejó el último uso.
+        """
+        buffer = self._buffers.get(name)
+        if buffer is not None and buffer.shape == shape and buffer.dtype == dtype:
+            self.reuses += 1
+            return buffer
+        buffer = np.empty(shape, dtype=dtype)
+        self._buffers[name] = buffer
+        self.allocations += 1
+        self.allocated_bytes += buffer.nbytes
+        return buffer
+
+    @property
+    def nbytes(self):
+        """Bytes ocupados por los buffers actuales."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def clear(self):
+        """Libera todos los buffers."""
+        self._buffers.clear()
+
+
+def mirror_rgb(frame, out=None):
+    """
+    Voltea horizontalmente un frame BGR y lo convierte a RGB en una sola pasada.
+
+    Visto como una imagen de un canal de (alto, ancho * 3) bytes, invertir cada
+    fila invierte a la vez el orden de los píxeles y el de los canales de cada
+    píxel: el resultado es el frame espejado con los canales en orden RGB.
+
+    Parameters
+    ----------
+    frame : ndarray
+        Frame BGR (alto, ancho, 3) de la cámara.
+    out : ndarray, optional
+        Destino con la misma forma; por defecto se crea uno nuevo.
+
+    Returns
+    -------
+    ndarray
+        `out` con el frame espejado en RGB.
+    """
+    height, width = frame.shape[:2]
+    if out is None:
+        out = np.empty_like(frame)
+    if frame.flags.c_contiguous and out.flags.c_contiguous:
+        cv2.flip(frame.reshape(height, width * 3), 1, dst=out.reshape(height, width * 3))
+    else:
+        cv2.flip(frame, 1, dst=out)
+        cv2.cvtColor(out, cv2.COLOR_BGR2RGB, dst=out)
+    return out
+
+
+class FramePreprocessor:
+    """
+    Prepara cada frame de la cámara para MediaPipe y para la vista previa sobre
+    buffers de un `FrameBufferPool`.
+
+    La imagen RGB espejada para MediaPipe se obtiene en una pasada (ver
+    `mirror_rgb`). La imagen BGR de la vista previa solo se genera en los
+    frames que se dibujan, a partir de la RGB, en lugar de convertir cada
+    frame de ida y vuelta.
+
+    Atributos
+    ----------
+    pool : FrameBufferPool
+        buffers reutilizados.
+    """
+
+    def __init__(self, pool=None):
+        self.pool = pool if pool is not None else FrameBufferPool()
+
+    def model_input(self, frame):
+        """Frame BGR de la cámara -> imagen RGB espejada (buffer reutilizado)."""
+        return mirror_rgb(frame, self.pool.get("rgb", frame.shape))
+
+    def preview(self, rgb):
+        """Imagen RGB espejada -> imagen BGR para dibujar y mostrar (buffer reutilizado)."""
+        return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR, dst=self.pool.get("preview", rgb.shape))
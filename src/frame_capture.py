@@ -0,0 +1,186 @@
+import threading
+import time
+
+
+class FrameGrabber:
+    """
+    Captura frames de la cámara en un hilo dedicado y conserva solo el más reciente.
+
+    El bucle principal ya no llama a `source.read()` directamente: espera en `read()`
+    hasta que haya un frame nuevo. Los frames que no alcanzan a procesarse se
+    sobrescriben (se descartan) en lugar de acumularse, por lo que MediaPipe
+    siempre recibe la imagen más reciente.
+
+    Los buffers de los frames descartados o ya procesados se devuelven a la
+    fuente para decodificar los siguientes, así que la captura no asigna
+    memoria en cada frame. Por eso el frame entregado por `read()` solo es
+    válido hasta la siguiente llamada a `read()`.
+
+    Atributos
+    ----------
+    source : Object de 'FrameSource'
+        fuente de frames (cámara, video o secuencia de imágenes).
+    frames_captured : int
+        número de frames leídos correctamente de la cámara.
+    frames_dropped : int
+        número de frames sobrescritos antes de ser consumidos.
+    """
+
+    def __init__(self, source):
+        """
+        Parameters
+        ----------
+        source : FrameSource
+            Fuente de frames ya abierta (ver `src.frame_sources`).
+        """
+        self.source = source
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self._frame = None  # Último frame capturado (buffer de un solo elemento)
+        self._timestamp = 0.0  # Instante de captura del último frame
+        self._seq = 0  # Número de secuencia del último frame capturado
+        self._read_seq = 0  # Número de secuencia del último frame entregado
+        self._held = None  # Frame entregado al consumidor, en uso hasta el siguiente `read()`
+        self._spare = []  # Buffers libres donde decodificar los frames siguientes
+        self._running = False
+        self._cond = threading.Condition()
+        self._thread = None
+        self._pending_resolution = None  # (ancho, alto) a aplicar en el hilo de captura
+
+    def start(self):
+        """Inicia el hilo de captura."""
+        if self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="FrameGrabber", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Detiene el hilo de captura y despierta a cualquier consumidor en espera."""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def set_resolution(self, width, height):
+        """
+        Solicita un cambio de resolución de captura.
+
+        El cambio se aplica en el hilo de captura entre dos lecturas, para no
+        modificar la cámara mientras `source.read()` está en curso.
+        """
+        self._pending_resolution = (width, height)
+
+    @property
+    def running(self):
+        """True mientras el hilo de captura siga activo."""
+        return self._running
+
+    def _run(self):
+        """Bucle del hilo de captura: lee de la cámara y reemplaza el frame guardado."""
+        source = self.source
+        while self._running and source.isOpened():
+            if self._pending_resolution is not None:
+                width, height = self._pending_resolution
+                self._pending_resolution = None
+                source.set_resolution(width, height)
+            with self._cond:
+                buffer = self._spare.pop() if self._spare else None
+            success, image, now = source.read(buffer)
+            if not success:
+                # La cámara no entregó imagen; se reintenta sin ocupar la CPU.
+                if buffer is not None:
+                    with self._cond:
+                        self._spare.append(buffer)
+                time.sleep(0.005)
+                continue
+            with self._cond:
+                if self._seq != self._read_seq:
+                    self.frames_dropped += 1
+                    if self._frame is not None:
+                        self._spare.append(self._frame)
+                self._frame = image
+                self._timestamp = now
+                self._seq += 1
+                self.frames_captured += 1
+                self._cond.notify_all()
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+
+    def read(self, timeout=None):
+        """
+        Bloquea hasta que haya un frame más reciente que el último entregado.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Segundos máximos de espera. None espera indefinidamente.
+
+        Returns
+        -------
+        tuple(bool, ndarray, float)
+            (éxito, frame, instante de captura). Si no llegó ningún frame nuevo
+            antes del timeout o la captura se detuvo, devuelve (False, None, 0.0).
+            El frame se reutiliza para capturar después de la siguiente llamada.
+        """
+        with self._cond:
+            ready = self._cond.wait_for(
+                lambda: self._seq != self._read_seq or not self._running, timeout
+            )
+            if not ready or self._seq == self._read_seq:
+                return False, None, 0.0
+            self._read_seq = self._seq
+            frame, self._frame = self._frame, None
+            if self._held is not None:
+                # El consumidor terminó con el frame anterior
+                self._spare.append(self._held)
+            self._held = frame
+            return True, frame, self._timestamp
+
+
+class SequentialReader:
+    """
+    Lee la fuente en el mismo hilo del bucle principal, sin descartar frames.
+
+    Tiene la interfaz de `FrameGrabber` y se usa para procesar videos o
+    imágenes tan rápido como sea posible: cada `read()` devuelve el siguiente
+    frame del archivo en cuanto se pide.
+
+    Atributos
+    ----------
+    source : Object de 'FrameSource'
+        fuente de frames.
+    frames_captured : int
+        número de frames leídos.
+    frames_dropped : int
+        siempre 0.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.frames_captured = 0
+        self.frames_dropped = 0
+
+    def start(self):
+        return self
+
+    def stop(self):
+        pass
+
+    def set_resolution(self, width, height):
+        self.source.set_resolution(width, height)
+
+    @property
+    def running(self):
+        return self.source.isOpened()
+
+    def read(self, timeout=None):
+        """Devuelve (éxito, frame, instante del frame) del siguiente frame de la fuente."""
+        success, image, timestamp = self.source.read()
+        if success:
+            self.frames_captured += 1
+        return success, image, timestamp
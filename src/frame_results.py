@@ -0,0 +1,128 @@
+from .session_recorder import LABEL_RIGHT
+
+
+class ReplayResults:
+    """
+    Resultado equivalente al de `hands.process`, reconstruido desde un registro
+    con el dtype de `session_dtype` (una sesión grabada o el pipeline multiproceso).
+    """
+
+    __slots__ = ("multi_hand_landmarks", "multi_handedness")
+
+    def __init__(self, multi_hand_landmarks, multi_handedness):
+        self.multi_hand_landmarks = multi_hand_landmarks
+        self.multi_handedness = multi_handedness
+
+
+class ReplayLandmark:
+    """Punto (x, y, z) normalizado, con los campos que se leen de `NormalizedLandmark`."""
+
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x = x
+        self.y = y
+        self.z = z
+
+    def HasField(self, name):
+        # Hands no rellena `visibility` ni `presence`; `drawing_utils` los consulta
+        return False
+
+
+class ReplayLandmarkList:
+    """
+    Landmarks de una mano con la interfaz de `NormalizedLandmarkList`
+    (`landmark[i].x/y/z`) sobre un arreglo `(21, 3)` float32, sin protobuf.
+
+    Atributos
+    ----------
+    array : ndarray
+        landmarks `(21, 3)`; `landmarks_to_array` los copia directamente.
+    landmark : list(ReplayLandmark)
+        los mismos valores, punto por punto.
+    """
+
+    __slots__ = ("array", "landmark")
+
+    def __init__(self, array):
+        self.array = array
+        self.landmark = [ReplayLandmark(x, y, z) for x, y, z in array.tolist()]
+
+
+class ReplayClassification:
+    """Lateralidad de una mano, con los campos que se leen de `Classification`."""
+
+    __slots__ = ("index", "score", "label")
+
+    def __init__(self, index, score, label):
+        self.index = index
+        self.score = score
+        self.label = label
+
+
+class ReplayHandedness:
+    """Equivalente a `ClassificationList` con una sola clasificación."""
+
+    __slots__ = ("classification",)
+
+    def __init__(self, index, score, label):
+        self.classification = [ReplayClassification(index, score, label)]
+
+
+def results_from_frame(frame):
+    """
+    Reconstruye el resultado de MediaPipe de un frame grabado o recibido del pipeline.
+
+    Los landmarks se envuelven en objetos ligeros en lugar de protobufs de
+    MediaPipe, que no hace falta importar para reproducir una sesión.
+
+    Parameters
+    ----------
+    frame : np.void
+        Registro con el dtype de `session_dtype`.
+
+    Returns
+    -------
+    ReplayResults
+    """
+    num_hands = int(frame['num_hands'])
+    if not num_hands:
+        return ReplayResults(None, None)
+    landmarks = frame['landmarks']
+    labels = frame['label'].tolist()
+    scores = frame['score'].tolist()
+    multi_hand_landmarks = []
+    multi_handedness = []
+    for hand in range(num_hands):
+        multi_hand_landmarks.append(ReplayLandmarkList(landmarks[hand]))
+        label = 'Right' if labels[hand] == LABEL_RIGHT else 'Left'
+        multi_handedness.append(ReplayHandedness(hand, scores[hand], label))
+    return ReplayResults(multi_hand_landmarks, multi_handedness)
+
+
+def results_from_landmarks(landmarks, labels, scores):
+    """
+    Construye un resultado equivalente al de `hands.process` a partir de
+    arreglos de landmarks (por ejemplo, los seguidos con flujo óptico).
+
+    Parameters
+    ----------
+    landmarks : ndarray
+        Landmarks normalizados `(manos, 21, 3)` float32.
+    labels : sequence(str)
+        Lateralidad de cada mano ('Right' o 'Left').
+    scores : sequence(float)
+        Confianza de cada mano.
+
+    Returns
+    -------
+    ReplayResults
+    """
+    if len(landmarks) == 0:
+        return ReplayResults(None, None)
+    multi_hand_landmarks = []
+    multi_handedness = []
+    for hand, (points, label, score) in enumerate(zip(landmarks, labels, scores)):
+        multi_hand_landmarks.append(ReplayLandmarkList(points))
+        multi_handedness.append(ReplayHandedness(hand, float(score), label))
+    return ReplayResults(multi_hand_landmarks, multi_handedness)
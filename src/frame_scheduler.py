@@ -0,0 +1,73 @@
+import time
+
+
+class FrameScheduler:
+    """
+    Marca el ritmo del bucle principal según haya o no manos a la vista.
+
+    Mientras se detectan manos el bucle corre a `active_fps`. Si pasan `idle_after`
+    segundos sin ninguna mano, baja a `idle_fps`; en cuanto vuelve a aparecer una
+    mano regresa de inmediato a `active_fps`, sin esperar al siguiente frame lento.
+
+    Atributos
+    ----------
+    active_fps : float
+        frames por segundo con manos a la vista.
+    idle_fps : float
+        frames por segundo en reposo.
+    idle_after : float
+        segundos sin manos antes de pasar a reposo.
+    idle : bool
+        True si el bucle está en reposo.
+    on_change : callable
+        función opcional `on_change(idle)` llamada al entrar o salir del reposo.
+    """
+
+    def __init__(self, active_fps, idle_fps, idle_after, on_change=None):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_after = idle_after
+        self.on_change = on_change
+        self.idle = False
+        now = time.time()
+        self._last_seen = now
+        self._next_frame_time = now
+
+    @property
+    def fps(self):
+        """Frecuencia objetivo actual."""
+        return self.idle_fps if self.idle else self.active_fps
+
+    def wait(self):
+        """Duerme hasta el instante del siguiente frame y programa el que le sigue."""
+        delay = self._next_frame_time - time.time()
+        if delay > 0:
+            time.sleep(delay)
+        now = time.time()
+        self._next_frame_time = max(self._next_frame_time + 1 / self.fps, now)
+        return now
+
+    def update(self, hand_present, now=None):
+        """
+        Informa si el último frame procesado contenía alguna mano.
+
+        Parameters
+        ----------
+        hand_present : bool
+            True si se detectó al menos una mano.
+        now : float, optional
+            Instante actual; por defecto `time.time()`.
+        """
+        now = time.time() if now is None else now
+        if hand_present:
+            self._last_seen = now
+            if self.idle:
+                self.idle = False
+                # El siguiente frame se procesa sin esperar el intervalo de reposo
+                self._next_frame_time = now
+                if self.on_change is not None:
+                    self.on_change(False)
+        elif not self.idle and now - self._last_seen >= self.idle_after:
+            self.idle = True
+            if self.on_change is not None:
+                self.on_change(True)
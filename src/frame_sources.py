@@ -0,0 +1,328 @@
+import glob
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+from config.settings import SOURCE_FPS, SOURCE_READ_AHEAD, SOURCE_DECODE_WORKERS
+
+# Extensiones reconocidas en una carpeta de imágenes
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+
+
+class FrameSource:
+    """
+    Origen de frames BGR del bucle principal: una cámara, un video o una
+    secuencia de imágenes.
+
+    Atributos
+    ----------
+    realtime : bool
+        True si los frames llegan al ritmo del mundo real (cámara, o archivo
+        reproducido a su velocidad); False si se entregan tan rápido como se
+        piden, con instantes tomados del propio archivo.
+    """
+
+    realtime = True
+
+    def isOpened(self):
+        """True mientras la fuente pueda entregar frames."""
+        raise NotImplementedError
+
+    def read(self, image=None):
+        """
+        Lee el siguiente frame.
+
+        Parameters
+        ----------
+        image : ndarray, optional
+            Buffer de un frame anterior donde decodificar el nuevo si tiene la
+            misma forma, para no asignar memoria en cada frame. Las fuentes que
+            no lo admiten lo ignoran y devuelven un array nuevo.
+
+        Returns
+        -------
+        tuple(bool, ndarray, float)
+            (éxito, frame BGR, instante del frame en segundos de `time.time()`).
+        """
+        raise NotImplementedError
+
+    @property
+    def size(self):
+        """(ancho, alto) de los frames."""
+        raise NotImplementedError
+
+    def set_resolution(self, width, height):
+        """Solicita otra resolución; devuelve False si la fuente no la admite."""
+        return False
+
+    def release(self):
+        """Libera la fuente."""
+        pass
+
+
+class CameraSource(FrameSource):
+    """
+    Cámara de OpenCV (o cualquier URL que abra `cv2.VideoCapture`, como un flujo RTSP).
+
+    Parameters
+    ----------
+    index : int o str
+        Índice de la cámara o URL.
+    """
+
+    def __init__(self, index):
+        self.cap = cv2.VideoCapture(index)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def read(self, image=None):
+        success, image = self.cap.read(image)
+        return success, image, time.time()
+
+    @property
+    def size(self):
+        return self.cap.get(cv2.CAP_PROP_FRAME_WIDTH), self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
+
+    def set_resolution(self, width, height):
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        return True
+
+    def release(self):
+        self.cap.release()
+
+
+class _ReadAheadSource(FrameSource):
+    """
+    Fuente de archivo que decodifica en un hilo aparte y deja los frames en una
+    cola acotada, de modo que la decodificación se solapa con la inferencia
+    (OpenCV libera el GIL al decodificar) sin acumular memoria.
+
+    Con `realtime=True` cada frame se entrega en su instante según `fps`,
+    como una cámara. Con `realtime=False` se entregan en cuanto se piden, y el
+    instante de cada frame es el del archivo (inicio + índice / fps), de modo
+    que la confirmación de gestos por tiempo se comporta como en tiempo real.
+
+    Atributos
+    ----------
+    fps : float
+        frames por segundo del archivo.
+    frames_read : int
+        frames entregados.
+    """
+
+    def __init__(self, fps, realtime=True, queue_size=SOURCE_READ_AHEAD):
+        self.fps = fps
+        self.realtime = realtime
+        self.frames_read = 0
+        self._queue = queue.Queue(maxsize=max(1, queue_size))
+        self._stop = threading.Event()
+        self._finished = False
+        self._start_time = None
+        self._thread = threading.Thread(target=self._produce, name=type(self).__name__, daemon=True)
+
+    def _start(self):
+        self._thread.start()
+        return self
+
+    def _decode(self):
+        """Generador de frames decodificados, en orden."""
+        raise NotImplementedError
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self):
+        try:
+            for image in self._decode():
+                if not self._put(image):
+                    return
+        finally:
+            self._put(None)  # Fin del archivo
+
+    def isOpened(self):
+        return not self._finished
+
+    def read(self, image=None):
+        # Los frames ya decodificados en la cola no se pueden reutilizar: se ignora `image`
+        if self._finished:
+            return False, None, 0.0
+        image = self._queue.get()
+        if image is None:
+            self._finished = True
+            return False, None, 0.0
+        index = self.frames_read
+        self.frames_read += 1
+        if self._start_time is None:
+            self._start_time = time.time()
+        timestamp = self._start_time + index / self.fps
+        if self.realtime:
+            delay = timestamp - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            timestamp = time.time()
+        return True, image, timestamp
+
+    def release(self):
+        self._stop.set()
+        self._finished = True
+        # Vacía la cola para que el hilo decodificador no quede bloqueado
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+
+class VideoFileSource(_ReadAheadSource):
+    """
+    Archivo de video. Un video solo se puede decodificar en orden, así que lo
+    hace un único hilo con hasta `read_ahead` frames por adelantado.
+
+    Parameters
+    ----------
+    path : str
+        Ruta del video.
+    realtime : bool, optional
+        Reproduce a la velocidad del video (True) o tan rápido como se lea (False).
+    read_ahead : int, optional
+        Frames decodificados por adelantado. Por defecto `SOURCE_READ_AHEAD`.
+    """
+
+    def __init__(self, path, realtime=True, read_ahead=SOURCE_READ_AHEAD):
+        self.path = path
+        self._cap = cv2.VideoCapture(path)
+        if not self._cap.isOpened():
+            raise RuntimeError(f"No se pudo abrir el video {path!r}.")
+        fps = self._cap.get(cv2.CAP_PROP_FPS)
+        self._size = (self._cap.get(cv2.CAP_PROP_FRAME_WIDTH), self._cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        super().__init__(fps if fps and fps > 0 else SOURCE_FPS, realtime, read_ahead)
+        self._start()
+
+    @property
+    def size(self):
+        return self._size
+
+    def _decode(self):
+        cap = self._cap
+        try:
+            while not self._stop.is_set():
+                success, image = cap.read()
+                if not success:
+                    return
+                yield image
+        finally:
+            cap.release()
+
+
+class ImageSequenceSource(_ReadAheadSource):
+    """
+    Secuencia de imágenes, decodificadas en paralelo por un grupo de hilos y
+    entregadas en orden, con como mucho `read_ahead` imágenes en vuelo.
+
+    Parameters
+    ----------
+    paths : list(str)
+        Rutas de las imágenes, en orden.
+    fps : float, optional
+        Frames por segundo de la secuencia. Por defecto `SOURCE_FPS`.
+    realtime : bool, optional
+        Entrega las imágenes a `fps` (True) o tan rápido como se lean (False).
+    read_ahead : int, optional
+        Imágenes decodificadas o en decodificación por adelantado. Por defecto `SOURCE_READ_AHEAD`.
+    workers : int, optional
+        Hilos de decodificación. Por defecto `SOURCE_DECODE_WORKERS`.
+    """
+
+    def __init__(self, paths, fps=SOURCE_FPS, realtime=True, read_ahead=SOURCE_READ_AHEAD,
+                 workers=SOURCE_DECODE_WORKERS):
+        if not paths:
+            raise RuntimeError("La secuencia de imágenes está vacía.")
+        self.paths = list(paths)
+        first = cv2.imread(self.paths[0])
+        if first is None:
+            raise RuntimeError(f"No se pudo leer la imagen {self.paths[0]!r}.")
+        self._size = (float(first.shape[1]), float(first.shape[0]))
+        self.read_ahead = max(1, read_ahead)
+        self.workers = max(1, workers)
+        # Las imágenes en vuelo ya acotan la memoria: la cola solo desacopla al consumidor
+        super().__init__(fps, realtime, queue_size=1)
+        self._start()
+
+    @property
+    def size(self):
+        return self._size
+
+    def _decode(self):
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ImageDecode") as pool:
+            pending = deque()
+            paths = iter(self.paths)
+            for path in paths:
+                pending.append((path, pool.submit(cv2.imread, path)))
+                if len(pending) >= self.read_ahead:
+                    break
+            while pending and not self._stop.is_set():
+                path, future = pending.popleft()
+                next_path = next(paths, None)
+                if next_path is not None:
+                    pending.append((next_path, pool.submit(cv2.imread, next_path)))
+                image = future.result()
+                if image is None:
+                    print(f"Imagen ilegible, se omite: {path}")
+                    continue
+                yield image
+            for _, future in pending:
+                future.cancel()
+
+
+def _image_paths(spec):
+    """Imágenes de una carpeta o de un patrón glob, en orden alfabético."""
+    if os.path.isdir(spec):
+        names = sorted(os.listdir(spec))
+        return [os.path.join(spec, name) for name in names if name.lower().endswith(IMAGE_EXTENSIONS)]
+    return sorted(glob.glob(spec))
+
+
+def open_source(spec, realtime=True, fps=SOURCE_FPS, read_ahead=SOURCE_READ_AHEAD, workers=SOURCE_DECODE_WORKERS):
+    """
+    Abre la fuente de frames indicada por `spec`.
+
+    Parameters
+    ----------
+    spec : int o str
+        Índice de cámara (entero o texto numérico), ruta de un video, carpeta de
+        imágenes, patrón glob de imágenes (p. ej. 'frames/*.png') o URL de un flujo.
+    realtime : bool, optional
+        Para videos e imágenes, si se entregan a su velocidad o tan rápido como se pidan.
+    fps : float, optional
+        Frames por segundo de una secuencia de imágenes.
+    read_ahead : int, optional
+        Frames decodificados por adelantado en videos e imágenes.
+    workers : int, optional
+        Hilos de decodificación de una secuencia de imágenes.
+
+    Returns
+    -------
+    FrameSource
+    """
+    if isinstance(spec, int) or (isinstance(spec, str) and spec.isdigit()):
+        return CameraSource(int(spec))
+    if os.path.isdir(spec) or glob.has_magic(spec):
+        paths = _image_paths(spec)
+        if not paths:
+            raise RuntimeError(f"No hay imágenes en {spec!r}.")
+        return ImageSequenceSource(paths, fps, realtime, read_ahead, workers)
+    if os.path.isfile(spec):
+        return VideoFileSource(spec, realtime, read_ahead)
+    return CameraSource(spec)
@@ -1,95 +1,424 @@
 import time
 import cv2
-import mediapipe as mp
-from google.protobuf.json_format import MessageToDict
-from .hand_recognition import HandRecog
+from .frame_capture import FrameGrabber, SequentialReader
+from .frame_sources import open_source
+from .frame_buffers import FramePreprocessor
+from .frame_scheduler import FrameScheduler
+from .session_recorder import SessionRecorder
+from .metrics import Metrics, MetricsServer
+from .roi import RoiHands, RoiTracker
+from .landmark_flow import LandmarkFlowTracker
+from .frame_results import results_from_frame
+from .gesture_session import GestureSession
 from .gesture_handlers import Controller
-from .enums.gesture_enums import HLabel, Gest
+from .learned_classifier import load_classifier
+from .startup import BackgroundTask, StartupTimer, close_when_done, create_hands_model
+from .cpu_governor import CpuGovernor, get_profile, load_profiles
+from .event_stream import EventPublisher
+from .system_backends import recording_backends
+from config.gestures import GESTURE_CLASSIFIER_PATH
 from config.settings import (
     CAMERA_INDEX,
     MIN_DETECTION_CONFIDENCE,
     MIN_TRACKING_CONFIDENCE,
     MAX_NUM_HANDS,
-    WINDOW_NAME
+    PIPELINE_ENABLED,
+    PIPELINE_WORKERS,
+    PIPELINE_SLOTS,
+    PIPELINE_MAX_FRAME_SIZE,
+    PIPELINE_READ_FAILURE_TIMEOUT,
+    ROI_ENABLED,
+    ROI_MARGIN,
+    ROI_MAX_SIDE,
+    ROI_FULL_FRAME_INTERVAL,
+    FLOW_DETECT_EVERY,
+    WINDOW_NAME,
+    HEADLESS,
+    PREVIEW_EVERY_N,
+    PREVIEW_MAX_FPS,
+    TARGET_FPS,
+    IDLE_FPS,
+    IDLE_AFTER,
+    IDLE_CAPTURE_SIZE,
+    CAPTURE_TIMEOUT,
+    METRICS_ENABLED,
+    METRICS_LOG_INTERVAL,
+    METRICS_PORT,
+    PERFORMANCE_PROFILE,
+    CPU_BUDGET,
+    EVENTS_SOCKET,
+    EVENTS_ONLY,
+    FRAME_SOURCE,
+    SOURCE_FAST
 )
 
-# Inicialización de MediaPipe para detección de manos
-mp_drawing = mp.solutions.drawing_utils
-mp_hands = mp.solutions.hands
+
+def _drawing_modules():
+    """Módulos de dibujo de MediaPipe; se importan al dibujar la primera vista previa."""
+    import mediapipe as mp
+    return mp.solutions.drawing_utils, mp.solutions.hands
 
 class GestureController:
     """
     Maneja la cámara, obtiene los puntos de referencia (landmarks) de MediaPipe,
     y sirve como punto de entrada para todo el programa.
 
+    Todo el estado pertenece a la instancia: varios `GestureController` con
+    cámaras distintas pueden ejecutarse a la vez en hilos separados (en ese caso,
+    con `headless=True`, ya que las ventanas de OpenCV solo funcionan en el hilo principal).
+
     Atributos
     ----------
     gc_mode : int
         indica si el controlador de gestos está ejecutándose o no,
         1 si está ejecutándose, 0 si no.
-    cap : Object
-        objeto obtenido de cv2, para capturar frames de video.
+    camera_index : int
+        índice de la cámara de OpenCV.
+    source_spec : int o str
+        cámara, video, carpeta o patrón de imágenes del que se leen los frames.
+    source : Object de 'FrameSource'
+        fuente de frames abierta (ver `src.frame_sources`), None en modo pipeline.
+    fast : bool
+        True si un video o secuencia de imágenes se procesa tan rápido como sea
+        posible, sin ritmo de FPS ni descartar frames.
     CAM_HEIGHT : int
         altura en píxeles del frame obtenido de la cámara.
     CAM_WIDTH : int
         ancho en píxeles del frame obtenido de la cámara.
-    hr_major : Object de 'HandRecog'
-        objeto que representa la mano principal.
-    hr_minor : Object de 'HandRecog'
-        objeto que representa la mano secundaria.
-    dom_hand : bool
-        True si la mano derecha es la dominante, False en caso contrario.
-        Por defecto es True.
+    session : Object de 'GestureSession'
+        reconocedores de ambas manos, seguimiento de manos y `Controller` de esta cámara.
+    recorder : Object de 'SessionRecorder'
+        graba los landmarks de cada frame si se indicó `record_path`, None en caso contrario.
+    metrics : Object de 'Metrics'
+        temporizadores por etapa y contadores del bucle principal.
+    metrics_server : Object de 'MetricsServer'
+        servidor HTTP local de métricas, None si está desactivado.
+    headless : bool
+        True para no mostrar ventana ni dibujar landmarks.
+    preview_every_n : int
+        la vista previa se dibuja solo cada N frames procesados.
+    preview_max_fps : float
+        límite de FPS de la vista previa, None sin límite.
+    window_name : str
+        título de la ventana de vista previa.
+    roi : Object de 'RoiTracker'
+        recorta la entrada del modelo alrededor de las manos, None si está desactivado.
+    flow : Object de 'LandmarkFlowTracker'
+        sigue los landmarks con flujo óptico entre ejecuciones del modelo, None si está desactivado.
+    pipeline : bool
+        True si la captura y la inferencia corren en procesos separados.
+    startup : Object de 'StartupTimer'
+        instante de cada fase del arranque (cámara abierta, modelo listo, primer frame).
+    profile : Object de 'PerformanceProfile'
+        perfil de rendimiento actual, None si se usa la configuración general.
+    governor : Object de 'CpuGovernor'
+        cambia de perfil según el uso de CPU y la latencia, None si está desactivado.
+    target_fps : float
+        frames por segundo procesados con manos a la vista.
+    max_num_hands : int
+        número máximo de manos que detecta el modelo.
+    model_complexity : int
+        complejidad del modelo de MediaPipe, None para la de por defecto.
+    overlay : bool
+        True para dibujar landmarks y gestos en la vista previa.
+    events : Object de 'EventPublisher'
+        publica los eventos de gestos en un socket Unix, None si está desactivado.
+    frames : Object de 'FramePreprocessor'
+        convierte cada frame para el modelo y la vista previa sobre buffers reutilizados.
     """
-    gc_mode = 0
-    cap = None
-    CAM_HEIGHT = None
-    CAM_WIDTH = None
-    hr_major = None  # Mano derecha por defecto
-    hr_minor = None  # Mano izquierda por defecto
-    dom_hand = True
-
-    def __init__(self):
-        """Inicializa los atributos y configura la captura de video."""
-        GestureController.gc_mode = 1
-        GestureController.cap = cv2.VideoCapture(CAMERA_INDEX)
-        if not GestureController.cap.isOpened():
-            raise RuntimeError("No se pudo acceder a la cámara.")
-        GestureController.CAM_HEIGHT = GestureController.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)
-        GestureController.CAM_WIDTH = GestureController.cap.get(cv2.CAP_PROP_FRAME_WIDTH)
-    
-    @staticmethod
-    def classify_hands(results):
-        """
-        Establece 'hr_major' y 'hr_minor' basándose en la clasificación (izquierda, derecha)
-        de la mano obtenida de MediaPipe. Utiliza 'dom_hand' para decidir qué mano es
-        la principal y cuál la secundaria.
-        """
-        left, right = None, None
-        try:
-            handedness_dict = MessageToDict(results.multi_handedness[0])
-            if handedness_dict['classification'][0]['label'] == 'Right':
-                right = results.multi_hand_landmarks[0]
-            else:
-                left = results.multi_hand_landmarks[0]
-        except:
-            pass
 
-        try:
-            handedness_dict = MessageToDict(results.multi_handedness[1])
-            if handedness_dict['classification'][0]['label'] == 'Right':
-                right = results.multi_hand_landmarks[1]
+    def __init__(self, record_path=None, metrics=None, metrics_port=None,
+                 headless=None, preview_every_n=None, preview_max_fps=None, roi=None,
+                 pipeline=None, camera_index=None, controller=None, classifier_path=None,
+                 startup_origin=None, profile=None, cpu_budget=None, events_path=None, events_only=None,
+                 source=None, fast=None, detect_every=None, pinch_mode=None):
+        """
+        Inicializa los atributos y configura la captura de video.
+
+        Parameters
+        ----------
+        record_path : str, optional
+            Ruta de un archivo de sesión donde grabar los landmarks de cada frame.
+        metrics : bool, optional
+            Activa los temporizadores por etapa y el log periódico de métricas.
+            Por defecto se usa `METRICS_ENABLED`.
+        metrics_port : int, optional
+            Puerto local donde publicar las métricas por HTTP. Implica `metrics=True`.
+            Por defecto se usa `METRICS_PORT`.
+        headless : bool, optional
+            Si es True no se abre ventana ni se dibujan landmarks. Por defecto `HEADLESS`.
+        preview_every_n : int, optional
+            Dibuja la vista previa solo cada N frames. Por defecto `PREVIEW_EVERY_N`.
+        preview_max_fps : float, optional
+            Límite de FPS de la vista previa. Por defecto `PREVIEW_MAX_FPS`.
+        roi : bool, optional
+            Recorta la entrada del modelo alrededor de las manos. Por defecto `ROI_ENABLED`.
+        pipeline : bool, optional
+            Ejecuta la captura y MediaPipe en procesos separados. Por defecto `PIPELINE_ENABLED`.
+        camera_index : int, optional
+            Índice de la cámara de OpenCV. Por defecto `CAMERA_INDEX`.
+        controller : Controller, optional
+            Controlador que ejecuta las acciones. Por defecto uno nuevo con los backends nativos.
+        classifier_path : str, optional
+            Modelo de gestos entrenado que reemplaza a las reglas. Por defecto `GESTURE_CLASSIFIER_PATH`.
+        startup_origin : float, optional
+            Instante (`time.perf_counter()`) desde el que se mide el arranque.
+            Por defecto, el momento de crear el controlador.
+        profile : str, optional
+            Perfil de rendimiento inicial de `PERFORMANCE_PROFILES`. Por defecto `PERFORMANCE_PROFILE`.
+        cpu_budget : float, optional
+            Fracción de un núcleo que puede usar el proceso; activa el regulador de
+            perfiles. Por defecto `CPU_BUDGET`.
+        events_path : str, optional
+            Socket Unix donde publicar los eventos de gestos. Por defecto `EVENTS_SOCKET`.
+        events_only : bool, optional
+            Solo publica eventos, sin actuar sobre el cursor, el volumen ni el brillo
+            del sistema. Por defecto `EVENTS_ONLY`.
+        source : int o str, optional
+            Video, carpeta o patrón de imágenes (o cámara) en lugar de `camera_index`.
+            Por defecto `FRAME_SOURCE`, o la cámara si es None.
+        fast : bool, optional
+            Procesa un video o secuencia de imágenes tan rápido como sea posible.
+            Por defecto `SOURCE_FAST`.
+        detect_every : int, optional
+            Ejecuta MediaPipe cada N frames y sigue los landmarks con flujo óptico
+            entre medias; 1 lo ejecuta en todos. Por defecto `FLOW_DETECT_EVERY`.
+        pinch_mode : str, optional
+            'step' o 'continuous' para el scroll y la pinza de volumen y brillo.
+            Solo se aplica si no se pasa `controller`. Por defecto `PINCH_MODE`.
+        """
+        self.gc_mode = 1
+        self.startup = StartupTimer(startup_origin)
+        self.camera_index = CAMERA_INDEX if camera_index is None else camera_index
+        if source is None:
+            source = FRAME_SOURCE
+        self.source_spec = self.camera_index if source is None else source
+        self.fast = SOURCE_FAST if fast is None else fast
+        self.pipeline = PIPELINE_ENABLED if pipeline is None else pipeline
+        if profile is None:
+            profile = PERFORMANCE_PROFILE
+        if cpu_budget is None:
+            cpu_budget = CPU_BUDGET
+        self.governor = None
+        self.profile = get_profile(profile) if profile is not None else None
+        if cpu_budget is not None:
+            if self.pipeline:
+                # El tiempo de CPU de los procesos de captura e inferencia no se ve desde aquí
+                print("El regulador de CPU no está disponible en modo pipeline; se usa un perfil fijo.")
             else:
-                left = results.multi_hand_landmarks[1]
-        except:
-            pass
-        
-        if GestureController.dom_hand:
-            GestureController.hr_major = right
-            GestureController.hr_minor = left
+                self.governor = CpuGovernor(load_profiles(), cpu_budget, initial=profile)
+                self.profile = self.governor.profile
+        if self.profile is not None:
+            self.target_fps = self.profile.target_fps
+            self.max_num_hands = self.profile.max_num_hands
+            self.model_complexity = self.profile.model_complexity
+            self.overlay = self.profile.overlay
         else:
-            GestureController.hr_major = left
-            GestureController.hr_minor = right
+            self.target_fps = TARGET_FPS
+            self.max_num_hands = MAX_NUM_HANDS
+            self.model_complexity = None
+            self.overlay = True
+        self.source = None
+        self.frames = FramePreprocessor()
+        self.CAM_HEIGHT = None
+        self.CAM_WIDTH = None
+        if roi is None:
+            roi = ROI_ENABLED
+        # Se decide antes de cargar el modelo: con región de interés se cargan dos
+        self.roi = None
+        if roi:
+            self.roi = RoiTracker(
+                margin=ROI_MARGIN,
+                max_side=ROI_MAX_SIDE,
+                full_frame_interval=ROI_FULL_FRAME_INTERVAL
+            )
+        self._hands_task = None
+        if not self.pipeline:
+            # El modelo se carga y se calienta en otro hilo mientras se abre la cámara;
+            # en modo pipeline ambos ocurren en sus propios procesos
+            self._hands_task = BackgroundTask(self._load_hands_model, name="hands-model").start()
+            self.source = open_source(self.source_spec, realtime=not self.fast)
+            if not self.source.isOpened():
+                raise RuntimeError("No se pudo acceder a la cámara.")
+            if self.fast and self.source.realtime:
+                print("El modo rápido solo se aplica a videos e imágenes; la cámara se lee a su ritmo.")
+                self.fast = False
+            if self.profile is not None and self.profile.capture_size is not None:
+                self.source.set_resolution(*self.profile.capture_size)
+            self.CAM_WIDTH, self.CAM_HEIGHT = self.source.size
+            self.startup.mark("camera_open")
+        self.recorder = None
+        if record_path is not None:
+            max_hands = self.max_num_hands
+            if self.governor is not None:
+                # El máximo de manos cambia con el perfil: se graba con el mayor posible
+                max_hands = max(level.max_num_hands for level in self.governor.levels)
+            self.recorder = SessionRecorder(record_path, max_hands=max_hands)
+        if metrics is None:
+            metrics = METRICS_ENABLED
+        if metrics_port is None:
+            metrics_port = METRICS_PORT
+        self.metrics = Metrics(
+            enabled=metrics or metrics_port is not None,
+            log_interval=METRICS_LOG_INTERVAL
+        )
+        self.metrics_server = None
+        if metrics_port is not None:
+            self.metrics_server = MetricsServer(self.metrics, metrics_port).start()
+        self.headless = HEADLESS if headless is None else headless
+        self.preview_every_n = PREVIEW_EVERY_N if preview_every_n is None else max(1, preview_every_n)
+        self.preview_max_fps = PREVIEW_MAX_FPS if preview_max_fps is None else preview_max_fps
+        self.window_name = WINDOW_NAME
+        if self.source_spec != CAMERA_INDEX:
+            self.window_name = f"{WINDOW_NAME} ({self.source_spec})"
+        if detect_every is None:
+            detect_every = FLOW_DETECT_EVERY
+        self.flow = None
+        if detect_every > 1:
+            if self.pipeline:
+                # La inferencia corre en otro proceso, que ya descarta frames si no da abasto
+                print("El seguimiento con flujo óptico no está disponible en modo pipeline; se detecta en cada frame.")
+            else:
+                self.flow = LandmarkFlowTracker(detect_every)
+        if classifier_path is None:
+            classifier_path = GESTURE_CLASSIFIER_PATH
+        classifier = load_classifier(classifier_path) if classifier_path else None
+        if controller is None and pinch_mode is not None:
+            controller = Controller(pinch_mode=pinch_mode)
+        self.session = GestureSession(controller=controller, metrics=self.metrics, classifier=classifier)
+        if events_path is None:
+            events_path = EVENTS_SOCKET
+        if events_only is None:
+            events_only = EVENTS_ONLY
+        self.events = None
+        if events_path is not None:
+            self.events = EventPublisher(events_path).start()
+            self.session.controller.events = self.events
+            if events_only:
+                # Los destinos del cursor se calculan sobre una pantalla simulada
+                self.session.controller.set_backends(recording_backends(record=False))
+        elif events_only:
+            print("EVENTS_ONLY no tiene efecto sin un socket de eventos.")
+        # Los backends del sistema (pyautogui, audio, brillo) también se crean en segundo plano
+        BackgroundTask(self._load_backends, name="backends").start()
+        self.startup.mark("init")
+
+    def _load_hands_model(self):
+        hands = self._create_models(self.max_num_hands, self.model_complexity)
+        self.startup.mark("model_ready")
+        return hands
+
+    def _create_models(self, max_num_hands, model_complexity):
+        """
+        Crea el modelo de manos; con región de interés, un `RoiHands` con un
+        modelo para los frames completos y otro para los recortes.
+        """
+        args = (max_num_hands, MIN_DETECTION_CONFIDENCE, MIN_TRACKING_CONFIDENCE, model_complexity)
+        hands = create_hands_model(*args)
+        if self.roi is not None:
+            hands = RoiHands(hands, create_hands_model(*args))
+        return hands
+
+    def apply_profile(self, profile, grabber, scheduler):
+        """
+        Cambia al perfil de rendimiento `profile` sin detener el bucle.
+
+        La resolución y los FPS cambian en el siguiente frame. Si el perfil usa
+        otro número de manos u otra complejidad, el modelo nuevo se crea en
+        segundo plano y el bucle sigue con el actual hasta que esté listo.
+
+        Returns
+        -------
+        BackgroundTask
+            Tarea que crea el modelo nuevo, None si el actual sirve.
+        """
+        previous = self.profile
+        self.profile = profile
+        self.target_fps = profile.target_fps
+        scheduler.active_fps = profile.target_fps
+        self.overlay = profile.overlay
+        if profile.capture_size is not None and (previous is None or profile.capture_size != previous.capture_size):
+            self.CAM_WIDTH, self.CAM_HEIGHT = profile.capture_size
+            grabber.set_resolution(*profile.capture_size)
+            if self.roi is not None:
+                self.roi.reset()
+            if self.flow is not None:
+                self.flow.reset()
+        task = None
+        if previous is None or profile.model_params != previous.model_params:
+            self.max_num_hands = profile.max_num_hands
+            self.model_complexity = profile.model_complexity
+            task = BackgroundTask(
+                self._create_models, self.max_num_hands, self.model_complexity, name="hands-model"
+            ).start()
+        self.metrics.count("profile_changes")
+        return task
+
+    def _load_backends(self):
+        self.session.controller.get_backends()
+        self.startup.mark("backends_ready")
+
+    def _first_frame(self):
+        """
+        Registra el primer frame procesado, imprime el resumen del arranque y
+        publica cada fase como métrica `startup_<fase>_ms`.
+        """
+        if "first_frame" in self.startup.phases:
+            return
+        self.startup.mark("first_frame")
+        print(f"Arranque: {self.startup.summary()}")
+        for name, seconds in list(self.startup.phases.items()):
+            self.metrics.gauge(f"startup_{name}_ms", round(1000 * seconds, 1))
+
+    def stop(self):
+        """Pide al bucle de `start` que termine tras el frame en curso."""
+        self.gc_mode = 0
+
+    def draw_overlay(self, image, results, gest_name_major, gest_name_minor):
+        """
+        Dibuja los landmarks de cada mano y el nombre del gesto reconocido sobre `image` (BGR).
+        """
+        session = self.session
+        mp_drawing, mp_hands = _drawing_modules()
+        for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
+            mp_drawing.draw_landmarks(
+                image, 
+                hand_landmarks, 
+                mp_hands.HAND_CONNECTIONS
+        )
+            # Extraer coordenadas del landmark (ejemplo: punto 9)
+            x = int(hand_landmarks.landmark[9].x * image.shape[1])
+            y = int(hand_landmarks.landmark[9].y * image.shape[0])
+
+            # Mostrar el gesto reconocido en pantalla
+            if hand_landmarks == session.hr_major:
+                cv2.putText(image, f"{gest_name_major.name}", (x, y - 20),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
+            elif hand_landmarks == session.hr_minor:
+                cv2.putText(image, f"{gest_name_minor.name}", (x, y - 20),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
+
+    def show_preview(self, image, results, gest_name_major, gest_name_minor):
+        """
+        Muestra la vista previa de un frame RGB con los landmarks y gestos dibujados.
+
+        Returns
+        -------
+        int
+            Tecla presionada (`cv2.waitKey`), -1 si ninguna.
+        """
+        metrics = self.metrics
+        with metrics.stage("draw"):
+            # Solo los frames que se muestran se pasan a BGR, en un buffer reutilizado
+            image = self.frames.preview(image)
+
+            if self.overlay and results.multi_hand_landmarks:
+                # Dibuja un marcador en la mano con el gesto reconocido
+                self.draw_overlay(image, results, gest_name_major, gest_name_minor)
+        
+        with metrics.stage("display"):
+            cv2.imshow(self.window_name, image)
+            return cv2.waitKey(1) & 0xFF
 
     def start(self):
         """
@@ -106,92 +435,306 @@ class GestureController:
         6. Ejecuta controles basados en los gestos
         7. Muestra el resultado visual
         """
-        handmajor = HandRecog(HLabel.MAJOR)
-        handminor = HandRecog(HLabel.MINOR)
+        if self.pipeline:
+            return self.start_pipeline()
 
-        last_frame_time = time.time()
+        session = self.session
+        controller = session.controller
+        metrics = self.metrics
+
+        # La captura corre en su propio hilo y solo conserva el frame más reciente
+        # Con `fast` se lee cada frame del archivo en este hilo, sin descartar ninguno
+        grabber = SequentialReader(self.source) if self.fast else FrameGrabber(self.source).start()
+        # Las acciones sobre el sistema se ejecutan fuera del bucle de visión
+        controller.dispatcher.start()
+
+        def on_idle_change(idle):
+            # En reposo se puede bajar la resolución de captura; al volver una mano se restaura
+            metrics.count("idle_transitions")
+            metrics.gauge("idle", int(idle))
+            if IDLE_CAPTURE_SIZE is not None:
+                if idle:
+                    grabber.set_resolution(*IDLE_CAPTURE_SIZE)
+                else:
+                    grabber.set_resolution(int(self.CAM_WIDTH), int(self.CAM_HEIGHT))
+                if self.roi is not None:
+                    self.roi.reset()
+            if self.flow is not None:
+                self.flow.reset()
+            if governor is not None:
+                # La carga en reposo no es representativa: se mide de nuevo al volver
+                governor.reset()
+
+        # Ritmo del bucle: `target_fps` con manos a la vista, IDLE_FPS en reposo
+        scheduler = FrameScheduler(self.target_fps, IDLE_FPS, IDLE_AFTER, on_change=on_idle_change)
+        governor = self.governor
+        model_task = None
+        processed_frames = 0
+        last_render_time = 0.0
+        preview_interval = 1 / self.preview_max_fps if self.preview_max_fps else 0.0
         
-        with mp_hands.Hands(
-            max_num_hands=MAX_NUM_HANDS,
-            min_detection_confidence=MIN_DETECTION_CONFIDENCE,
-            min_tracking_confidence=MIN_TRACKING_CONFIDENCE
-        ) as hands:
-            while GestureController.cap.isOpened() and GestureController.gc_mode:
-                current_time = time.time()
-                if current_time - last_frame_time < 1 / 15:  # Limitar a 15 FPS
-                    continue
-                last_frame_time = current_time
-                
+        hands = None
+        try:
+            # La cámara ya está abierta: solo se espera lo que falte del modelo
+            hands = self._hands_task.result()
+            while grabber.running and self.gc_mode:
+                # Dormir hasta el siguiente frame, sin espera activa
+                if not self.fast:
+                    scheduler.wait()
+                if model_task is not None and model_task.done():
+                    # El modelo del nuevo perfil está listo: se reemplaza el anterior
+                    previous, hands, model_task = hands, model_task.result(), None
+                    previous.close()
+            
                 # **Visión por Computadora**: Captura de la cámara y detección de manos
-                success, image = GestureController.cap.read()
+                with metrics.stage("capture"):
+                    success, frame, frame_time = grabber.read(timeout=CAPTURE_TIMEOUT)
 
                 if not success:
+                    metrics.count("empty_frames")
                     print("Ignorando frame vacío de la cámara.")
                     continue
-                
-                # Convertir la imagen a RGB para MediaPipe
-                image = cv2.cvtColor(cv2.flip(image, 1), cv2.COLOR_BGR2RGB)
+                if metrics.enabled and not self.fast:
+                    # Antigüedad del frame al empezar a procesarlo
+                    metrics.observe("frame_age", int((time.time() - frame_time) * 1e9))
+            
+                # Voltear y convertir a RGB para MediaPipe en una pasada, sobre un buffer reutilizado
+                with metrics.stage("convert"):
+                    image = self.frames.model_input(frame)
+                # Solo lectura: MediaPipe usa la imagen sin copiarla
                 image.flags.writeable = False
-                results = hands.process(image)
-                
-                # Convertir de vuelta a BGR para OpenCV
+                roi = self.roi
+                flow = self.flow
+                results = None
+                if flow is not None:
+                    # Entre detecciones, los landmarks del frame anterior se siguen con flujo óptico
+                    with metrics.stage("flow"):
+                        results = flow.track(image)
+                if results is None:
+                    if roi is not None:
+                        # Recorte alrededor de las manos del frame anterior
+                        with metrics.stage("roi"):
+                            model_input, roi_box = roi.prepare(image)
+                    else:
+                        model_input = image
+                    with metrics.stage("inference"):
+                        if roi is not None:
+                            # Recortes y frames completos van a modelos distintos
+                            results = hands.process(model_input, roi_box, image.shape)
+                        else:
+                            results = hands.process(model_input)
+                    if roi is not None:
+                        # Landmarks de vuelta a coordenadas del frame completo
+                        roi.finish(results, roi_box, image.shape)
+                    if flow is not None:
+                        flow.update(image, results)
+                elif roi is not None:
+                    # La región sigue a las manos también en los frames seguidos
+                    roi.finish(results, None, image.shape)
+                # El buffer se vuelve a escribir en el siguiente frame
                 image.flags.writeable = True
-                image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-
-                 # **Visión Artificial**: Uso de landmarks para reconocer gestos
-                if results.multi_hand_landmarks:                   
-                    GestureController.classify_hands(results)
-                    handmajor.update_hand_result(GestureController.hr_major)
-                    handminor.update_hand_result(GestureController.hr_minor)
-
-                    handmajor.set_finger_state()
-                    handminor.set_finger_state()                    
-                    
-                        # Reconocer gestos
-                    try:
-                        gest_name_major = Gest(handmajor.get_gesture())
-                    except ValueError:
-                        print(f"Gesto no reconocido (mano dominante): {handmajor.get_gesture()}")
-                        gest_name_major = Gest.UNKNOWN
-
-                    try:
-                        gest_name_minor = Gest(handminor.get_gesture())
-                    except ValueError:
-                        print(f"Gesto no reconocido (mano no dominante): {handminor.get_gesture()}")
-                        gest_name_minor = Gest.UNKNOWN
-
-                    # Dibuja un marcador en la mano con el gesto reconocido
-                    for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                        mp_drawing.draw_landmarks(
-                            image, 
-                            hand_landmarks, 
-                            mp_hands.HAND_CONNECTIONS
-                    )
-                        # Extraer coordenadas del landmark (ejemplo: punto 9)
-                        x = int(hand_landmarks.landmark[9].x * image.shape[1])
-                        y = int(hand_landmarks.landmark[9].y * image.shape[0])
-
-                        # Mostrar el gesto reconocido en pantalla
-                        if hand_landmarks == GestureController.hr_major:
-                            cv2.putText(image, f"{gest_name_major.name}", (x, y - 20),
-                                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 255, 0), 2)
-                        elif hand_landmarks == GestureController.hr_minor:
-                            cv2.putText(image, f"{gest_name_minor.name}", (x, y - 20),
-                                        cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 0, 0), 2)
-
-                    # Ejecutar controles basados en gestos
-                    if gest_name_major != Gest.UNKNOWN and gest_name_major != Gest.PALM:
-                        Controller.handle_controls(gest_name_major, handmajor.hand_result)
-                    
-                    # Limitamos las acciones para la mano no dominante a ciertos gestos
-                    # if gest_name_minor in [Gest.THREE_FINGER_SCROLL] and gest_name_minor != Gest.PALM:
-                    #     Controller.handle_controls(gest_name_minor, handminor.hand_result)
+                if roi is not None:
+                    metrics.gauge("roi_frames", roi.roi_frames)
+                    metrics.gauge("roi_full_frames", roi.full_frames)
+                    metrics.gauge("roi_tracking_resets", hands.resets)
+                if flow is not None:
+                    metrics.gauge("flow_tracked_frames", flow.tracked_frames)
+                    metrics.gauge("flow_drifts", flow.drifts)
+                if self.recorder is not None:
+                    self.recorder.write(frame_time, results)
+            
+                # En modo rápido el instante es el del archivo: no hay retardo que compensar
+                latency = 0.0 if self.fast else time.time() - frame_time
+                gest_name_major, gest_name_minor = session.process_results(results, frame_time, latency)
+                scheduler.update(bool(results.multi_hand_landmarks))
+                self._first_frame()
+                if governor is not None and not scheduler.idle:
+                    # Latencia hasta que las acciones del frame quedaron encoladas:
+                    # incluye el reconocimiento y los controles, no solo la inferencia
+                    latency = 0.0 if self.fast else time.time() - frame_time
+                    profile = governor.update(latency)
+                    if profile is not None:
+                        print(f"Perfil de rendimiento: {profile.name} (CPU {governor.cpu_usage:.0%}, "
+                              f"latencia {1000 * governor.latency:.0f} ms)")
+                        task = self.apply_profile(profile, grabber, scheduler)
+                        if task is not None:
+                            if model_task is not None:
+                                # Un modelo pedido antes y ya no necesario se cierra en su
+                                # propio hilo al terminar, sin detener el bucle
+                                close_when_done(model_task)
+                            model_task = task
+                        governor.reset()
+
+                # La vista previa se dibuja solo cada `preview_every_n` frames y sin
+                # superar `preview_max_fps`; en modo headless nunca.
+                render = False
+                if not self.headless:
+                    processed_frames += 1
+                    now = time.time()
+                    render = (processed_frames % self.preview_every_n == 0
+                              and now - last_render_time >= preview_interval)
+
+                key = -1
+                if render:
+                    last_render_time = now
+                    key = self.show_preview(image, results, gest_name_major, gest_name_minor)
                 else:
-                    Controller.prev_hand = None
-                    
-                cv2.imshow(WINDOW_NAME, image)
-                if cv2.waitKey(5) & 0xFF == 13:  # Presionar Enter para salir
+                    metrics.count("preview_skipped")
+
+                if metrics.enabled:
+                    metrics.gauge("frames_captured", grabber.frames_captured)
+                    metrics.gauge("frames_dropped", grabber.frames_dropped)
+                    metrics.gauge("actions_pending", controller.dispatcher.pending())
+                    metrics.gauge("actions_coalesced", controller.dispatcher.coalesced)
+                    metrics.gauge("actions_dropped", controller.dispatcher.dropped)
+                    metrics.gauge("handedness_flips", session.tracker.label_flips)
+                    metrics.gauge("frame_buffer_allocations", self.frames.pool.allocations)
+                    metrics.gauge("frame_buffer_bytes", self.frames.pool.nbytes)
+                    if self.events is not None:
+                        metrics.gauge("events_subscribers", self.events.subscribers)
+                        metrics.gauge("events_dropped", self.events.batches_dropped)
+                    if governor is not None:
+                        metrics.gauge("profile_level", governor.level)
+                        if governor.cpu_usage is not None:
+                            metrics.gauge("cpu_usage", round(governor.cpu_usage, 3))
+                metrics.tick()
+
+                if key == 13:  # Presionar Enter para salir
                     break
-                    
-        GestureController.cap.release()
-        cv2.destroyAllWindows()
+
+        except KeyboardInterrupt:
+            # En modo headless no hay ventana: se sale con Ctrl+C
+            pass
+
+        grabber.stop()
+        if hands is not None:
+            hands.close()
+        if model_task is not None:
+            model_task.result().close()
+        controller.dispatcher.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if self.events is not None:
+            self.events.stop()
+        self.source.release()
+        if not self.headless:
+            cv2.destroyAllWindows()
+
+    def start_pipeline(self):
+        """
+        Bucle principal en modo pipeline: la captura y `hands.process` corren en
+        procesos separados (ver `InferencePipeline`) y este proceso solo
+        reconoce gestos, ejecuta los controles y dibuja la vista previa.
+        """
+        from .pipeline import InferencePipeline
+
+        session = self.session
+        controller = session.controller
+        metrics = self.metrics
+        roi_params = None
+        if self.roi is not None:
+            roi = self.roi
+            roi_params = {"margin": roi.margin, "max_side": roi.max_side,
+                          "min_fraction": roi.min_fraction,
+                          "full_frame_interval": roi.full_frame_interval}
+
+        pipeline = InferencePipeline(
+            camera_index=self.source_spec,
+            max_frame_size=PIPELINE_MAX_FRAME_SIZE,
+            slots=PIPELINE_SLOTS,
+            workers=PIPELINE_WORKERS,
+            max_hands=self.max_num_hands,
+            min_detection_confidence=MIN_DETECTION_CONFIDENCE,
+            min_tracking_confidence=MIN_TRACKING_CONFIDENCE,
+            roi_params=roi_params,
+            fps=self.target_fps,
+            model_complexity=self.model_complexity,
+            capture_size=self.profile.capture_size if self.profile is not None else None,
+            read_failure_timeout=PIPELINE_READ_FAILURE_TIMEOUT
+        ).start()
+        controller.dispatcher.start()
+
+        def on_idle_change(idle):
+            # El ritmo lo marca el proceso de captura
+            metrics.count("idle_transitions")
+            metrics.gauge("idle", int(idle))
+            pipeline.set_fps(IDLE_FPS if idle else self.target_fps)
+
+        scheduler = FrameScheduler(self.target_fps, IDLE_FPS, IDLE_AFTER, on_change=on_idle_change)
+        processed_frames = 0
+        last_render_time = 0.0
+        preview_interval = 1 / self.preview_max_fps if self.preview_max_fps else 0.0
+
+        try:
+            while pipeline.running and self.gc_mode:
+                with metrics.stage("capture"):
+                    frame = pipeline.read(timeout=CAPTURE_TIMEOUT)
+                if frame is None:
+                    metrics.count("empty_frames")
+                    continue
+                try:
+                    frame_time = frame.timestamp
+                    if metrics.enabled:
+                        metrics.observe("frame_age", int((time.time() - frame_time) * 1e9))
+                        metrics.observe("inference", frame.inference_ns)
+                    results = results_from_frame(frame.record[0])
+                    if self.recorder is not None:
+                        self.recorder.write_record(frame.record)
+
+                    gest_name_major, gest_name_minor = session.process_results(
+                        results, frame_time, time.time() - frame_time
+                    )
+                    scheduler.update(bool(results.multi_hand_landmarks))
+                    self._first_frame()
+
+                    render = False
+                    if not self.headless:
+                        processed_frames += 1
+                        now = time.time()
+                        render = (processed_frames % self.preview_every_n == 0
+                                  and now - last_render_time >= preview_interval)
+                    key = -1
+                    if render:
+                        last_render_time = now
+                        key = self.show_preview(
+                            pipeline.image(frame), results, gest_name_major, gest_name_minor
+                        )
+                    else:
+                        metrics.count("preview_skipped")
+                finally:
+                    pipeline.release(frame)
+
+                if metrics.enabled:
+                    metrics.gauge("frames_captured", pipeline.frames_captured)
+                    metrics.gauge("frames_dropped", pipeline.frames_dropped)
+                    metrics.gauge("actions_pending", controller.dispatcher.pending())
+                    metrics.gauge("actions_coalesced", controller.dispatcher.coalesced)
+                    metrics.gauge("actions_dropped", controller.dispatcher.dropped)
+                    metrics.gauge("handedness_flips", session.tracker.label_flips)
+                    metrics.gauge("frame_buffer_allocations", self.frames.pool.allocations)
+                    metrics.gauge("frame_buffer_bytes", self.frames.pool.nbytes)
+                    if self.events is not None:
+                        metrics.gauge("events_subscribers", self.events.subscribers)
+                        metrics.gauge("events_dropped", self.events.batches_dropped)
+                metrics.tick()
+
+                if key == 13:  # Presionar Enter para salir
+                    break
+
+        except KeyboardInterrupt:
+            pass
+
+        if pipeline.error is not None:
+            print(f"Pipeline detenido: {pipeline.error}")
+        pipeline.stop()
+        controller.dispatcher.stop()
+        if self.recorder is not None:
+            self.recorder.close()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+        if self.events is not None:
+            self.events.stop()
+        if not self.headless:
+            cv2.destroyAllWindows()
@@ -0,0 +1,197 @@
+import numpy as np
+from .enums.gesture_enums import Gest
+
+
+class GestureDebouncer:
+    """
+    Confirma los cambios de gesto por tiempo en lugar de por número de frames.
+
+    Un gesto candidato distinto del confirmado acumula evidencia en cada frame en
+    que se repite: el tiempo transcurrido desde el frame anterior multiplicado por
+    la confianza de la detección. Se confirma cuando la evidencia alcanza el
+    tiempo de permanencia (`dwell`) de ese gesto; cualquier otro gesto intermedio
+    descarta al candidato. Así los clics, con permanencia corta, se confirman en
+    pocos frames sea cual sea la tasa de frames, y las transiciones ambiguas o con
+    baja confianza necesitan más tiempo.
+
+    Atributos
+    ----------
+    dwell : dict
+        tiempo de permanencia (s) de cada gesto.
+    default_dwell : float
+        tiempo de permanencia de los gestos sin valor en `dwell`.
+    max_step : float
+        evidencia máxima aportada por un solo frame, para que un frame tras una
+        pausa larga no confirme el gesto por sí solo.
+    min_confidence : float
+        peso mínimo de un frame, aunque la confianza informada sea menor.
+    committed : Gest
+        gesto confirmado.
+    last_commit_latency : float
+        segundos entre la primera aparición del último gesto confirmado y su confirmación.
+    just_committed : bool
+        True si la última llamada a `update` confirmó un gesto nuevo.
+    """
+
+    def __init__(self, dwell=None, default_dwell=0.2, max_step=0.1, min_confidence=0.25,
+                 initial=Gest.PALM):
+        self.dwell = dwell or {}
+        self.default_dwell = default_dwell
+        self.max_step = max_step
+        self.min_confidence = min_confidence
+        self.committed = initial
+        self.last_commit_latency = 0.0
+        self.just_committed = False
+        self._candidate = None
+        self._since = 0.0  # Primera aparición del candidato
+        self._last_time = None
+        self._evidence = 0.0
+
+    def reset(self, gesture=Gest.PALM):
+        """Confirma `gesture` y descarta cualquier candidato."""
+        self.committed = gesture
+        self.just_committed = False
+        self._candidate = None
+        self._last_time = None
+        self._evidence = 0.0
+
+    def update(self, gesture, t, confidence=1.0):
+        """
+        Registra el gesto observado en un frame.
+
+        Parameters
+        ----------
+        gesture : int
+            Gesto observado en el frame (sin confirmar).
+        t : float
+            Instante del frame, en segundos.
+        confidence : float, optional
+            Confianza de la detección entre 0 y 1 (por ejemplo, la puntuación
+            de lateralidad de MediaPipe).
+
+        Returns
+        -------
+        int
+            Gesto confirmado.
+        """
+        self.just_committed = False
+        last_time, self._last_time = self._last_time, t
+
+        if gesture == self.committed:
+            self._candidate = None
+            return self.committed
+
+        if gesture != self._candidate:
+            self._candidate = gesture
+            self._since = t
+            self._evidence = 0.0
+            # Un gesto con permanencia nula se confirma en el primer frame
+        elif last_time is not None:
+            step = min(max(t - last_time, 0.0), self.max_step)
+            self._evidence += step * min(max(confidence, self.min_confidence), 1.0)
+
+        if self._evidence >= self.dwell.get(gesture, self.default_dwell):
+            self.committed = gesture
+            self.last_commit_latency = t - self._since
+            self.just_committed = True
+            self._candidate = None
+        return self.committed
+
+    def update_batch(self, gestures, times, confidence=1.0):
+        """
+        Registra N frames seguidos; equivale exactamente a llamar a `update`
+        con cada uno y deja el mismo estado, por lo que un conjunto grande se
+        puede procesar por bloques.
+
+        En lugar de recorrer los frames se recorren los tramos de gesto
+        constante: la evidencia de cada tramo es una suma acumulada (en el mismo
+        orden que `update`) y la confirmación es el primer frame que alcanza el
+        tiempo de permanencia.
+
+        Parameters
+        ----------
+        gestures : ndarray
+            Gesto `(N,)` observado en cada frame.
+        times : ndarray
+            Instante `(N,)` de cada frame, en segundos.
+        confidence : float o ndarray, optional
+            Confianza de la detección, común o `(N,)` por frame.
+
+        Returns
+        -------
+        ndarray
+            Gesto confirmado `(N,)` int64 tras cada frame.
+        """
+        gestures = np.asarray(gestures, dtype=np.int64)
+        times = np.asarray(times, dtype=np.float64)
+        n = len(gestures)
+        committed_out = np.empty(n, dtype=np.int64)
+        self.just_committed = False
+        if n == 0:
+            return committed_out
+
+        # Evidencia que aporta cada frame si continúa el candidato del frame anterior
+        steps = np.empty(n, dtype=np.float64)
+        steps[1:] = np.diff(times)
+        steps[0] = times[0] - self._last_time if self._last_time is not None else 0.0
+        np.minimum(np.maximum(steps, 0.0), self.max_step, out=steps)
+        weights = np.minimum(np.maximum(np.broadcast_to(confidence, (n,)), self.min_confidence), 1.0)
+        evidence = steps * weights
+
+        starts = np.flatnonzero(np.diff(gestures)) + 1
+        bounds = np.concatenate(([0], starts, [n]))
+        committed = self.committed
+        for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            gesture = int(gestures[start])
+            if gesture == committed:
+                self._candidate = None
+                committed_out[start:end] = committed
+                continue
+
+            if start == 0 and gesture == self._candidate:
+                # El candidato viene del bloque anterior y este frame suma evidencia
+                first = self._evidence + evidence[0]
+            else:
+                self._candidate = gesture
+                self._since = float(times[start])
+                first = 0.0
+            run = evidence[start:end].copy()
+            run[0] = first
+            np.cumsum(run, out=run)
+
+            reached = np.flatnonzero(run >= self.dwell.get(gesture, self.default_dwell))
+            if len(reached) == 0:
+                self._evidence = float(run[-1])
+                committed_out[start:end] = committed
+                continue
+            k = int(reached[0])
+            self._evidence = float(run[k])
+            committed_out[start:start + k] = committed
+            committed = _as_gest(gesture)
+            committed_out[start + k:end] = committed
+            self.last_commit_latency = float(times[start + k]) - self._since
+            self._candidate = None
+            self.just_committed = start + k == n - 1
+
+        self.committed = committed
+        self._last_time = float(times[-1])
+        return committed_out
+
+
+def _as_gest(value):
+    """Convierte un entero en `Gest` si existe ese gesto."""
+    try:
+        return Gest(value)
+    except ValueError:
+        return value
+
+
+def dwell_from_config(dwell):
+    """Convierte un diccionario {nombre de gesto: segundos} en {Gest: segundos}."""
+    table = {}
+    for name, seconds in dwell.items():
+        try:
+            table[Gest[name]] = seconds
+        except KeyError:
+            raise ValueError(f"Gesto desconocido en la configuración: {name!r}")
+    return table
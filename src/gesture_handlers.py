@@ -1,17 +1,72 @@
-import pyautogui
-from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-from comtypes import CLSCTX_ALL
-from ctypes import cast, POINTER
-import screen_brightness_control as sbcontrol
+import math
+import threading
 from .enums.gesture_enums import Gest, HLabel
+from .action_dispatcher import ActionDispatcher
+from .system_backends import native_backends
+from .cursor_filters import make_filter
+from config.gestures import (
+    GESTURE_BINDINGS,
+    GESTURE_DWELL_MAX_STEP,
+    PINCH_STEP_INTERVAL,
+    PINCH_MODE,
+    PINCH_DEADZONE,
+    PINCH_VELOCITY_LEAD,
+    PINCH_SCROLL_RATE,
+    PINCH_SCROLL_QUANTUM,
+    PINCH_LEVEL_RATE,
+    PINCH_LEVEL_QUANTUM
+)
+from config.settings import (
+    CURSOR_FILTER,
+    CURSOR_GAIN,
+    CURSOR_PREDICTION_LEAD,
+    CURSOR_MOVE_DURATION,
+    ONE_EURO_MIN_CUTOFF,
+    ONE_EURO_BETA,
+    KALMAN_PROCESS_NOISE,
+    KALMAN_MEASUREMENT_NOISE
+)
+
+# Parámetros de cada filtro de cursor tomados de la configuración
+_FILTER_PARAMS = {
+    "legacy": {},
+    "one_euro": {"min_cutoff": ONE_EURO_MIN_CUTOFF, "beta": ONE_EURO_BETA, "gain": CURSOR_GAIN},
+    "kalman": {"process_noise": KALMAN_PROCESS_NOISE, "measurement_noise": KALMAN_MEASUREMENT_NOISE,
+               "gain": CURSOR_GAIN},
+}
+
+# Controles de la pinza en modo continuo: método de `Controller` -> (acción, signo respecto al desplazamiento)
+_RATE_CONTROLS = {
+    "scrollVertical": ("scroll", 1),
+    "scrollHorizontal": ("hscroll", -1),
+    "changesystemvolume": ("volume", 1),
+    "changesystembrightness": ("brightness", 1),
+}
+_SCROLL_ACTIONS = ("scroll", "hscroll")
+
+# Peso de la velocidad del último frame en la velocidad suavizada de la pinza
+_VELOCITY_SMOOTHING = 0.5
+
+
+def cursor_filter_from_settings(name=None):
+    """
+    Crea el filtro de cursor `name` (por defecto `CURSOR_FILTER`) con los
+    parámetros de la configuración.
+    """
+    name = CURSOR_FILTER if name is None else name
+    return make_filter(name, **_FILTER_PARAMS.get(name, {}))
 
 # Función para mover el cursor de manera segura
-def safe_move_to(x, y, duration=0.1):
+def safe_move_to(cursor, x, y, duration=0.1):
     """
     Mueve el cursor asegurándose de que no salga de los límites de la pantalla.
+
+    Usa el backend de cursor del controlador, que guarda en caché el tamaño de la pantalla.
     
     Parameters:
     -----------
+    cursor : CursorBackend
+        Backend de cursor del controlador.
     x : int
         Coordenada X a la que se moverá el cursor.
     y : int
@@ -20,14 +75,14 @@ def safe_move_to(x, y, duration=0.1):
         Duración del movimiento, en segundos (por defecto 0.1).
     """
     # Obtener el tamaño de la pantalla
-    screen_width, screen_height = pyautogui.size()
+    screen_width, screen_height = cursor.size()
 
     # Limitar las coordenadas dentro de los bordes de la pantalla
     x = min(max(0, x), screen_width - 1)
     y = min(max(0, y), screen_height - 1)
 
     # Mover el cursor a las coordenadas ajustadas
-    pyautogui.moveTo(x, y, duration=duration)
+    cursor.move_to(x, y, duration=duration)
     
 class Controller:
     """
@@ -41,12 +96,6 @@ class Controller:
         Coordenada Y anterior del cursor.
     flag : bool
         Indica si se ha detectado el gesto en "V".
-    grabflag : bool
-        Indica si se ha detectado el gesto "puño cerrado" (FIST).
-    pinchmajorflag : bool
-        Indica si se ha detectado el gesto "pinza" con la mano principal.
-    pinchminorflag : bool
-        Indica si se ha detectado el gesto "pinza" con la mano secundaria.
     pinchstartxcoord : int
         Coordenada X inicial al comenzar el gesto de pinza.
     pinchstartycoord : int
@@ -57,84 +106,188 @@ class Controller:
         Desplazamiento previo cuantificado del gesto de pinza desde la posición inicial.
     pinchlv : int
         Desplazamiento actual cuantificado del gesto de pinza desde la posición inicial.
-    framecount : int
-        Número de frames desde que se actualizó `pinchlv`.
+    pinch_stable_time : float
+        Segundos que el desplazamiento de pinza lleva estable desde el último paso o cambio.
+    pinch_last_time : float
+        Instante del frame anterior con el gesto de pinza.
+    pinch_step_interval : float
+        Segundos de pinza estable necesarios para aplicar un paso de `pinchlv`.
     prev_hand : tuple
-        Coordenadas (x, y) de la mano en el frame anterior.
+        Coordenadas (x, y) de la mano en el frame anterior, None si se perdió la mano.
     pinch_threshold : float
         Tamaño del paso para cuantificar `pinchlv`.
+    pinch_mode : str
+        'continuous' (ritmo proporcional al desplazamiento, en cada frame) o
+        'step' (pasos fijos cada `pinch_step_interval`), ver `PINCH_MODE`.
+    pinch_deadzone : float
+        Desplazamiento sin efecto en modo continuo.
+    pinch_velocity : float
+        Velocidad suavizada del desplazamiento de pinza, en unidades de `pinchlv` por segundo.
+    dispatcher : ActionDispatcher
+        Ejecuta las acciones sobre el sistema fuera del bucle de visión.
+    backends : SystemBackends
+        Backends de cursor, scroll, volumen y brillo. Se crean los nativos
+        la primera vez que se usan si no se asignaron con `set_backends`.
+    cursor_filter : CursorFilter
+        filtro que suaviza y predice la posición de la mano antes de mover el cursor.
+    prev_filtered : tuple
+        Salida del filtro de cursor en el frame anterior.
+    cursor_target : tuple
+        Último destino del cursor enviado al despachador, origen del movimiento
+        del frame siguiente. None para partir de la posición real del cursor.
+    frame_time : float
+        Instante de captura del frame en proceso.
+    frame_latency : float
+        Segundos transcurridos entre la captura del frame y su procesamiento.
+    prediction_lead : float
+        Segundos extra que se adelanta la predicción del cursor.
+    handlers : dict
+        Manejador (`GestureHandler`) de cada gesto, creado a partir de `GESTURE_BINDINGS`.
+    active_gesture : Gest
+        Gesto cuyo manejador está activo.
+    active_handler : GestureHandler
+        Manejador del gesto activo.
+    events : EventPublisher
+        publica el destino del cursor y la pinza de cada frame, None si está desactivado.
     """
 
-    tx_old = 0
-    ty_old = 0
-    trial = True
-    flag = False
-    grabflag = False
-    scrollflag= False
-    pinchmajorflag = False
-    pinchminorflag = False
-    pinchstartxcoord = None
-    pinchstartycoord = None
-    pinchdirectionflag = None
-    prevpinchlv = 0
-    pinchlv = 0
-    framecount = 0
-    prev_hand = None
-    pinch_threshold = 0.3
+    def __init__(self, backends=None, cursor_filter=None, handlers=None, dispatcher=None, events=None,
+                 pinch_mode=None):
+        """
+        Parameters
+        ----------
+        backends : SystemBackends, optional
+            Backends de sistema. Por defecto se crean los nativos al primer uso.
+        cursor_filter : CursorFilter, optional
+            Filtro de cursor. Por defecto el indicado en `CURSOR_FILTER`.
+        handlers : dict, optional
+            Manejador de cada gesto. Por defecto se crean a partir de `GESTURE_BINDINGS`.
+        dispatcher : ActionDispatcher, optional
+            Ejecutor de acciones. Por defecto uno nuevo, propio de este controlador.
+        events : EventPublisher, optional
+            Publicador de eventos para otras aplicaciones (ver `src.event_stream`).
+        pinch_mode : str, optional
+            'continuous' o 'step'. Por defecto `PINCH_MODE`.
+        """
+        self.tx_old = 0
+        self.ty_old = 0
+        self.trial = True
+        self.flag = False
+        self.pinchstartxcoord = None
+        self.pinchstartycoord = None
+        self.pinchdirectionflag = None
+        self.prevpinchlv = 0
+        self.pinchlv = 0
+        self.pinch_stable_time = 0.0
+        self.pinch_last_time = None
+        self.pinch_step_interval = PINCH_STEP_INTERVAL
+        self.prev_hand = None
+        self.pinch_threshold = 0.3
+        self.pinch_mode = PINCH_MODE if pinch_mode is None else pinch_mode
+        if self.pinch_mode not in ("continuous", "step"):
+            raise ValueError(f"Modo de pinza desconocido: {self.pinch_mode!r} (use 'continuous' o 'step')")
+        self.pinch_deadzone = PINCH_DEADZONE
+        self.pinch_velocity = 0.0
+        self._pinch_prev_lv = None
+        self._pinch_remainder = {}
+        self._pinch_pending = {}
+        self._pinch_steps = {}  # Valores de `pinchlv` de los pasos aún no aplicados, por control
+        self._pinch_lock = threading.Lock()
+        self.dispatcher = dispatcher if dispatcher is not None else ActionDispatcher()
+        self.backends = backends
+        self._backends_lock = threading.Lock()
+        self.cursor_filter = cursor_filter if cursor_filter is not None else cursor_filter_from_settings()
+        self.prev_filtered = None
+        self.cursor_target = None
+        self._cursor_moved = False
+        self.frame_time = 0.0
+        self.frame_latency = 0.0
+        self.prediction_lead = CURSOR_PREDICTION_LEAD
+        self.events = events
+        self.set_handlers(handlers if handlers is not None else build_handlers(GESTURE_BINDINGS))
+
+    def set_backends(self, backends):
+        """Asigna los backends de sistema (por ejemplo, `recording_backends()` en pruebas o reproducción)."""
+        self.backends = backends
+
+    def get_backends(self):
+        """
+        Devuelve los backends de sistema, creando los nativos si aún no existen.
+
+        Se puede llamar desde varios hilos (el arranque los crea en segundo plano
+        mientras el despachador puede estar pidiéndolos); se crean una sola vez.
+        """
+        backends = self.backends
+        if backends is None:
+            with self._backends_lock:
+                if self.backends is None:
+                    self.backends = native_backends()
+                backends = self.backends
+        return backends
+
+    def set_cursor_filter(self, cursor_filter):
+        """Asigna el filtro de cursor (ver `src.cursor_filters`)."""
+        self.cursor_filter = cursor_filter
+        self.prev_hand = None
+
+    def set_frame_time(self, frame_time, latency=0.0):
+        """
+        Informa el instante de captura del frame en proceso y su latencia, que el
+        filtro de cursor usa para adelantar la predicción.
+        """
+        self.frame_time = frame_time
+        self.frame_latency = latency
     
-    def getpinchylv(hand_result):
+    def getpinchylv(self, hand_result):
         """Devuelve la distancia en el eje Y entre el inicio del gesto de pinza y la posición actual."""
-        dist = round((Controller.pinchstartycoord - hand_result.landmark[8].y) * 10, 1)
+        dist = round((self.pinchstartycoord - hand_result.landmark[8].y) * 10, 1)
         return dist
 
-    def getpinchxlv(hand_result):
+    def getpinchxlv(self, hand_result):
         """Devuelve la distancia en el eje X entre el inicio del gesto de pinza y la posición actual."""
-        dist = round((hand_result.landmark[8].x - Controller.pinchstartxcoord) * 10, 1)
+        dist = round((hand_result.landmark[8].x - self.pinchstartxcoord) * 10, 1)
         return dist
     
-    def changesystembrightness():
+    def changesystembrightness(self, pinchlv):
         """**Visión Artificial**: Control del brillo basado en gestos."""
-        """Ajusta el brillo del sistema según el valor de `Controller.pinchlv`."""
-        currentBrightnessLv = sbcontrol.get_brightness(display=0) / 100.0
-        currentBrightnessLv += Controller.pinchlv / 50.0
-        if currentBrightnessLv > 1.0:
-            currentBrightnessLv = 1.0
-        elif currentBrightnessLv < 0.0:
-            currentBrightnessLv = 0.0       
-        sbcontrol.fade_brightness(int(100 * currentBrightnessLv), start=sbcontrol.get_brightness(display=0))
+        """Ajusta el brillo del sistema según el desplazamiento de pinza `pinchlv`."""
+        self.change_level("brightness", pinchlv / 50.0)
     
-    def changesystemvolume():
+    def changesystemvolume(self, pinchlv):
         """**Visión Artificial**: Ajuste del volumen según gestos."""
-        """Ajusta el volumen del sistema según el valor de `Controller.pinchlv`."""
-        devices = AudioUtilities.GetSpeakers()
-        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-        volume = cast(interface, POINTER(IAudioEndpointVolume))
-        currentVolumeLv = volume.GetMasterVolumeLevelScalar()
-        currentVolumeLv += Controller.pinchlv / 50.0
-        if currentVolumeLv > 1.0:
-            currentVolumeLv = 1.0
-        elif currentVolumeLv < 0.0:
-            currentVolumeLv = 0.0
-        volume.SetMasterVolumeLevelScalar(currentVolumeLv, None)
+        """Ajusta el volumen del sistema según el desplazamiento de pinza `pinchlv`."""
+        self.change_level("volume", pinchlv / 50.0)
+
+    def change_level(self, name, delta):
+        """
+        Suma `delta` al nivel `name` ('volume' o 'brightness'), limitado a [0.0, 1.0].
+        """
+        backend = getattr(self.get_backends(), name)
+        level = backend.get_level() + delta
+        if level > 1.0:
+            level = 1.0
+        elif level < 0.0:
+            level = 0.0
+        backend.set_level(level)
     
-    def scrollVertical():
+    def scrollVertical(self, pinchlv):
         """Realiza un desplazamiento vertical en pantalla."""
-        pyautogui.scroll(120 if Controller.pinchlv > 0.0 else -120)
+        self.get_backends().scroll.scroll(120 if pinchlv > 0.0 else -120)
         
-    def scrollHorizontal():
+    def scrollHorizontal(self, pinchlv):
         """Realiza un desplazamiento horizontal en pantalla."""
-        pyautogui.keyDown('shift')
-        #pyautogui.keyDown('ctrl')
-        pyautogui.scroll(-120 if Controller.pinchlv > 0.0 else 120)
-        #pyautogui.keyUp('ctrl')
-        pyautogui.keyUp('shift')
+        self.get_backends().scroll.hscroll(-120 if pinchlv > 0.0 else 120)
 
-    def get_position(hand_result):
+    def get_position(self, hand_result):
         """
         Devuelve las coordenadas actuales de la posición de la mano.
 
-        Localiza la mano para obtener la posición del cursor y estabiliza el cursor
-        suavizando movimientos bruscos.
+        Localiza la mano (landmark 9) y la pasa por `cursor_filter`, que la suaviza
+        y predice su posición `frame_latency + prediction_lead` segundos más tarde
+        para compensar el retardo del pipeline. El cursor se desplaza lo mismo que
+        la salida del filtro, multiplicado por su ganancia, a partir del último
+        destino enviado (los movimientos encolados aún pueden no haberse
+        ejecutado) o, si el cursor no se estaba moviendo, de su posición real.
 
         Returns
         -------
@@ -142,40 +295,65 @@ class Controller:
         """
         point = 9
         position = [hand_result.landmark[point].x, hand_result.landmark[point].y]
-        sx, sy = pyautogui.size()
-        x_old, y_old = pyautogui.position()
+        cursor = self.get_backends().cursor
+        cursor_filter = self.cursor_filter
+        sx, sy = cursor.size()
         x = int(position[0] * sx)
         y = int(position[1] * sy)
-        if Controller.prev_hand is None:
-            Controller.prev_hand = x, y
-        delta_x = x - Controller.prev_hand[0]
-        delta_y = y - Controller.prev_hand[1]
-
-        distsq = delta_x**2 + delta_y**2
-        ratio = 1
-        Controller.prev_hand = [x, y]
-
-        if distsq <= 25:
-            ratio = 0
-        elif distsq <= 900:
-            ratio = 0.07 * (distsq ** (1 / 2))
+        if self.prev_hand is None:
+            # La mano acaba de aparecer: el filtro empieza de cero y el cursor no salta
+            cursor_filter.reset()
+            self.prev_filtered = None
+            self.cursor_target = None
+        self.prev_hand = [x, y]
+        if self.cursor_target is not None:
+            x_old, y_old = self.cursor_target
         else:
-            ratio = 2.1
-        x, y = x_old + delta_x * ratio, y_old + delta_y * ratio
-        return (x, y)
+            x_old, y_old = cursor.position()
 
-    def pinch_control_init(hand_result):
+        lead = self.frame_latency + self.prediction_lead
+        fx, fy = cursor_filter.update(x, y, self.frame_time, lead)
+        if self.prev_filtered is None:
+            self.prev_filtered = fx, fy
+        delta_x = fx - self.prev_filtered[0]
+        delta_y = fy - self.prev_filtered[1]
+        self.prev_filtered = fx, fy
+        gain = cursor_filter.gain
+        return (x_old + delta_x * gain, y_old + delta_y * gain)
+
+    def move_cursor(self, position):
+        """
+        Encola el movimiento del cursor a `position` y lo guarda como origen del
+        siguiente movimiento, ya limitado a la pantalla como en `safe_move_to`.
+        """
+        cursor = self.get_backends().cursor
+        screen_width, screen_height = cursor.size()
+        x = min(max(0, position[0]), screen_width - 1)
+        y = min(max(0, position[1]), screen_height - 1)
+        self.cursor_target = (x, y)
+        self._cursor_moved = True
+        self.dispatcher.submit("move", safe_move_to, cursor, x, y, CURSOR_MOVE_DURATION, coalesce=True)
+
+    def pinch_control_init(self, hand_result):
         """Inicializa los atributos para el gesto de pinza."""
-        Controller.pinchstartxcoord = hand_result.landmark[8].x
-        Controller.pinchstartycoord = hand_result.landmark[8].y
-        Controller.pinchlv = 0
-        Controller.prevpinchlv = 0
-        Controller.framecount = 0
+        self.pinchstartxcoord = hand_result.landmark[8].x
+        self.pinchstartycoord = hand_result.landmark[8].y
+        self.pinchlv = 0
+        self.prevpinchlv = 0
+        self.pinch_stable_time = 0.0
+        self.pinch_last_time = self.frame_time
+        self.pinch_velocity = 0.0
+        self._pinch_prev_lv = None
+        self._pinch_remainder.clear()
 
-    def pinch_control(hand_result, controlHorizontal, controlVertical):
+    def pinch_control(self, hand_result, controlHorizontal, controlVertical):
         """
         Llama a `controlHorizontal` o `controlVertical` según el movimiento del gesto de pinza.
 
+        Cada paso se guarda con el valor actual de `pinchlv` y se encola en
+        `self.dispatcher` (ver `apply_pinch_steps`); si el despacho va atrasado,
+        los pasos pendientes del mismo control se aplican juntos, sin perder ninguno.
+
         Parameters
         ----------
         hand_result : Object
@@ -183,100 +361,334 @@ class Controller:
         controlHorizontal : función de callback para gestos horizontales.
         controlVertical : función de callback para gestos verticales.
         """
-        if Controller.framecount == 5:
-            Controller.framecount = 0
-            Controller.pinchlv = Controller.prevpinchlv
+        if self.pinch_mode == "continuous":
+            self.pinch_rate_control(hand_result, controlHorizontal, controlVertical)
+            return
 
-            if Controller.pinchdirectionflag:
-                controlHorizontal()  # Eje X
+        # El paso se aplica tras `pinch_step_interval` segundos estables, no tras
+        # un número fijo de frames, y se repite con ese intervalo mientras se mantiene
+        now = self.frame_time
+        if self.pinch_last_time is not None:
+            # Tras una pausa larga un solo frame no completa el intervalo
+            step = min(max(now - self.pinch_last_time, 0.0), GESTURE_DWELL_MAX_STEP)
+        else:
+            step = 0.0
+        self.pinch_last_time = now
+
+        if self.pinch_stable_time >= self.pinch_step_interval:
+            self.pinch_stable_time = 0.0
+            self.pinchlv = self.prevpinchlv
+
+            if self.pinchdirectionflag:
+                control = controlHorizontal  # Eje X
             else:
-                controlVertical()  # Eje Y
+                control = controlVertical  # Eje Y
+            with self._pinch_lock:
+                self._pinch_steps.setdefault(control, []).append(self.pinchlv)
+            self.dispatcher.submit(control, self.apply_pinch_steps, control, coalesce=True)
 
-        lvx = Controller.getpinchxlv(hand_result)
-        lvy = Controller.getpinchylv(hand_result)
+        lvx = self.getpinchxlv(hand_result)
+        lvy = self.getpinchylv(hand_result)
             
-        if abs(lvy) > abs(lvx) and abs(lvy) > Controller.pinch_threshold:
-            Controller.pinchdirectionflag = False
-            if abs(Controller.prevpinchlv - lvy) < Controller.pinch_threshold:
-                Controller.framecount += 1
+        if abs(lvy) > abs(lvx) and abs(lvy) > self.pinch_threshold:
+            self.pinchdirectionflag = False
+            if abs(self.prevpinchlv - lvy) < self.pinch_threshold:
+                self.pinch_stable_time += step
             else:
-                Controller.prevpinchlv = lvy
-                Controller.framecount = 0
+                self.prevpinchlv = lvy
+                self.pinch_stable_time = 0.0
 
-        elif abs(lvx) > Controller.pinch_threshold:
-            Controller.pinchdirectionflag = True
-            if abs(Controller.prevpinchlv - lvx) < Controller.pinch_threshold:
-                Controller.framecount += 1
+        elif abs(lvx) > self.pinch_threshold:
+            self.pinchdirectionflag = True
+            if abs(self.prevpinchlv - lvx) < self.pinch_threshold:
+                self.pinch_stable_time += step
             else:
-                Controller.prevpinchlv = lvx
-                Controller.framecount = 0
+                self.prevpinchlv = lvx
+                self.pinch_stable_time = 0.0
 
-    def handle_controls(gesture, hand_result):  
-        """Implementa la funcionalidad para todos los gestos detectados."""     
-        x, y = None, None
-        
+        events = self.events
+        if events is not None and self.pinchdirectionflag is not None:
+            if self.pinchdirectionflag:
+                events.pinch(controlHorizontal.__name__, lvx, self.pinchlv, now)
+            else:
+                events.pinch(controlVertical.__name__, lvy, self.pinchlv, now)
+
+    def pinch_rate_control(self, hand_result, controlHorizontal, controlVertical):
+        """
+        Modo continuo de `pinch_control`: en cada frame ajusta el control del eje
+        dominante a un ritmo proporcional al desplazamiento fuera de la zona
+        muerta, más la velocidad con que la mano se aleja del inicio (así
+        responde desde el primer movimiento, sin esperar a que la pinza se
+        estabilice).
+
+        Lo aplicado en cada frame (ritmo por segundos desde el frame anterior)
+        se acumula por control y solo se envía en múltiplos de
+        `PINCH_SCROLL_QUANTUM` o `PINCH_LEVEL_QUANTUM`; el resto queda para los
+        frames siguientes. Los envíos pendientes del mismo control se suman en
+        una sola llamada al sistema (ver `apply_pinch_pending`).
+        """
+        now = self.frame_time
+        if self.pinch_last_time is not None:
+            step = min(max(now - self.pinch_last_time, 0.0), GESTURE_DWELL_MAX_STEP)
+        else:
+            step = 0.0
+        self.pinch_last_time = now
+
+        tip = hand_result.landmark[8]
+        lvx = (tip.x - self.pinchstartxcoord) * 10
+        lvy = (self.pinchstartycoord - tip.y) * 10
+        horizontal = abs(lvx) > abs(lvy)
+        lv = lvx if horizontal else lvy
+        control = controlHorizontal if horizontal else controlVertical
+
+        # Velocidad suavizada a lo largo del eje; se reinicia al cambiar de eje
+        if step > 0.0 and self._pinch_prev_lv is not None and horizontal == self.pinchdirectionflag:
+            velocity = (lv - self._pinch_prev_lv) / step
+            self.pinch_velocity += _VELOCITY_SMOOTHING * (velocity - self.pinch_velocity)
+        else:
+            self.pinch_velocity = 0.0
+        self._pinch_prev_lv = lv
+        self.pinchdirectionflag = horizontal
+        self.pinchlv = lv
+
+        applied = 0.0
+        excess = abs(lv) - self.pinch_deadzone
+        if excess > 0.0 and step > 0.0:
+            direction = 1.0 if lv > 0.0 else -1.0
+            # Solo acelera el movimiento hacia afuera; volver hacia el inicio frena sin invertir
+            outward = max(self.pinch_velocity * direction, 0.0)
+            rate = excess + PINCH_VELOCITY_LEAD * outward
+            applied = self._accumulate_pinch(control.__name__, direction * rate * step)
+
+        events = self.events
+        if events is not None:
+            events.pinch(control.__name__, lv, applied, now)
+
+    def _accumulate_pinch(self, name, amount):
+        """
+        Suma `amount` (desplazamiento × segundos) al control `name` y encola la
+        parte que completa un múltiplo del cuanto del control.
+
+        Returns
+        -------
+        float
+            Cantidad encolada (unidades de scroll o fracción de nivel), 0.0 si ninguna.
+        """
+        action, _ = _RATE_CONTROLS[name]
+        if action in _SCROLL_ACTIONS:
+            rate, quantum = PINCH_SCROLL_RATE, PINCH_SCROLL_QUANTUM
+        else:
+            rate, quantum = PINCH_LEVEL_RATE, PINCH_LEVEL_QUANTUM
+        total = self._pinch_remainder.get(name, 0.0) + amount * rate
+        steps = math.trunc(total / quantum)
+        self._pinch_remainder[name] = total - steps * quantum
+        if steps == 0:
+            return 0.0
+        value = steps * quantum
+        with self._pinch_lock:
+            self._pinch_pending[name] = self._pinch_pending.get(name, 0.0) + value
+        self.dispatcher.submit(name, self.apply_pinch_pending, name, coalesce=True)
+        return value
+
+    def apply_pinch_pending(self, name):
+        """
+        Aplica en una sola llamada todo lo acumulado para el control `name` en
+        modo continuo. Se ejecuta en el hilo de despacho; si varias llamadas
+        quedaron encoladas, la primera aplica el total y las demás no hacen nada.
+        """
+        with self._pinch_lock:
+            value = self._pinch_pending.pop(name, 0.0)
+        if not value:
+            return
+        action, sign = _RATE_CONTROLS[name]
+        if action == "scroll":
+            self.get_backends().scroll.scroll(sign * int(round(value)))
+        elif action == "hscroll":
+            self.get_backends().scroll.hscroll(sign * int(round(value)))
+        else:
+            self.change_level(action, sign * value)
+
+    def apply_pinch_steps(self, control):
+        """
+        Aplica, en orden, todos los pasos pendientes de `control` en modo 'step'.
+        Se ejecuta en el hilo de despacho; si varias llamadas quedaron encoladas,
+        la primera aplica todos los pasos y las demás no hacen nada.
+        """
+        with self._pinch_lock:
+            steps = self._pinch_steps.pop(control, ())
+        for pinchlv in steps:
+            control(pinchlv)
+
+    def set_handlers(self, handlers):
+        """Asigna el manejador de cada gesto (ver `build_handlers`)."""
+        self.handlers = handlers
+        self.active_gesture = None
+        self.active_handler = NULL_HANDLER
+
+    def handle_controls(self, gesture, hand_result):
+        """
+        Implementa la funcionalidad para todos los gestos detectados.
+
+        Al cambiar de gesto se llama a `exit` del manejador anterior y a `enter`
+        del nuevo; en cada frame, a `update` del manejador activo. Los gestos sin
+        manejador solo cierran el anterior.
+        """
         # Manejo de gestos desconocidos
         if gesture == Gest.UNKNOWN:
             print("Gestión de gestos desconocidos omitida.")
             return
-    
+
+        position = None
         if gesture != Gest.PALM:
-            x, y = Controller.get_position(hand_result)
-        
-        # Reinicio de banderas
-        if gesture != Gest.FIST and Controller.grabflag:
-            Controller.grabflag = False
-            pyautogui.mouseUp(button="left")
+            position = self.get_position(hand_result)
+            if self.events is not None:
+                self.events.cursor(position[0], position[1], self.frame_time)
 
-        if gesture != Gest.PINCH_MAJOR and Controller.pinchmajorflag:
-            Controller.pinchmajorflag = False
-        
-        if gesture != Gest.THREE_FINGER_SCROLL and Controller.scrollflag:
-            Controller.scrollflag = False
+        self._cursor_moved = False
+        if gesture != self.active_gesture:
+            self.active_handler.exit(self)
+            self.active_gesture = gesture
+            self.active_handler = self.handlers.get(gesture, NULL_HANDLER)
+            self.active_handler.enter(self, hand_result)
+        self.active_handler.update(self, hand_result, position)
+        if not self._cursor_moved:
+            # El cursor quedó libre: el próximo movimiento parte de su posición
+            # real, que el usuario pudo cambiar con el ratón
+            self.cursor_target = None
 
 
-        # if gesture != Gest.PINCH_MINOR and Controller.pinchminorflag:
-        #     Controller.pinchminorflag = False
+class GestureHandler:
+    """
+    Acción asociada a un gesto. Las acciones sobre el sistema se encolan en
+    el `dispatcher` del controlador.
 
-        # Implementación de gestos
-        if gesture == Gest.V_GEST:
-            Controller.flag = True
-            safe_move_to(x, y, duration=0.1)
+    `enter` se llama en el primer frame del gesto, `update` en cada frame
+    (incluido el primero) con la posición del cursor y `exit` cuando la mano
+    pasa a otro gesto. Los manejadores no guardan estado: el estado es del
+    `Controller` que los llama, por lo que pueden compartirse entre controladores.
+    """
 
-        elif gesture == Gest.FIST:
-            if not Controller.grabflag: 
-                Controller.grabflag = True
-                pyautogui.mouseDown(button="left")
-            safe_move_to(x, y, duration=0.1)
+    def enter(self, controller, hand_result):
+        pass
 
-        elif gesture == Gest.MID and Controller.flag:
-            pyautogui.click()
-            Controller.flag = False
+    def update(self, controller, hand_result, position):
+        pass
 
-        elif gesture == Gest.INDEX and Controller.flag:
-            pyautogui.click(button='right')
-            Controller.flag = False
+    def exit(self, controller):
+        pass
 
-        elif gesture == Gest.TWO_FINGER_CLOSED and Controller.flag:
-            pyautogui.doubleClick()
-            Controller.flag = False
 
-        # elif gesture == Gest.PINCH_MINOR:
-        #     if not Controller.pinchminorflag:
-        #         Controller.pinch_control_init(hand_result)
-        #         Controller.pinchminorflag = True
-        #     Controller.pinch_control(hand_result, Controller.scrollHorizontal, Controller.scrollVertical)
-        
-        elif gesture == Gest.THREE_FINGER_SCROLL:
-            if not Controller.scrollflag:  
-                Controller.pinch_control_init(hand_result)
-                Controller.scrollflag = True
-            Controller.pinch_control(hand_result, Controller.scrollHorizontal, Controller.scrollVertical)
+class MoveHandler(GestureHandler):
+    """Mueve el cursor y habilita los clics (gesto en V)."""
 
-        
-        elif gesture == Gest.PINCH_MAJOR:
-            if not Controller.pinchmajorflag:
-                Controller.pinch_control_init(hand_result)
-                Controller.pinchmajorflag = True
-            Controller.pinch_control(hand_result, Controller.changesystembrightness, Controller.changesystemvolume)
-            
+    def update(self, controller, hand_result, position):
+        controller.flag = True
+        controller.move_cursor(position)
+
+
+class DragHandler(GestureHandler):
+    """Presiona el botón izquierdo al entrar, mueve el cursor y lo suelta al salir."""
+
+    def enter(self, controller, hand_result):
+        cursor = controller.get_backends().cursor
+        controller.dispatcher.submit("mouse_down", cursor.mouse_down, "left")
+
+    def update(self, controller, hand_result, position):
+        controller.move_cursor(position)
+
+    def exit(self, controller):
+        cursor = controller.get_backends().cursor
+        controller.dispatcher.submit("mouse_up", cursor.mouse_up, "left")
+
+
+class ClickHandler(GestureHandler):
+    """
+    Ejecuta un clic si antes se hizo el gesto en V, y lo deshabilita hasta la siguiente V.
+
+    Parameters
+    ----------
+    key : str
+        Clave de la acción en el `dispatcher` del controlador.
+    method : str
+        Método del backend de cursor ('click' o 'double_click').
+    *args :
+        Argumentos del método, por ejemplo el botón.
+    """
+
+    def __init__(self, key, method, *args):
+        self.key = key
+        self.method = method
+        self.args = args
+
+    def update(self, controller, hand_result, position):
+        if controller.flag:
+            cursor = controller.get_backends().cursor
+            controller.dispatcher.submit(self.key, getattr(cursor, self.method), *self.args)
+            controller.flag = False
+
+
+class PinchHandler(GestureHandler):
+    """
+    Ajusta un control continuo según el desplazamiento de la mano desde el
+    inicio del gesto (ver `Controller.pinch_control`).
+
+    Parameters
+    ----------
+    control_horizontal : str
+        Método de `Controller` para el desplazamiento horizontal.
+    control_vertical : str
+        Método de `Controller` para el desplazamiento vertical.
+    """
+
+    def __init__(self, control_horizontal, control_vertical):
+        self.control_horizontal = control_horizontal
+        self.control_vertical = control_vertical
+
+    def enter(self, controller, hand_result):
+        controller.pinch_control_init(hand_result)
+
+    def update(self, controller, hand_result, position):
+        controller.pinch_control(hand_result, getattr(controller, self.control_horizontal),
+                                 getattr(controller, self.control_vertical))
+
+
+NULL_HANDLER = GestureHandler()
+
+# Acciones que se pueden asociar a un gesto en `GESTURE_BINDINGS`
+HANDLER_TYPES = {
+    "move": MoveHandler,
+    "drag": DragHandler,
+    "left_click": lambda: ClickHandler("click", "click", "left"),
+    "right_click": lambda: ClickHandler("right_click", "click", "right"),
+    "double_click": lambda: ClickHandler("double_click", "double_click"),
+    "scroll": lambda: PinchHandler("scrollHorizontal", "scrollVertical"),
+    "levels": lambda: PinchHandler("changesystembrightness", "changesystemvolume"),
+}
+
+
+def build_handlers(bindings):
+    """
+    Crea el manejador de cada gesto a partir de una configuración declarativa.
+
+    Parameters
+    ----------
+    bindings : dict
+        Nombre del gesto en `Gest` -> nombre de la acción en `HANDLER_TYPES`.
+
+    Returns
+    -------
+    dict
+        `Gest` -> `GestureHandler`.
+    """
+    handlers = {}
+    for gesture_name, action in bindings.items():
+        try:
+            gesture = Gest[gesture_name]
+        except KeyError:
+            raise ValueError(f"Gesto desconocido en la configuración: {gesture_name!r}")
+        try:
+            factory = HANDLER_TYPES[action]
+        except KeyError:
+            raise ValueError(f"Acción desconocida para {gesture_name}: {action!r}")
+        handlers[gesture] = factory()
+    return handlers
@@ -0,0 +1,171 @@
+import numpy as np
+from .enums.gesture_enums import Gest
+
+# Tamaño de la tabla: una entrada por cada máscara de 5 bits de dedos levantados
+TABLE_SIZE = 32
+
+# Filas de las distancias por par de `HandRecog` que consultan las reglas
+PINCH_ROW = 8  # Puntas de índice y pulgar
+V_TIPS_ROW = 9  # Puntas de índice y medio
+V_BASE_ROW = 10  # Bases de índice y medio
+
+
+def _gest(value):
+    """Convierte un nombre o número de gesto en `Gest`; deja el entero si no existe."""
+    if isinstance(value, str):
+        return Gest[value]
+    try:
+        return Gest(value)
+    except ValueError:
+        return value
+
+
+class FixedRule:
+    """
+    Regla que siempre devuelve el mismo gesto.
+
+    Cada regla implementa `classify(dist, diff)` para un frame, con las
+    distancias `(11,)` y diferencias `(11, 3)` de `HandRecog`, y
+    `classify_batch(dist, diff)` para N frames a la vez, con arreglos `(N, 11)`
+    y `(N, 11, 3)`; ambas dan el mismo resultado frame a frame.
+    """
+
+    __slots__ = ("gesture",)
+
+    def __init__(self, gesture):
+        self.gesture = _gest(gesture)
+
+    def classify(self, dist, diff):
+        return self.gesture
+
+    def classify_batch(self, dist, diff):
+        return np.full(len(dist), int(self.gesture), dtype=np.int64)
+
+
+class PinchRule:
+    """
+    Pinza: devuelve `gesture` si la distancia entre las puntas del índice y del
+    pulgar es menor que `max_dist`; si no, `fallback`.
+    """
+
+    __slots__ = ("gesture", "max_dist", "fallback")
+
+    def __init__(self, gesture, max_dist, fallback):
+        self.gesture = _gest(gesture)
+        self.max_dist = max_dist
+        self.fallback = _gest(fallback)
+
+    def classify(self, dist, diff):
+        if dist[PINCH_ROW] < self.max_dist:
+            return self.gesture
+        return self.fallback
+
+    def classify_batch(self, dist, diff):
+        return np.where(dist[:, PINCH_ROW] < self.max_dist, int(self.gesture), int(self.fallback))
+
+
+class VShapeRule:
+    """
+    Índice y medio levantados: según la separación de las puntas respecto a la de
+    las bases devuelve `open` (V), `closed` (dedos juntos a la misma profundidad)
+    u `other`.
+    """
+
+    __slots__ = ("spread_ratio", "closed_dz", "open", "closed", "other")
+
+    def __init__(self, spread_ratio, closed_dz, open, closed, other):
+        self.spread_ratio = spread_ratio
+        self.closed_dz = closed_dz
+        self.open = _gest(open)
+        self.closed = _gest(closed)
+        self.other = _gest(other)
+
+    def classify(self, dist, diff):
+        ratio = float(dist[V_TIPS_ROW]) / float(dist[V_BASE_ROW])
+        if ratio > self.spread_ratio:
+            return self.open
+        if abs(diff[V_TIPS_ROW, 2]) < self.closed_dz:
+            return self.closed
+        return self.other
+
+    def classify_batch(self, dist, diff):
+        # Con la base a distancia nula `classify` fallaría; aquí el cociente es inf o nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = dist[:, V_TIPS_ROW] / dist[:, V_BASE_ROW]
+        closed = np.where(np.abs(diff[:, V_TIPS_ROW, 2]) < self.closed_dz, int(self.closed), int(self.other))
+        return np.where(ratio > self.spread_ratio, int(self.open), closed)
+
+
+# Tipos de regla disponibles en la configuración
+RULE_TYPES = {
+    "fixed": FixedRule,
+    "pinch": PinchRule,
+    "v_shape": VShapeRule,
+}
+
+
+def build_gesture_table(rules):
+    """
+    Construye la tabla de 32 reglas indexada por la máscara de dedos.
+
+    Parameters
+    ----------
+    rules : list(dict)
+        Reglas declarativas (ver `config/gestures.py`). Cada una indica las
+        máscaras `fingers` a las que se aplica, el tipo `rule` y sus parámetros.
+        Para `pinch` el gesto alternativo por defecto es la propia máscara.
+
+    Returns
+    -------
+    list
+        Una regla por máscara; las máscaras sin regla devuelven su propio valor.
+    """
+    table = [FixedRule(mask) for mask in range(TABLE_SIZE)]
+    assigned = set()
+    for spec in rules:
+        spec = dict(spec)
+        masks = spec.pop("fingers")
+        kind = spec.pop("rule", "fixed")
+        try:
+            cls = RULE_TYPES[kind]
+        except KeyError:
+            raise ValueError(f"Tipo de regla de gesto desconocido: {kind!r}")
+        for mask in masks:
+            if not 0 <= mask < TABLE_SIZE:
+                raise ValueError(f"Máscara de dedos fuera de rango: {mask}")
+            if mask in assigned:
+                raise ValueError(f"Máscara de dedos con más de una regla: {mask:05b}")
+            assigned.add(mask)
+            params = dict(spec)
+            if kind == "pinch":
+                params.setdefault("fallback", mask)
+            table[mask] = cls(**params)
+    return table
+
+
+def classify_table(table, masks, dist, diff):
+    """
+    Aplica la regla de `table` que corresponde a la máscara de cada frame.
+
+    Parameters
+    ----------
+    table : list
+        Tabla construida con `build_gesture_table`.
+    masks : ndarray
+        Máscara de dedos `(N,)` de cada frame.
+    dist : ndarray
+        Distancias por par `(N, 11)`.
+    diff : ndarray
+        Diferencias por par `(N, 11, 3)`.
+
+    Returns
+    -------
+    ndarray
+        Gesto `(N,)` int64 de cada frame.
+    """
+    gestures = np.empty(len(masks), dtype=np.int64)
+    # Una llamada vectorizada por máscara presente, no por frame
+    for mask in np.unique(masks):
+        idx = np.flatnonzero(masks == mask)
+        gestures[idx] = table[mask].classify_batch(dist[idx], diff[idx])
+    return gestures
@@ -0,0 +1,188 @@
+import time
+from .hand_recognition import HandRecog
+from .gesture_handlers import Controller
+from .hand_tracker import HandTracker
+from .metrics import Metrics
+from .event_stream import HAND_MAJOR, HAND_MINOR, NO_HAND
+from .enums.gesture_enums import HLabel, Gest
+
+
+class GestureSession:
+    """
+    Estado de reconocimiento de un flujo de frames: seguimiento de manos,
+    reconocedores de la mano principal y secundaria, y el `Controller` que
+    ejecuta sus acciones.
+
+    Cada sesión es independiente, de modo que un proceso puede atender varias
+    cámaras o reproducir varias sesiones grabadas a la vez, cada una en su hilo.
+
+    Atributos
+    ----------
+    controller : Object de 'Controller'
+        ejecuta las acciones de los gestos de esta sesión.
+    tracker : Object de 'HandTracker'
+        mantiene identidades y lateralidad estables de las manos entre frames.
+    handmajor : Object de 'HandRecog'
+        reconocedor de la mano principal.
+    handminor : Object de 'HandRecog'
+        reconocedor de la mano secundaria.
+    metrics : Object de 'Metrics'
+        temporizadores por etapa y contadores.
+    dom_hand : bool
+        True si la mano derecha es la dominante, False en caso contrario.
+    hr_major : Object
+        landmarks de MediaPipe de la mano principal en el último frame, None si no está.
+    hr_minor : Object
+        landmarks de MediaPipe de la mano secundaria en el último frame, None si no está.
+    major_score : float
+        confianza de la detección de la mano principal, usada al confirmar gestos.
+    minor_score : float
+        confianza de la detección de la mano secundaria.
+    """
+
+    def __init__(self, controller=None, metrics=None, dom_hand=True, classifier=None):
+        """
+        Parameters
+        ----------
+        controller : Controller, optional
+            Controlador de la sesión. Por defecto uno nuevo con los backends nativos.
+        metrics : Metrics, optional
+            Métricas de la sesión. Por defecto desactivadas.
+        dom_hand : bool, optional
+            True si la mano derecha es la dominante.
+        classifier : LearnedClassifier, optional
+            Clasificador aprendido de gestos; por defecto se usan las reglas de `GESTURE_RULES`.
+        """
+        self.controller = controller if controller is not None else Controller()
+        self.tracker = HandTracker()
+        self.handmajor = HandRecog(HLabel.MAJOR, classifier)
+        self.handminor = HandRecog(HLabel.MINOR, classifier)
+        self.metrics = metrics if metrics is not None else Metrics(enabled=False)
+        self.dom_hand = dom_hand
+        self.hr_major = None
+        self.hr_minor = None
+        self.major_score = 1.0
+        self.minor_score = 1.0
+        self._published = [NO_HAND, NO_HAND]  # Último gesto publicado de cada mano
+
+    def publish_gestures(self, gesture_major, gesture_minor, frame_time):
+        """
+        Publica los cambios de gesto de ambas manos y cierra el lote del frame
+        en `controller.events`, si hay un publicador.
+        """
+        events = self.controller.events
+        if events is None:
+            return
+        published = self._published
+        for hand, gesture in ((HAND_MAJOR, gesture_major), (HAND_MINOR, gesture_minor)):
+            gesture = NO_HAND if gesture is None else int(gesture)
+            if gesture != published[hand]:
+                events.gesture(hand, gesture, published[hand], frame_time)
+                published[hand] = gesture
+        events.flush(frame_time)
+
+    def classify_hands(self, results):
+        """
+        Establece 'hr_major' y 'hr_minor' basándose en la clasificación (izquierda, derecha)
+        de la mano obtenida de MediaPipe. Utiliza 'dom_hand' para decidir qué mano es
+        la principal y cuál la secundaria.
+
+        La lateralidad de cada mano se vota a lo largo de varios frames en
+        `tracker`, de modo que un cambio aislado de etiqueta de MediaPipe no
+        intercambia los roles ni reinicia el estado de `HandRecog`.
+        """
+        left, right = None, None
+        left_score, right_score = 1.0, 1.0
+        for track, hand_landmarks in self.tracker.update(results):
+            if track.label == 'Right':
+                right, right_score = hand_landmarks, track.score
+            else:
+                left, left_score = hand_landmarks, track.score
+
+        if self.dom_hand:
+            self.hr_major = right
+            self.hr_minor = left
+            self.major_score, self.minor_score = right_score, left_score
+        else:
+            self.hr_major = left
+            self.hr_minor = right
+            self.major_score, self.minor_score = left_score, right_score
+
+    def process_results(self, results, frame_time=None, latency=0.0):
+        """
+        Reconoce los gestos de un resultado de MediaPipe y ejecuta los controles.
+
+        No depende de la cámara ni del modelo, por lo que también lo usa la
+        reproducción de sesiones grabadas.
+
+        Parameters
+        ----------
+        results : Object
+            Resultado de `hands.process` (o uno equivalente reconstruido).
+        frame_time : float, optional
+            Instante de captura del frame; por defecto `time.time()`.
+        latency : float, optional
+            Segundos entre la captura y el procesamiento del frame, que el filtro
+            de cursor compensa con su predicción.
+
+        Returns
+        -------
+        tuple(Gest, Gest)
+            Gestos de la mano principal y secundaria, o (None, None) si no hay manos.
+        """
+        controller = self.controller
+        handmajor = self.handmajor
+        handminor = self.handminor
+        # **Visión Artificial**: Uso de landmarks para reconocer gestos
+        if not results.multi_hand_landmarks:
+            controller.prev_hand = None
+            self.tracker.update(results)  # Envejece las manos seguidas
+            if controller.events is not None:
+                self.publish_gestures(None, None, time.time() if frame_time is None else frame_time)
+            return None, None
+
+        controller.set_frame_time(time.time() if frame_time is None else frame_time, latency)
+        metrics = self.metrics
+        with metrics.stage("classify"):
+            self.classify_hands(results)
+            handmajor.update_hand_result(self.hr_major)
+            handminor.update_hand_result(self.hr_minor)
+
+            handmajor.set_finger_state()
+            handminor.set_finger_state()
+
+            # Reconocer gestos (confirmados por tiempo de permanencia y confianza)
+            frame_time = controller.frame_time
+            gesture_major = handmajor.get_gesture(frame_time, self.major_score)
+            gesture_minor = handminor.get_gesture(frame_time, self.minor_score)
+            try:
+                gest_name_major = Gest(gesture_major)
+            except ValueError:
+                print(f"Gesto no reconocido (mano dominante): {gesture_major}")
+                gest_name_major = Gest.UNKNOWN
+
+            try:
+                gest_name_minor = Gest(gesture_minor)
+            except ValueError:
+                print(f"Gesto no reconocido (mano no dominante): {gesture_minor}")
+                gest_name_minor = Gest.UNKNOWN
+        metrics.gesture("major", gest_name_major)
+        metrics.gesture("minor", gest_name_minor)
+        if metrics.enabled:
+            # Tiempo desde que apareció cada gesto hasta que se confirmó
+            for hand in (handmajor, handminor):
+                if hand.debouncer.just_committed:
+                    metrics.commit_latency(hand.ori_gesture, hand.debouncer.last_commit_latency)
+
+        # Ejecutar controles basados en gestos
+        if gest_name_major != Gest.UNKNOWN and gest_name_major != Gest.PALM:
+            with metrics.stage("controls"):
+                controller.handle_controls(gest_name_major, handmajor.hand_result)
+
+        # Limitamos las acciones para la mano no dominante a ciertos gestos
+        # if gest_name_minor in [Gest.THREE_FINGER_SCROLL] and gest_name_minor != Gest.PALM:
+        #     controller.handle_controls(gest_name_minor, handminor.hand_result)
+        if controller.events is not None:
+            self.publish_gestures(gest_name_major if self.hr_major is not None else None,
+                                  gest_name_minor if self.hr_minor is not None else None, frame_time)
+        return gest_name_major, gest_name_minor
@@ -1,12 +1,82 @@
 import math
+import time
+import numpy as np
 from .enums.gesture_enums import Gest, HLabel
+from .landmarks import NUM_LANDMARKS, landmarks_to_array, new_landmark_array
+from .gesture_rules import build_gesture_table, classify_table
+from .gesture_debounce import GestureDebouncer, dwell_from_config
+from .learned_classifier import hand_features
+from config.gestures import (
+    GESTURE_RULES,
+    GESTURE_DWELL,
+    GESTURE_DWELL_DEFAULT,
+    GESTURE_DWELL_MAX_STEP,
+    GESTURE_MIN_CONFIDENCE
+)
+
+# Pares de landmarks (a, b) evaluados en cada frame, en un solo cálculo vectorizado.
+# Filas 0-7: (punta, articulación media) y (articulación media, base) de cada dedo.
+# Fila 8: pinza (índice, pulgar). Filas 9-10: separación de índice y medio para V
+# (las reglas de `gesture_rules` consultan estas filas).
+_PAIR_A = [8, 5, 12, 9, 16, 13, 20, 17, 8, 8, 5]
+_PAIR_B = [5, 0, 9, 0, 13, 0, 17, 0, 4, 12, 9]
+_NUM_PAIRS = len(_PAIR_A)
+# Matriz (11, 21) con +1 en `a` y -1 en `b`: su producto por los landmarks da a - b
+# por par en una sola llamada. Los productos por ±1 y 0 son exactos y solo dos
+# términos no son nulos, así que cada fila redondea igual que la resta en Python.
+_PAIR_DIFF = np.zeros((_NUM_PAIRS, NUM_LANDMARKS), dtype=np.float64)
+_PAIR_DIFF[np.arange(_NUM_PAIRS), _PAIR_A] += 1.0
+_PAIR_DIFF[np.arange(_NUM_PAIRS), _PAIR_B] -= 1.0
+
+# Peso de cada dedo en la máscara binaria: Índice, Medio, Anular, Meñique
+_FINGER_WEIGHTS = np.array([8, 4, 2, 1], dtype=np.int64)
+
+# Máscara de dedos según los bytes del arreglo booleano (4,) de dedos levantados;
+# una consulta al diccionario no asigna memoria, a diferencia de `np.dot`.
+_FINGER_MASKS = {
+    np.array([(mask >> shift) & 1 for shift in (3, 2, 1, 0)], dtype=bool).tobytes(): mask
+    for mask in range(16)
+}
+
+# `round(ratio, 1) > 0.5` equivale exactamente a `ratio >= 0.55`: el double 0.55 es
+# ligeramente mayor que 0.55 y `round` redondea el valor binario exacto.
+_FINGER_RATIO_MIN = 0.55
+
+# Operandos constantes como arreglos: NumPy no convierte un escalar en cada llamada
+_NEG_DIST_MAX = np.full(8, -0.01)
+_FINGER_RATIO_MINS = np.full(4, _FINGER_RATIO_MIN)
+
+# Frames por bloque en `classify_batch`, para acotar la memoria de los arreglos intermedios
+BATCH_CHUNK_SIZE = 65536
+
+
+def default_debouncer():
+    """Crea un `GestureDebouncer` con los tiempos de permanencia de `config/gestures.py`."""
+    return GestureDebouncer(
+        HandRecog.gesture_dwell,
+        default_dwell=GESTURE_DWELL_DEFAULT,
+        max_step=GESTURE_DWELL_MAX_STEP,
+        min_confidence=GESTURE_MIN_CONFIDENCE
+    )
+
 
 class HandRecog:
     """
     Convierte los puntos de referencia de MediaPipe en gestos reconocibles utilizando **Visión Artificial**.
+
+    Atributos
+    ----------
+    gesture_table : list
+        regla de gesto para cada una de las 32 máscaras de dedos, construida a
+        partir de `GESTURE_RULES` (config/gestures.py).
+    gesture_dwell : dict
+        tiempo de permanencia de cada gesto antes de confirmarse (`GESTURE_DWELL`).
     """
 
-    def __init__(self, hand_label):
+    gesture_table = build_gesture_table(GESTURE_RULES)
+    gesture_dwell = dwell_from_config(GESTURE_DWELL)
+
+    def __init__(self, hand_label, classifier=None):
         """
         Inicializa los atributos necesarios para el objeto HandRecog.
 
@@ -14,18 +84,62 @@ class HandRecog:
         ----------
         hand_label : int
             Representa la etiqueta de la mano (principal o secundaria) según el Enum `HLabel`.
+        classifier : LearnedClassifier, optional
+            Clasificador aprendido que reemplaza a `gesture_table` (ver `src.learned_classifier`).
         """
         self.finger = 0  # Estado de los dedos codificado en binario
         self.ori_gesture = Gest.PALM  # Gesto original detectado
         self.prev_gesture = Gest.PALM  # Gesto detectado en el frame anterior
-        self.frame_count = 0  # Contador de frames desde la última actualización de `ori_gesture`
+        # Confirma los cambios de gesto por tiempo de permanencia y confianza
+        self.debouncer = default_debouncer()
         self.hand_result = None  # Resultado de MediaPipe para la mano
         self.hand_label = hand_label  # Etiqueta de la mano (principal o secundaria)
-        
+        self.classifier = classifier  # Clasificador aprendido, None para usar las reglas
+
+        # Buffers reutilizados en cada frame para no asignar memoria en el camino crítico
+        self.landmarks = new_landmark_array()  # Landmarks (21, 3) float32 del frame actual
+        self._landmarks64 = np.zeros((NUM_LANDMARKS, 3), dtype=np.float64)  # Copia float64 de `landmarks`
+        self._diff = np.zeros((_NUM_PAIRS, 3), dtype=np.float64)  # a - b por par
+        self._sq = np.zeros((_NUM_PAIRS, 3), dtype=np.float64)
+        self._dist = np.zeros(_NUM_PAIRS, dtype=np.float64)  # Distancia euclidiana (x, y) por par
+        self._neg_signed = np.zeros(8, dtype=np.float64)
+        self._ratio = np.zeros(4, dtype=np.float64)
+        self._bits = np.zeros(4, dtype=bool)
+        # Vistas sobre los buffers, creadas una sola vez en lugar de en cada frame
+        self._sq_x = self._sq[:, 0]
+        self._sq_y = self._sq[:, 1]
+        self._finger_dist = self._dist[:8]
+        self._finger_dy = self._diff[:8, 1]
+        self._neg_tip = self._neg_signed[0::2]
+        self._neg_base = self._neg_signed[1::2]
 
     def update_hand_result(self, hand_result):
-        """Actualiza los resultados de MediaPipe para la mano."""
+        """
+        Actualiza los resultados de MediaPipe para la mano.
+
+        Los landmarks se copian una sola vez a `self.landmarks` y se calculan de
+        inmediato todas las distancias que usan `set_finger_state` y `get_gesture`.
+        """
         self.hand_result = hand_result
+        if not self.hand_result or not self.hand_result.landmark:
+            return
+        landmarks_to_array(hand_result, self.landmarks)
+        self._update_distances()
+
+    def _update_distances(self):
+        """Calcula en bloque las diferencias y distancias de todos los pares de `_PAIR_A`/`_PAIR_B`."""
+        # Se opera en float64 para reproducir exactamente la aritmética de Python
+        np.copyto(self._landmarks64, self.landmarks)
+        np.dot(_PAIR_DIFF, self._landmarks64, out=self._diff)
+        np.multiply(self._diff, self._diff, out=self._sq)
+        np.add(self._sq_x, self._sq_y, out=self._dist)
+        np.sqrt(self._dist, out=self._dist)
+
+    def _pair_delta(self, point):
+        """Devuelve (dx, dy, dz) entre los landmarks `point[0]` y `point[1]`."""
+        a = self.landmarks[point[0]]
+        b = self.landmarks[point[1]]
+        return float(a[0]) - float(b[0]), float(a[1]) - float(b[1]), float(a[2]) - float(b[2])
 
     def get_signed_dist(self, point):
         """
@@ -43,13 +157,9 @@ class HandRecog:
         if not self.hand_result or not self.hand_result.landmark:
             return 0.0
 
-        sign = -1
-        if self.hand_result.landmark[point[0]].y < self.hand_result.landmark[point[1]].y:
-            sign = 1
-        dist = (self.hand_result.landmark[point[0]].x - self.hand_result.landmark[point[1]].x) ** 2
-        dist += (self.hand_result.landmark[point[0]].y - self.hand_result.landmark[point[1]].y) ** 2
-        dist = math.sqrt(dist)
-        return dist * sign
+        dx, dy, _ = self._pair_delta(point)
+        dist = math.sqrt(dx ** 2 + dy ** 2)
+        return dist if dy < 0 else -dist
 
     def get_dist(self, point):
         """
@@ -67,10 +177,8 @@ class HandRecog:
         if not self.hand_result or not self.hand_result.landmark:
             return 0.0
 
-        dist = (self.hand_result.landmark[point[0]].x - self.hand_result.landmark[point[1]].x) ** 2
-        dist += (self.hand_result.landmark[point[0]].y - self.hand_result.landmark[point[1]].y) ** 2
-        dist = math.sqrt(dist)
-        return dist
+        dx, dy, _ = self._pair_delta(point)
+        return math.sqrt(dx ** 2 + dy ** 2)
 
     def get_dz(self, point):
         """
@@ -88,7 +196,7 @@ class HandRecog:
         if not self.hand_result or not self.hand_result.landmark:
             return 0.0
 
-        return abs(self.hand_result.landmark[point[0]].z - self.hand_result.landmark[point[1]].z)
+        return abs(self._pair_delta(point)[2])
 
     def set_finger_state(self):
         """
@@ -102,19 +210,34 @@ class HandRecog:
         if not self.hand_result or not self.hand_result.landmark:
             return
 
-        points = [[8, 5, 0], [12, 9, 0], [16, 13, 0], [20, 17, 0]] # Índice, Medio, Anular, Meñique
-        self.finger = 0
-        for idx, point in enumerate(points):
-            dist = max(self.get_signed_dist(point[:2]), 0.01)  # Evitar división por cero
-            dist2 = max(self.get_signed_dist(point[1:]), 0.01)
-            ratio = round(dist / dist2, 1)
-            self.finger = (self.finger << 1) | (1 if ratio > 0.5 else 0)
-        
+        # Distancia firmada (positiva si `a` está por encima de `b`) de los pares
+        # punta-articulación y articulación-base de Índice, Medio, Anular y Meñique.
+        # Se guarda negada: `-max(d, 0.01)` == `min(-d, -0.01)` y los signos se
+        # cancelan al dividir, lo que ahorra operaciones sin alterar el resultado.
+        np.copysign(self._finger_dist, self._finger_dy, out=self._neg_signed)
+        np.minimum(self._neg_signed, _NEG_DIST_MAX, out=self._neg_signed)  # Evitar división por cero
+        np.divide(self._neg_tip, self._neg_base, out=self._ratio)
+        np.greater_equal(self._ratio, _FINGER_RATIO_MINS, out=self._bits)
+        self.finger = _FINGER_MASKS[self._bits.tobytes()]
+
 
-    def get_gesture(self):
+    def get_gesture(self, t=None, confidence=1.0):
         """
         **Visión Artificial**:Determina el gesto actual basado en el estado de los dedos y la distancia entre puntos clave.
 
+        La máscara `self.finger` selecciona la regla en `gesture_table`; las
+        reglas de pinza y de V consultan las distancias ya calculadas. Si hay un
+        clasificador aprendido, él decide el gesto a partir de los landmarks. El gesto
+        solo cambia cuando el nuevo se mantiene su tiempo de permanencia (ver
+        `GestureDebouncer`).
+
+        Parameters
+        ----------
+        t : float, optional
+            Instante de captura del frame; por defecto `time.time()`.
+        confidence : float, optional
+            Confianza de la detección de la mano, entre 0 y 1.
+
         Returns
         -------
         int
@@ -123,44 +246,126 @@ class HandRecog:
         if not self.hand_result or not self.hand_result.landmark:
             return Gest.PALM
 
-        current_gesture = Gest.PALM
-            # Detectar PINCH_MAJOR
-        if self.finger in [Gest.LAST3, Gest.LAST4] and self.get_dist([8, 4]) < 0.05:
-            current_gesture = Gest.PINCH_MAJOR
-
-        # Detectar tres dedos del medio levantados para scroll
-        elif self.finger == 0b01110:  # Índice, Medio y Anular levantados (binario: 01110)
-            current_gesture = Gest.THREE_FINGER_SCROLL
-            
-        # if self.finger in [Gest.LAST3, Gest.LAST4] and self.get_dist([8, 4]) < 0.05:
-        #     if self.hand_label == HLabel.MINOR:
-        #         current_gesture = Gest.PINCH_MINOR
-        #     else:
-        #         current_gesture = Gest.PINCH_MAJOR
-
-        # Detectar gestos como V_GEST, TWO_FINGER_CLOSED, etc.
-        elif Gest.FIRST2 == self.finger:
-            point = [[8, 12], [5, 9]]
-            dist1 = self.get_dist(point[0])
-            dist2 = self.get_dist(point[1])
-            ratio = dist1 / dist2
-            if ratio > 1.7:
-                current_gesture = Gest.V_GEST
-            else:
-                if self.get_dz([8, 12]) < 0.1:
-                    current_gesture = Gest.TWO_FINGER_CLOSED
-                else:
-                    current_gesture = Gest.MID
-        else:
-            current_gesture = self.finger
-
-        if current_gesture == self.prev_gesture:
-            self.frame_count += 1
+        if self.classifier is not None:
+            current_gesture = self.classifier.classify(self.landmarks)
         else:
-            self.frame_count = 0
+            # Una sola consulta a la tabla por frame, sea cual sea el gesto
+            current_gesture = self.gesture_table[self.finger].classify(self._dist, self._diff)
 
         self.prev_gesture = current_gesture
-
-        if self.frame_count > 4:
-            self.ori_gesture = current_gesture
+        t = time.time() if t is None else t
+        self.ori_gesture = self.debouncer.update(current_gesture, t, confidence)
         return self.ori_gesture
+
+
+class BatchGestures:
+    """
+    Resultado de `classify_batch`.
+
+    Atributos
+    ----------
+    fingers : ndarray
+        máscara de dedos `(N,)` de cada frame (`HandRecog.finger`), 0 en los frames sin mano.
+    raw : ndarray
+        gesto `(N,)` de cada frame antes de confirmarse (`HandRecog.prev_gesture`),
+        `Gest.PALM` en los frames sin mano.
+    gestures : ndarray
+        gesto confirmado `(N,)` de cada frame, el que devuelve `HandRecog.get_gesture`.
+    """
+
+    def __init__(self, fingers, raw, gestures):
+        self.fingers = fingers
+        self.raw = raw
+        self.gestures = gestures
+
+    def __len__(self):
+        return len(self.gestures)
+
+
+def pair_distances(landmarks):
+    """
+    Versión por lotes de `HandRecog._update_distances`.
+
+    Parameters
+    ----------
+    landmarks : ndarray
+        Landmarks `(N, 21, 3)`; se convierten a float32 como en `landmarks_to_array`.
+
+    Returns
+    -------
+    tuple(ndarray, ndarray)
+        Distancias `(N, 11)` y diferencias `(N, 11, 3)` float64 de cada par.
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    diff = np.subtract(landmarks[:, _PAIR_A], landmarks[:, _PAIR_B], dtype=np.float64)
+    sq = np.multiply(diff, diff)
+    dist = np.sqrt(sq[:, :, 0] + sq[:, :, 1])
+    return dist, diff
+
+
+def finger_masks(dist, diff):
+    """Versión por lotes de `HandRecog.set_finger_state`: máscara de dedos `(N,)` int64."""
+    neg_signed = np.minimum(np.copysign(dist[:, :8], diff[:, :8, 1]), -0.01)
+    ratio = neg_signed[:, 0::2] / neg_signed[:, 1::2]
+    return np.dot(ratio >= _FINGER_RATIO_MIN, _FINGER_WEIGHTS)
+
+
+def classify_batch(landmarks, timestamps, confidence=1.0, present=None, debouncer=None,
+                   table=None, classifier=None, chunk_size=BATCH_CHUNK_SIZE):
+    """
+    Clasifica N frames de una mano con operaciones vectorizadas.
+
+    El resultado es idéntico al de llamar, frame a frame, a `update_hand_result`,
+    `set_finger_state` y `get_gesture(t, confidence)` de un `HandRecog` nuevo,
+    pero sin crear objetos por frame: las distancias, máscaras y reglas se
+    calculan sobre bloques de `chunk_size` frames y la confirmación recorre
+    tramos de gesto constante (ver `GestureDebouncer.update_batch`).
+
+    Parameters
+    ----------
+    landmarks : ndarray
+        Landmarks `(N, 21, 3)` de la mano en cada frame.
+    timestamps : ndarray
+        Instante `(N,)` de cada frame, en segundos.
+    confidence : float o ndarray, optional
+        Confianza de la detección, común o `(N,)` por frame.
+    present : ndarray, optional
+        `(N,)` bool, False en los frames sin mano. Esos frames no afectan a la
+        confirmación, como cuando `get_gesture` no recibe landmarks.
+    debouncer : GestureDebouncer, optional
+        Confirmación a continuar, por ejemplo la de un `HandRecog` o la de una
+        llamada anterior con el bloque previo. Por defecto una nueva.
+    table : list, optional
+        Tabla de reglas. Por defecto `HandRecog.gesture_table`.
+    classifier : LearnedClassifier, optional
+        Clasificador aprendido que reemplaza a la tabla de reglas.
+    chunk_size : int, optional
+        Frames por bloque.
+
+    Returns
+    -------
+    BatchGestures
+    """
+    landmarks = np.asarray(landmarks)
+    n = len(landmarks)
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    confidence = np.broadcast_to(np.asarray(confidence, dtype=np.float64), (n,))
+    table = HandRecog.gesture_table if table is None else table
+    debouncer = default_debouncer() if debouncer is None else debouncer
+
+    fingers = np.zeros(n, dtype=np.int64)
+    raw = np.full(n, int(Gest.PALM), dtype=np.int64)
+    gestures = np.full(n, int(Gest.PALM), dtype=np.int64)
+    frames = np.arange(n) if present is None else np.flatnonzero(present)
+    for lo in range(0, len(frames), chunk_size):
+        idx = frames[lo:lo + chunk_size]
+        dist, diff = pair_distances(landmarks[idx])
+        masks = finger_masks(dist, diff)
+        if classifier is not None:
+            chunk_raw = classifier.predict(hand_features(landmarks[idx]))
+        else:
+            chunk_raw = classify_table(table, masks, dist, diff)
+        fingers[idx] = masks
+        raw[idx] = chunk_raw
+        gestures[idx] = debouncer.update_batch(chunk_raw, timestamps[idx], confidence[idx])
+    return BatchGestures(fingers, raw, gestures)
@@ -0,0 +1,145 @@
+import math
+
+# Landmarks usados para el centro de la palma: muñeca y base del dedo medio
+_WRIST = 0
+_MIDDLE_MCP = 9
+
+
+class TrackedHand:
+    """
+    Mano seguida entre frames.
+
+    Atributos
+    ----------
+    hand_id : int
+        identificador estable mientras la mano siga a la vista.
+    centroid : tuple(float, float)
+        centro normalizado (x, y) de la palma en el último frame.
+    vote : float
+        votación acumulada de lateralidad: positiva para 'Right', negativa para 'Left'.
+    label : str
+        lateralidad votada, 'Right' o 'Left'.
+    missing : int
+        frames consecutivos sin asociar a ninguna detección.
+    score : float
+        puntuación de lateralidad de MediaPipe en el último frame, entre 0 y 1.
+    """
+
+    __slots__ = ("hand_id", "centroid", "vote", "label", "missing", "score")
+
+    def __init__(self, hand_id, centroid, vote):
+        self.hand_id = hand_id
+        self.centroid = centroid
+        self.vote = vote
+        self.label = 'Right' if vote >= 0 else 'Left'
+        self.missing = 0
+        self.score = abs(vote)
+
+
+class HandTracker:
+    """
+    Mantiene identidades estables de las manos entre frames asociando cada
+    detección con la mano seguida más cercana (por el centroide de la palma) y
+    decide su lateralidad por votación en el tiempo, en lugar de confiar en la
+    etiqueta de MediaPipe de cada frame.
+
+    Atributos
+    ----------
+    max_distance : float
+        distancia normalizada máxima entre centroides para asociar una detección.
+    max_missing : int
+        frames que se conserva una mano no detectada antes de olvidarla.
+    vote_decay : float
+        peso de la votación anterior frente a la etiqueta del frame actual.
+    label_flips : int
+        frames en los que la etiqueta de MediaPipe contradijo la votada.
+    """
+
+    def __init__(self, max_distance=0.25, max_missing=5, vote_decay=0.8):
+        self.max_distance = max_distance
+        self.max_missing = max_missing
+        self.vote_decay = vote_decay
+        self.label_flips = 0
+        self.tracks = []
+        self._next_id = 0
+
+    def reset(self):
+        """Olvida todas las manos seguidas."""
+        self.tracks = []
+
+    @staticmethod
+    def _centroid(hand_landmarks):
+        lms = hand_landmarks.landmark
+        wrist = lms[_WRIST]
+        mcp = lms[_MIDDLE_MCP]
+        return (wrist.x + mcp.x) / 2, (wrist.y + mcp.y) / 2
+
+    def update(self, results):
+        """
+        Asocia las manos detectadas en `results` con las seguidas.
+
+        Parameters
+        ----------
+        results : Object
+            Resultado de `hands.process`.
+
+        Returns
+        -------
+        list(tuple(TrackedHand, Object))
+            Cada mano seguida presente en el frame junto con sus landmarks.
+        """
+        detections = []
+        hand_list = results.multi_hand_landmarks or []
+        handedness_list = results.multi_handedness or []
+        for idx, hand_landmarks in enumerate(hand_list):
+            signed_score = 0.0
+            if idx < len(handedness_list):
+                # Acceso directo a los campos, sin convertir el protobuf a diccionario
+                classification = handedness_list[idx].classification[0]
+                signed_score = classification.score if classification.label == 'Right' else -classification.score
+            detections.append((self._centroid(hand_landmarks), signed_score, hand_landmarks))
+
+        # Asociación voraz por distancia: con dos manos como máximo es suficiente
+        pairs = []
+        for d_idx, (centroid, _, _) in enumerate(detections):
+            for t_idx, track in enumerate(self.tracks):
+                dist = math.hypot(centroid[0] - track.centroid[0], centroid[1] - track.centroid[1])
+                if dist <= self.max_distance:
+                    pairs.append((dist, d_idx, t_idx))
+        pairs.sort()
+
+        matched = [None] * len(detections)
+        used_tracks = set()
+        for _, d_idx, t_idx in pairs:
+            if matched[d_idx] is None and t_idx not in used_tracks:
+                matched[d_idx] = self.tracks[t_idx]
+                used_tracks.add(t_idx)
+
+        for t_idx, track in enumerate(self.tracks):
+            if t_idx not in used_tracks:
+                track.missing += 1
+
+        present = []
+        for d_idx, (centroid, signed_score, hand_landmarks) in enumerate(detections):
+            track = matched[d_idx]
+            if track is None:
+                track = TrackedHand(self._next_id, centroid, signed_score)
+                self._next_id += 1
+                self.tracks.append(track)
+            else:
+                track.centroid = centroid
+                track.missing = 0
+                track.vote = self.vote_decay * track.vote + (1 - self.vote_decay) * signed_score
+                if (signed_score >= 0) != (track.vote >= 0):
+                    self.label_flips += 1
+                track.score = abs(signed_score)
+            track.label = 'Right' if track.vote >= 0 else 'Left'
+            present.append((track, hand_landmarks))
+
+        self.tracks = [t for t in self.tracks if t.missing <= self.max_missing]
+
+        # Dos manos no pueden tener la misma lateralidad: la de voto más débil cede
+        if len(present) == 2 and present[0][0].label == present[1][0].label:
+            weaker = min((present[0][0], present[1][0]), key=lambda t: abs(t.vote))
+            weaker.label = 'Left' if weaker.label == 'Right' else 'Right'
+        return present
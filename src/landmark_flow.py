@@ -0,0 +1,240 @@
+import cv2
+import numpy as np
+from .frame_buffers import FrameBufferPool
+from .frame_results import results_from_landmarks
+from .landmarks import NUM_LANDMARKS
+from config.settings import (
+    FLOW_DETECT_EVERY,
+    FLOW_SCALE,
+    FLOW_WIN_SIZE,
+    FLOW_PYRAMID_LEVELS,
+    FLOW_MAX_FB_ERROR,
+    FLOW_MIN_CONFIDENCE,
+    FLOW_MAX_SCALE_CHANGE,
+    FLOW_MAX_INTENSITY_CHANGE
+)
+
+# Landmarks de la muñeca y del nudillo del dedo medio: su distancia mide el tamaño de la palma
+_WRIST = 0
+_MIDDLE_MCP = 9
+
+
+class LandmarkFlowTracker:
+    """
+    Sigue los landmarks de las manos con flujo óptico entre dos ejecuciones de
+    MediaPipe, para no ejecutar el modelo en cada frame.
+
+    Tras cada detección, los landmarks se siguen en los frames siguientes con
+    Lucas-Kanade piramidal sobre una versión reducida en gris del frame. El
+    resultado tiene el mismo formato que el de `hands.process`, así que
+    `HandRecog` y `Controller` no distinguen los frames seguidos de los
+    detectados. La confianza de cada mano es la de la detección multiplicada por
+    la fracción de sus puntos bien seguidos.
+
+    El modelo se vuelve a ejecutar cada `detect_every` frames, o antes si el
+    seguimiento deriva:
+    - menos de `min_confidence` de los puntos de una mano pasan la comprobación
+      de ida y vuelta (el punto seguido hacia atrás debe volver a menos de
+      `max_fb_error` píxeles de donde salió);
+    - el tamaño de la palma cambia más de `max_scale_change` respecto a la
+      última detección (los puntos se separan o se juntan);
+    - el gris bajo los puntos cambia en mediana más de `max_intensity_change`
+      niveles respecto a la última detección (la mano se fue y los puntos
+      quedaron sobre el fondo, que el flujo sigue sin error);
+    - la muñeca sale de la imagen.
+
+    Los puntos que no pasan la comprobación se mueven con el desplazamiento
+    mediano de los demás puntos de su mano.
+
+    Atributos
+    ----------
+    detect_every : int
+        frames entre dos ejecuciones del modelo.
+    scale : float
+        escala de la imagen en gris respecto al frame.
+    detections : int
+        frames procesados por el modelo.
+    tracked_frames : int
+        frames resueltos con flujo óptico.
+    drifts : int
+        seguimientos abandonados por deriva antes de `detect_every`.
+    confidence : float
+        fracción de puntos bien seguidos de la peor mano en el último frame seguido.
+    """
+
+    def __init__(self, detect_every=FLOW_DETECT_EVERY, scale=FLOW_SCALE, win_size=FLOW_WIN_SIZE,
+                 levels=FLOW_PYRAMID_LEVELS, max_fb_error=FLOW_MAX_FB_ERROR,
+                 min_confidence=FLOW_MIN_CONFIDENCE, max_scale_change=FLOW_MAX_SCALE_CHANGE,
+                 max_intensity_change=FLOW_MAX_INTENSITY_CHANGE):
+        self.detect_every = max(1, detect_every)
+        self.scale = scale
+        self.max_fb_error = max_fb_error
+        self.min_confidence = min_confidence
+        self.max_scale_change = max_scale_change
+        self.max_intensity_change = max_intensity_change
+        self.detections = 0
+        self.tracked_frames = 0
+        self.drifts = 0
+        self.confidence = None
+        self._lk_params = dict(
+            winSize=(win_size, win_size),
+            maxLevel=levels,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 10, 0.03),
+        )
+        self._pool = FrameBufferPool()
+        self._gray_names = ("gray_a", "gray_b")
+        self._gray_index = 0
+        self._prev_gray = None  # Imagen reducida del último frame con landmarks conocidos
+        self._frame_gray = None  # Imagen reducida del frame en curso, si ya se calculó
+        self._points = None  # (manos * 21, 1, 2) float32 en píxeles de la imagen reducida
+        self._depth = None  # (manos, 21) z de la última detección
+        self._palm = None  # Tamaño de la palma de cada mano en la última detección
+        self._intensity = None  # (manos, 21) gris bajo cada punto en la última detección
+        self._labels = None
+        self._scores = None
+        self._since_detection = 0
+
+    def reset(self):
+        """Olvida las manos seguidas; el siguiente frame se procesa con el modelo."""
+        self._points = None
+        self._prev_gray = None
+
+    def _gray(self, image):
+        """Frame RGB -> imagen en gris reducida, en uno de dos buffers alternos."""
+        height, width = image.shape[:2]
+        gray = self._pool.get("gray", (height, width))
+        cv2.cvtColor(image, cv2.COLOR_RGB2GRAY, dst=gray)
+        size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        self._gray_index ^= 1
+        small = self._pool.get(self._gray_names[self._gray_index], (size[1], size[0]))
+        return cv2.resize(gray, size, dst=small, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def _sample(gray, points):
+        """Gris (interpolado) bajo cada punto `(n, 1, 2)`, como float32 `(n,)`."""
+        coords = points.reshape(1, -1, 2)
+        values = cv2.remap(gray, coords[..., 0], coords[..., 1], cv2.INTER_LINEAR,
+                           borderMode=cv2.BORDER_REPLICATE)
+        return values.reshape(-1).astype(np.float32)
+
+    def track(self, image):
+        """
+        Sigue los landmarks en `image` si no toca ejecutar el modelo.
+
+        Parameters
+        ----------
+        image : ndarray
+            Frame RGB completo (el mismo que recibiría `hands.process`).
+
+        Returns
+        -------
+        ReplayResults
+            Landmarks seguidos, o None si este frame se debe procesar con el
+            modelo (toca detección, no hay manos seguidas o el seguimiento derivó);
+            en ese caso se debe llamar a `update` con el resultado del modelo.
+        """
+        self._frame_gray = None
+        if self._points is None or self._since_detection + 1 >= self.detect_every:
+            return None
+        gray = self._frame_gray = self._gray(image)
+        prev = self._prev_gray
+        if prev.shape != gray.shape:
+            # Cambió la resolución de captura
+            return None
+
+        prev_points = self._points
+        points, status, _ = cv2.calcOpticalFlowPyrLK(prev, gray, prev_points, None, **self._lk_params)
+        back, back_status, _ = cv2.calcOpticalFlowPyrLK(gray, prev, points, None, **self._lk_params)
+        fb_error = np.linalg.norm((back - prev_points).reshape(-1, 2), axis=1)
+        good = (status.ravel() == 1) & (back_status.ravel() == 1) & (fb_error <= self.max_fb_error)
+
+        hands = len(self._palm)
+        points = points.reshape(hands, NUM_LANDMARKS, 2)
+        prev_hands = prev_points.reshape(hands, NUM_LANDMARKS, 2)
+        good = good.reshape(hands, NUM_LANDMARKS)
+        confidence = good.mean(axis=1)
+        self.confidence = float(confidence.min())
+        if self.confidence < self.min_confidence:
+            return self._drift()
+
+        height, width = gray.shape
+        for hand in range(hands):
+            lost = ~good[hand]
+            if lost.any():
+                motion = np.median(points[hand][good[hand]] - prev_hands[hand][good[hand]], axis=0)
+                points[hand][lost] = prev_hands[hand][lost] + motion
+            palm = np.linalg.norm(points[hand, _WRIST] - points[hand, _MIDDLE_MCP])
+            if abs(palm / self._palm[hand] - 1.0) > self.max_scale_change:
+                return self._drift()
+            wx, wy = points[hand, _WRIST]
+            if not (0.0 <= wx < width and 0.0 <= wy < height):
+                return self._drift()
+
+        points = points.reshape(-1, 1, 2)
+        change = np.abs(self._sample(gray, points).reshape(hands, NUM_LANDMARKS) - self._intensity)
+        if (np.median(change, axis=1) > self.max_intensity_change).any():
+            return self._drift()
+
+        self._points = points
+        self._prev_gray = gray
+        self._since_detection += 1
+        self.tracked_frames += 1
+
+        landmarks = np.empty((hands, NUM_LANDMARKS, 3), dtype=np.float32)
+        points = points.reshape(hands, NUM_LANDMARKS, 2)
+        landmarks[..., 0] = (points[..., 0] + 0.5) / width
+        landmarks[..., 1] = (points[..., 1] + 0.5) / height
+        landmarks[..., 2] = self._depth
+        scores = [score * conf for score, conf in zip(self._scores, confidence.tolist())]
+        return results_from_landmarks(landmarks, self._labels, scores)
+
+    def _drift(self):
+        self.drifts += 1
+        self._points = None
+        return None
+
+    def update(self, image, results):
+        """
+        Registra el resultado del modelo sobre `image` como punto de partida
+        del seguimiento.
+
+        Parameters
+        ----------
+        image : ndarray
+            Frame RGB completo pasado al modelo.
+        results : Object
+            Resultado de `hands.process`, en coordenadas del frame completo.
+        """
+        self.detections += 1
+        self._since_detection = 0
+        if not results.multi_hand_landmarks:
+            self.reset()
+            return
+        gray = self._frame_gray if self._frame_gray is not None else self._gray(image)
+        self._frame_gray = None
+        height, width = gray.shape
+
+        landmarks = np.array(
+            [[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in results.multi_hand_landmarks],
+            dtype=np.float32,
+        )
+        points = np.empty(landmarks.shape[:2] + (2,), dtype=np.float32)
+        # Coordenadas normalizadas -> centros de píxel de la imagen reducida
+        points[..., 0] = landmarks[..., 0] * width - 0.5
+        points[..., 1] = landmarks[..., 1] * height - 0.5
+        self._points = points.reshape(-1, 1, 2)
+        self._depth = landmarks[..., 2]
+        self._intensity = self._sample(gray, self._points).reshape(len(landmarks), NUM_LANDMARKS)
+        self._palm = [max(float(np.linalg.norm(hand[_WRIST] - hand[_MIDDLE_MCP])), 1.0) for hand in points]
+        handedness = results.multi_handedness or []
+        self._labels = []
+        self._scores = []
+        for idx in range(len(landmarks)):
+            if idx < len(handedness):
+                classification = handedness[idx].classification[0]
+                self._labels.append(classification.label)
+                self._scores.append(classification.score)
+            else:
+                self._labels.append('Right')
+                self._scores.append(1.0)
+        self._prev_gray = gray
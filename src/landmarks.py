@@ -0,0 +1,71 @@
+from itertools import chain
+from operator import attrgetter
+import numpy as np
+
+NUM_LANDMARKS = 21  # Puntos de referencia por mano en MediaPipe Hands
+
+# `NormalizedLandmarkList` serializado con solo x, y, z en cada landmark: por mano,
+# 21 registros de 17 bytes (etiqueta y longitud del submensaje, y tres campos
+# fixed32 con su etiqueta). Los floats se leen directamente de esos bytes.
+_WIRE_RECORD = 17
+_WIRE_SIZE = NUM_LANDMARKS * _WIRE_RECORD
+# (posición en el registro, etiqueta esperada repetida en los 21 registros)
+_WIRE_TAGS = tuple((offset, bytes([tag]) * NUM_LANDMARKS)
+                   for offset, tag in ((0, 0x0a), (1, 0x0f), (2, 0x0d), (7, 0x15), (12, 0x1d)))
+_XYZ = attrgetter("x", "y", "z")
+
+
+def new_landmark_array():
+    """Devuelve un arreglo contiguo `(21, 3)` float32 para los landmarks de una mano."""
+    return np.zeros((NUM_LANDMARKS, 3), dtype=np.float32)
+
+
+def landmarks_to_array(hand_result, out=None):
+    """
+    Copia los landmarks (x, y, z) de una mano a un arreglo `(21, 3)` float32.
+
+    Los campos de los landmarks de MediaPipe ya son float32, por lo que la copia
+    no pierde precisión respecto a leerlos uno por uno desde el protobuf. Los
+    landmarks reproducidos (`ReplayLandmarkList`) se copian desde su arreglo, y
+    los protobufs desde su serialización (ver `_copy_wire`), sin crear un objeto
+    Python por coordenada.
+
+    Parameters
+    ----------
+    hand_result : Object o ndarray
+        Landmarks de MediaPipe (con atributo `landmark`), `ReplayLandmarkList`
+        o un arreglo `(21, 3)`.
+    out : ndarray, optional
+        Arreglo destino reutilizable. Si es None se crea uno nuevo.
+
+    Returns
+    -------
+    ndarray
+    """
+    if out is None:
+        out = new_landmark_array()
+    if isinstance(hand_result, np.ndarray):
+        out[...] = hand_result
+    elif getattr(hand_result, "array", None) is not None:
+        out[...] = hand_result.array
+    elif not (hasattr(hand_result, "SerializeToString") and _copy_wire(hand_result.SerializeToString(), out)):
+        out.reshape(-1)[:] = np.fromiter(chain.from_iterable(map(_XYZ, hand_result.landmark)),
+                                         dtype=np.float32, count=3 * NUM_LANDMARKS)
+    return out
+
+
+def _copy_wire(data, out):
+    """
+    Copia a `out` los landmarks de un `NormalizedLandmarkList` serializado.
+
+    Devuelve False, sin tocar `out`, si los bytes no tienen exactamente 21
+    landmarks con x, y, z y nada más (por ejemplo, con `visibility`).
+    """
+    if len(data) != _WIRE_SIZE:
+        return False
+    for offset, tags in _WIRE_TAGS:
+        if data[offset::_WIRE_RECORD] != tags:
+            return False
+    # Vista (21, 3) sobre los floats little-endian, saltando las etiquetas
+    out[...] = np.ndarray((NUM_LANDMARKS, 3), dtype="<f4", buffer=data, offset=3, strides=(_WIRE_RECORD, 5))
+    return True
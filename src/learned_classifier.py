@@ -0,0 +1,317 @@
+import math
+import numpy as np
+from .enums.gesture_enums import Gest
+
+# Landmark que define el eje y la escala de la mano: base del dedo medio
+_AXIS_POINT = 9
+# Landmark que fija el lado positivo de la perpendicular: base del índice
+_SIDE_POINT = 5
+
+# Dimensión del vector de características: (a lo largo, perpendicular, z) de los 20 landmarks no muñeca
+NUM_FEATURES = 60
+
+
+def hand_features(landmarks):
+    """
+    Calcula características normalizadas e invariantes a traslación, escala,
+    rotación en el plano de la imagen y simetría (mano izquierda o derecha).
+
+    Cada landmark se expresa respecto a la muñeca como (a lo largo, perpendicular, z)
+    en la base formada por el eje muñeca -> base del dedo medio, dividido por la
+    longitud de ese eje. La perpendicular se orienta para que la base del índice
+    quede siempre del mismo lado, así un modelo entrenado con una mano sirve
+    para la otra. El cambio de base es un solo producto por una matriz 3x3.
+
+    Parameters
+    ----------
+    landmarks : ndarray
+        Landmarks `(21, 3)` de una mano o `(N, 21, 3)` de N manos.
+
+    Returns
+    -------
+    ndarray
+        Características `(NUM_FEATURES,)` o `(N, NUM_FEATURES)` float64.
+    """
+    lm = np.asarray(landmarks, dtype=np.float64)
+    if lm.ndim == 2:
+        # Una sola mano: la base se calcula con escalares de Python, más rápido que con NumPy
+        rel = lm[1:] - lm[0]
+        ax, ay = rel[_AXIS_POINT - 1, :2].tolist()
+        sx, sy = rel[_SIDE_POINT - 1, :2].tolist()
+        sq = max(ax * ax + ay * ay, 1e-12)
+        side = -1.0 if sx * ay - sy * ax < 0 else 1.0
+        basis = np.array([
+            [ax / sq, side * ay / sq, 0.0],
+            [ay / sq, -side * ax / sq, 0.0],
+            [0.0, 0.0, 1.0 / math.sqrt(sq)],
+        ])
+        return (rel @ basis).reshape(NUM_FEATURES)
+
+    rel = lm[:, 1:] - lm[:, :1]
+    ax, ay = rel[:, _AXIS_POINT - 1, 0], rel[:, _AXIS_POINT - 1, 1]
+    sx, sy = rel[:, _SIDE_POINT - 1, 0], rel[:, _SIDE_POINT - 1, 1]
+    sq = np.maximum(ax * ax + ay * ay, 1e-12)
+    # La base del índice (sx, sy) debe quedar con perpendicular positiva
+    side = np.where(sx * ay - sy * ax < 0, -1.0, 1.0)
+    basis = np.zeros((len(lm), 3, 3), dtype=np.float64)
+    basis[:, 0, 0] = ax / sq
+    basis[:, 0, 1] = side * ay / sq
+    basis[:, 1, 0] = ay / sq
+    basis[:, 1, 1] = -side * ax / sq
+    basis[:, 2, 2] = 1.0 / np.sqrt(sq)
+    return np.matmul(rel, basis).reshape(len(lm), NUM_FEATURES)
+
+
+def _as_gest(value):
+    """Convierte un entero en `Gest` si existe ese gesto."""
+    try:
+        return Gest(value)
+    except ValueError:
+        return value
+
+
+class LearnedClassifier:
+    """
+    Interfaz de los clasificadores aprendidos sobre `hand_features`.
+
+    Atributos
+    ----------
+    classes : ndarray
+        valor de `Gest` de cada clase.
+    mean : ndarray
+        media de cada característica en el entrenamiento.
+    std : ndarray
+        desviación típica de cada característica en el entrenamiento.
+    """
+
+    kind = None
+
+    def __init__(self):
+        self.classes = None
+        self.mean = None
+        self.std = None
+
+    def fit(self, features, labels):
+        """
+        Entrena el clasificador.
+
+        Parameters
+        ----------
+        features : ndarray
+            Características `(N, NUM_FEATURES)` de `hand_features`.
+        labels : ndarray
+            Gesto `(N,)` de cada mano.
+        """
+        features = np.asarray(features, dtype=np.float64)
+        labels = np.asarray(labels, dtype=np.int64)
+        self.classes, targets = np.unique(labels, return_inverse=True)
+        self.mean = features.mean(axis=0)
+        self.std = np.maximum(features.std(axis=0), 1e-6)
+        self._fit((features - self.mean) / self.std, targets)
+        return self
+
+    def predict(self, features):
+        """Devuelve el gesto `(N,)` int64 de cada fila de `features`."""
+        z = (np.asarray(features, dtype=np.float64) - self.mean) / self.std
+        return self.classes[self._predict(z)]
+
+    def classify(self, landmarks):
+        """Clasifica una mano a partir de sus landmarks `(21, 3)` y devuelve un `Gest`."""
+        z = (hand_features(landmarks) - self.mean) / self.std
+        return _as_gest(int(self.classes[self._predict(z[None])[0]]))
+
+    def save(self, path):
+        """Guarda el modelo en un archivo `.npz`."""
+        np.savez(path, kind=self.kind, classes=self.classes, mean=self.mean, std=self.std,
+                 **self._params())
+
+    def _load(self, data):
+        self.classes = data["classes"]
+        self.mean = data["mean"]
+        self.std = data["std"]
+
+    def _fit(self, z, targets):
+        raise NotImplementedError
+
+    def _predict(self, z):
+        raise NotImplementedError
+
+    def _params(self):
+        return {}
+
+
+class KNNClassifier(LearnedClassifier):
+    """
+    k vecinos más cercanos con distancia euclidiana sobre las características
+    estandarizadas. Para acotar el costo por mano se guardan como mucho
+    `max_samples` ejemplos por clase.
+
+    Parameters
+    ----------
+    k : int
+        Número de vecinos que votan.
+    max_samples : int
+        Ejemplos guardados por clase, elegidos al azar.
+    seed : int
+        Semilla de la selección de ejemplos.
+    """
+
+    kind = "knn"
+
+    def __init__(self, k=5, max_samples=200, seed=0):
+        super().__init__()
+        self.k = k
+        self.max_samples = max_samples
+        self.seed = seed
+        self.samples = None
+        self.targets = None
+        self._sq_norms = None
+
+    def _fit(self, z, targets):
+        rng = np.random.default_rng(self.seed)
+        keep = []
+        for cls in range(len(self.classes)):
+            idx = np.flatnonzero(targets == cls)
+            if len(idx) > self.max_samples:
+                idx = rng.choice(idx, self.max_samples, replace=False)
+            keep.append(idx)
+        keep = np.sort(np.concatenate(keep))
+        self.samples = z[keep]
+        self.targets = targets[keep]
+        self._sq_norms = (self.samples ** 2).sum(axis=1)
+
+    def _predict(self, z):
+        # |a - b|^2 = |b|^2 - 2 a.b (+ |a|^2, igual para todos los ejemplos)
+        dist = self._sq_norms - 2.0 * (z @ self.samples.T)
+        k = min(self.k, len(self.samples))
+        nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        votes = np.zeros((len(z), len(self.classes)), dtype=np.int64)
+        np.add.at(votes, (np.arange(len(z))[:, None], self.targets[nearest]), 1)
+        return votes.argmax(axis=1)
+
+    def _params(self):
+        return {"k": self.k, "samples": self.samples, "targets": self.targets}
+
+    def _load(self, data):
+        super()._load(data)
+        self.k = int(data["k"])
+        self.samples = data["samples"]
+        self.targets = data["targets"]
+        self._sq_norms = (self.samples ** 2).sum(axis=1)
+
+
+class MLPClassifier(LearnedClassifier):
+    """
+    Perceptrón de una capa oculta con ReLU y salida softmax, entrenado con Adam
+    por mini-lotes. La inferencia son dos productos matriciales pequeños.
+
+    Parameters
+    ----------
+    hidden : int
+        Neuronas de la capa oculta.
+    epochs : int
+        Pasadas sobre los datos de entrenamiento.
+    learning_rate : float
+        Tasa de aprendizaje de Adam.
+    weight_decay : float
+        Regularización L2 de los pesos.
+    batch_size : int
+        Ejemplos por mini-lote.
+    seed : int
+        Semilla de la inicialización y del orden de los lotes.
+    """
+
+    kind = "mlp"
+
+    def __init__(self, hidden=32, epochs=60, learning_rate=0.01, weight_decay=1e-4,
+                 batch_size=256, seed=0):
+        super().__init__()
+        self.hidden = hidden
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.weight_decay = weight_decay
+        self.batch_size = batch_size
+        self.seed = seed
+        self.w1 = self.b1 = self.w2 = self.b2 = None
+
+    def _fit(self, z, targets):
+        rng = np.random.default_rng(self.seed)
+        n, dim = z.shape
+        classes = len(self.classes)
+        params = [
+            rng.normal(0.0, np.sqrt(2.0 / dim), (dim, self.hidden)),
+            np.zeros(self.hidden),
+            rng.normal(0.0, np.sqrt(1.0 / self.hidden), (self.hidden, classes)),
+            np.zeros(classes),
+        ]
+        moments = [np.zeros_like(p) for p in params]
+        velocities = [np.zeros_like(p) for p in params]
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        onehot = np.eye(classes)[targets]
+        step = 0
+        for _ in range(self.epochs):
+            order = rng.permutation(n)
+            for lo in range(0, n, self.batch_size):
+                batch = order[lo:lo + self.batch_size]
+                x, y = z[batch], onehot[batch]
+                w1, b1, w2, b2 = params
+                hidden = np.maximum(x @ w1 + b1, 0.0)
+                logits = hidden @ w2 + b2
+                logits -= logits.max(axis=1, keepdims=True)
+                prob = np.exp(logits)
+                prob /= prob.sum(axis=1, keepdims=True)
+                # Gradientes de la entropía cruzada media
+                d_logits = (prob - y) / len(batch)
+                d_hidden = (d_logits @ w2.T) * (hidden > 0)
+                grads = [
+                    x.T @ d_hidden + self.weight_decay * w1,
+                    d_hidden.sum(axis=0),
+                    hidden.T @ d_logits + self.weight_decay * w2,
+                    d_logits.sum(axis=0),
+                ]
+                step += 1
+                for p, g, m, v in zip(params, grads, moments, velocities):
+                    m *= beta1
+                    m += (1 - beta1) * g
+                    v *= beta2
+                    v += (1 - beta2) * g * g
+                    m_hat = m / (1 - beta1 ** step)
+                    v_hat = v / (1 - beta2 ** step)
+                    p -= self.learning_rate * m_hat / (np.sqrt(v_hat) + eps)
+        self.w1, self.b1, self.w2, self.b2 = params
+
+    def _predict(self, z):
+        hidden = np.maximum(z @ self.w1 + self.b1, 0.0)
+        return (hidden @ self.w2 + self.b2).argmax(axis=1)
+
+    def _params(self):
+        return {"w1": self.w1, "b1": self.b1, "w2": self.w2, "b2": self.b2}
+
+    def _load(self, data):
+        super()._load(data)
+        self.w1, self.b1, self.w2, self.b2 = data["w1"], data["b1"], data["w2"], data["b2"]
+        self.hidden = self.w1.shape[1]
+
+
+# Clasificadores aprendidos disponibles por nombre
+CLASSIFIERS = {
+    KNNClassifier.kind: KNNClassifier,
+    MLPClassifier.kind: MLPClassifier,
+}
+
+
+def make_classifier(kind, **params):
+    """Crea un clasificador sin entrenar por su nombre en `CLASSIFIERS`."""
+    try:
+        cls = CLASSIFIERS[kind]
+    except KeyError:
+        raise ValueError(f"Clasificador desconocido: {kind!r} (disponibles: {', '.join(CLASSIFIERS)})")
+    return cls(**params)
+
+
+def load_classifier(path):
+    """Carga un clasificador guardado con `LearnedClassifier.save`."""
+    with np.load(path) as data:
+        classifier = make_classifier(str(data["kind"]))
+        classifier._load(data)
+    return classifier
@@ -0,0 +1,245 @@
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RollingHistogram:
+    """
+    Guarda las últimas `size` muestras (en ns) de una medida en un buffer circular
+    preasignado y calcula sus percentiles bajo demanda.
+    """
+
+    def __init__(self, size=512):
+        self._samples = np.zeros(size, dtype=np.int64)
+        self._idx = 0
+        self.count = 0  # Total de muestras registradas desde el inicio
+
+    def add(self, value):
+        """Registra una muestra."""
+        self._samples[self._idx] = value
+        self._idx = (self._idx + 1) % len(self._samples)
+        self.count += 1
+
+    def summary(self):
+        """Devuelve media, p50, p99 y máximo (ms) de las muestras de la ventana."""
+        n = min(self.count, len(self._samples))
+        if n == 0:
+            return {"count": 0}
+        window = self._samples[:n].copy() / 1e6
+        p50, p99 = np.percentile(window, (50, 99))
+        return {
+            "count": self.count,
+            "mean_ms": round(float(window.mean()), 3),
+            "p50_ms": round(float(p50), 3),
+            "p99_ms": round(float(p99), 3),
+            "max_ms": round(float(window.max()), 3),
+        }
+
+
+class _StageTimer:
+    """Context manager que mide una etapa y la registra en su histograma."""
+
+    __slots__ = ("_hist", "_t0")
+
+    def __init__(self, hist):
+        self._hist = hist
+        self._t0 = 0
+
+    def __enter__(self):
+        self._t0 = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self._hist.add(time.perf_counter_ns() - self._t0)
+
+
+class _NullTimer:
+    """Context manager sin efecto que se usa cuando las métricas están desactivadas."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    """
+    Temporizadores por etapa, contadores y transiciones de gesto del bucle principal.
+
+    Con `enabled=False` cada llamada retorna de inmediato (y `stage` devuelve un
+    context manager vacío), por lo que la instrumentación puede quedarse en
+    producción.
+
+    Atributos
+    ----------
+    enabled : bool
+        si se registran las medidas.
+    log_interval : float
+        segundos entre líneas de log estructuradas; 0 desactiva el log periódico.
+    """
+
+    def __init__(self, enabled=False, log_interval=10.0, window=512):
+        self.enabled = enabled
+        self.log_interval = log_interval
+        self._window = window
+        self._stages = {}
+        self._timers = {}
+        self.counters = Counter()
+        self.gauges = {}
+        self.transitions = Counter()
+        self._last_gesture = {}
+        self._commit_latency = {}
+        self._start_time = time.monotonic()
+        self._report_time = self._start_time
+        self._fps_time = self._start_time
+        self._fps_frames = 0
+        self._fps = 0.0
+
+    def stage(self, name):
+        """
+        Devuelve un context manager que mide la etapa `name`.
+
+        Ejemplo
+        -------
+        with metrics.stage("inference"):
+            results = hands.process(image)
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        timer = self._timers.get(name)
+        if timer is None:
+            self._stages[name] = RollingHistogram(self._window)
+            timer = self._timers[name] = _StageTimer(self._stages[name])
+        return timer
+
+    def observe(self, name, value_ns):
+        """Registra directamente una duración (ns) en el histograma `name`."""
+        if not self.enabled:
+            return
+        hist = self._stages.get(name)
+        if hist is None:
+            hist = self._stages[name] = RollingHistogram(self._window)
+        hist.add(value_ns)
+
+    def count(self, name, amount=1):
+        """Incrementa el contador `name`."""
+        if self.enabled:
+            self.counters[name] += amount
+
+    def gauge(self, name, value):
+        """Fija el valor actual de la medida `name`."""
+        if self.enabled:
+            self.gauges[name] = value
+
+    def gesture(self, hand, gesture):
+        """Registra el gesto actual de una mano y cuenta las transiciones entre gestos."""
+        if not self.enabled:
+            return
+        prev = self._last_gesture.get(hand)
+        if gesture != prev:
+            self._last_gesture[hand] = gesture
+            if prev is not None:
+                self.transitions[f"{hand}:{_gesture_name(prev)}->{_gesture_name(gesture)}"] += 1
+
+    def commit_latency(self, gesture, seconds):
+        """Registra el tiempo entre la aparición de un gesto y su confirmación."""
+        if not self.enabled:
+            return
+        name = _gesture_name(gesture)
+        hist = self._commit_latency.get(name)
+        if hist is None:
+            hist = self._commit_latency[name] = RollingHistogram(self._window)
+        hist.add(int(seconds * 1e9))
+
+    def snapshot(self):
+        """Devuelve un diccionario serializable con el estado actual de las métricas."""
+        return {
+            "uptime_s": round(time.monotonic() - self._start_time, 1),
+            "fps": round(self._fps, 2),
+            "counters": dict(self.counters),
+            "gauges": dict(self.gauges),
+            "stages": {name: hist.summary() for name, hist in list(self._stages.items())},
+            "transitions": dict(self.transitions),
+            "commit_latency": {name: hist.summary() for name, hist in list(self._commit_latency.items())},
+        }
+
+    def tick(self, now=None):
+        """
+        Marca el fin de un frame procesado: actualiza los FPS y, cada
+        `log_interval` segundos, emite una línea de log con `snapshot()` en JSON.
+        """
+        if not self.enabled:
+            return
+        self.counters["frames"] += 1
+        now = time.monotonic() if now is None else now
+        elapsed = now - self._fps_time
+        if elapsed >= 1.0:
+            self._fps = (self.counters["frames"] - self._fps_frames) / elapsed
+            self._fps_frames = self.counters["frames"]
+            self._fps_time = now
+        if self.log_interval and now - self._report_time >= self.log_interval:
+            self._report_time = now
+            logger.info("metrics %s", json.dumps(self.snapshot(), separators=(",", ":")))
+
+
+def _gesture_name(gesture):
+    return getattr(gesture, "name", str(gesture))
+
+
+class MetricsServer:
+    """
+    Servidor HTTP local que publica `Metrics.snapshot()` en JSON en `GET /metrics`.
+
+    Escucha solo en 127.0.0.1 y corre en un hilo en segundo plano.
+    """
+
+    def __init__(self, metrics, port=9464, host="127.0.0.1"):
+        self.metrics = metrics
+        metrics_ref = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(metrics_ref.snapshot()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self):
+        """Puerto en el que escucha el servidor."""
+        return self._server.server_address[1]
+
+    def start(self):
+        """Inicia el servidor en segundo plano."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Detiene el servidor."""
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,401 @@
+import multiprocessing as mp_proc
+import queue
+import time
+from multiprocessing import shared_memory
+import cv2
+import numpy as np
+from .session_recorder import results_to_record, session_dtype
+
+# Los procesos hijos se crean con "spawn" en todas las plataformas: es lo único
+# disponible en Windows y evita heredar hilos de OpenCV y MediaPipe con fork.
+_CTX = mp_proc.get_context("spawn")
+
+
+def _ring_view(shm, slots, slot_bytes):
+    """Vista (slots, slot_bytes) uint8 sobre el bloque de memoria compartida."""
+    return np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=shm.buf)
+
+
+def _slot_image(ring, slot, height, width):
+    """Vista contigua (alto, ancho, 3) de la imagen guardada en `slot`."""
+    return ring[slot, :height * width * 3].reshape(height, width, 3)
+
+
+def _capture_main(shm_name, slots, max_size, camera_index, free_slots, jobs, stop, fps, stats,
+                  errors, capture_size=None, read_failure_timeout=5.0):
+    """
+    Proceso de captura: lee la cámara, voltea y convierte a RGB cada frame
+    directamente en un slot libre del anillo y publica (seq, instante, slot, alto, ancho).
+
+    Si no hay slots libres el frame se descarta. Solo se publican frames al ritmo
+    indicado por `fps` (0 sin límite); el resto se lee y se descarta para que la
+    cámara no acumule frames viejos.
+
+    Si la fuente no se puede abrir, falla al leer durante más de
+    `read_failure_timeout` segundos o la captura lanza una excepción, envía el
+    mensaje por `errors` y termina. El fin de un video o de una secuencia de
+    imágenes no es un error.
+    """
+    # Al terminar no se espera a vaciar las colas: el proceso principal puede haber dejado de leer
+    jobs.cancel_join_thread()
+    free_slots.cancel_join_thread()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    max_w, max_h = max_size
+    ring = _ring_view(shm, slots, max_w * max_h * 3)
+    cap = None
+    try:
+        from .frame_sources import open_source
+        from .frame_buffers import FrameBufferPool, mirror_rgb
+
+        cap = open_source(camera_index)
+        if not cap.isOpened():
+            errors.put(f"No se pudo abrir la fuente de frames {camera_index!r}.")
+            return
+        if capture_size is not None:
+            cap.set_resolution(*capture_size)
+        captured = None  # Buffer de captura reutilizado entre lecturas
+        pool = FrameBufferPool()
+        seq = 0
+        next_time = 0.0
+        last_read = time.monotonic()
+        while not stop.is_set() and cap.isOpened():
+            success, frame, now = cap.read(captured)
+            if not success:
+                if time.monotonic() - last_read > read_failure_timeout:
+                    errors.put(f"No se pudo leer de la fuente de frames {camera_index!r} "
+                               f"durante {read_failure_timeout:g} s.")
+                    return
+                time.sleep(0.005)
+                continue
+            last_read = time.monotonic()
+            captured = frame
+            with stats.get_lock():
+                stats[0] += 1  # Frames capturados
+            target = fps.value
+            if target > 0:
+                if now < next_time:
+                    continue
+                next_time = max(next_time + 1 / target, now)
+            try:
+                slot = free_slots.get_nowait()
+            except queue.Empty:
+                with stats.get_lock():
+                    stats[1] += 1  # Frames descartados
+                continue
+
+            height, width = frame.shape[:2]
+            if width > max_w or height > max_h:
+                scale = min(max_w / width, max_h / height)
+                width, height = int(width * scale), int(height * scale)
+                frame = cv2.resize(frame, (width, height), dst=pool.get("resized", (height, width, 3)),
+                                   interpolation=cv2.INTER_AREA)
+            # Volteo y conversión a RGB en una pasada, directamente en el slot
+            mirror_rgb(frame, _slot_image(ring, slot, height, width))
+            seq += 1
+            jobs.put((seq, now, slot, height, width))
+    except Exception as exc:
+        errors.put(f"Error en la captura: {exc}")
+    finally:
+        if cap is not None:
+            cap.release()
+        ring = None
+        shm.close()
+
+
+def _inference_main(shm_name, slots, max_size, free_slots, jobs, results, stop, stats, errors,
+                    max_hands, min_detection_confidence, min_tracking_confidence, roi_params,
+                    model_complexity=None):
+    """
+    Proceso de inferencia: toma el trabajo más reciente (descartando los más
+    viejos), ejecuta `hands.process` sobre el slot y devuelve los landmarks como
+    un registro compacto con el dtype de `session_dtype`.
+
+    Si el modelo no se puede crear o `hands.process` lanza una excepción, envía
+    el mensaje por `errors` y termina.
+    """
+    from .roi import RoiHands, RoiTracker
+    from .startup import create_hands_model
+
+    results.cancel_join_thread()
+    free_slots.cancel_join_thread()
+    shm = shared_memory.SharedMemory(name=shm_name)
+    max_w, max_h = max_size
+    ring = _ring_view(shm, slots, max_w * max_h * 3)
+    image = None
+    hands = None
+    record = np.zeros(1, dtype=session_dtype(max_hands))
+    roi = RoiTracker(**roi_params) if roi_params is not None else None
+    try:
+        hands = create_hands_model(max_hands, min_detection_confidence, min_tracking_confidence,
+                                   model_complexity)
+        if roi is not None:
+            # Un modelo para los frames completos y otro para los recortes
+            hands = RoiHands(hands, create_hands_model(max_hands, min_detection_confidence,
+                                                       min_tracking_confidence, model_complexity))
+        while not stop.is_set():
+            try:
+                job = jobs.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            # Solo interesa el frame más reciente: los anteriores se liberan sin procesar
+            while True:
+                try:
+                    newer = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                free_slots.put(job[2])
+                with stats.get_lock():
+                    stats[2] += 1  # Frames viejos descartados
+                job = newer
+
+            seq, timestamp, slot, height, width = job
+            image = _slot_image(ring, slot, height, width)
+            image.flags.writeable = False
+            start = time.perf_counter_ns()
+            if roi is not None:
+                model_input, box = roi.prepare(image)
+                output = hands.process(model_input, box, image.shape)
+                roi.finish(output, box, image.shape)
+            else:
+                output = hands.process(image)
+            inference_ns = time.perf_counter_ns() - start
+            results_to_record(output, timestamp, record, max_hands)
+            # El slot se libera en el proceso principal, que puede necesitarlo para la vista previa
+            results.put((seq, timestamp, slot, height, width, inference_ns, record.tobytes()))
+    except Exception as exc:
+        errors.put(f"Error en la inferencia: {exc}")
+    finally:
+        if hands is not None:
+            hands.close()
+        # Las vistas sobre la memoria compartida deben liberarse antes de cerrarla
+        image = ring = None
+        shm.close()
+
+
+class PipelineFrame:
+    """
+    Frame procesado por el pipeline.
+
+    Atributos
+    ----------
+    seq : int
+        número de secuencia asignado en la captura.
+    timestamp : float
+        instante de captura.
+    record : ndarray
+        registro (1,) con el dtype de `session_dtype` con los landmarks del frame.
+    inference_ns : int
+        duración de `hands.process` en el proceso de inferencia.
+    """
+
+    __slots__ = ("seq", "timestamp", "slot", "height", "width", "inference_ns", "record")
+
+    def __init__(self, seq, timestamp, slot, height, width, inference_ns, record):
+        self.seq = seq
+        self.timestamp = timestamp
+        self.slot = slot
+        self.height = height
+        self.width = width
+        self.inference_ns = inference_ns
+        self.record = record
+
+
+class InferencePipeline:
+    """
+    Ejecuta la captura y `hands.process` en procesos separados.
+
+    Los frames viajan del proceso de captura a los de inferencia por un anillo de
+    slots en `multiprocessing.shared_memory`, sin serializar la imagen; por las
+    colas solo pasan números de slot y registros de landmarks de pocos cientos de
+    bytes. Cada frame lleva un número de secuencia: los procesos de inferencia
+    descartan los trabajos viejos y `read` descarta los resultados que llegan
+    fuera de orden, por lo que el proceso principal siempre recibe el frame más
+    reciente.
+
+    Atributos
+    ----------
+    frames_captured : int
+        frames leídos de la cámara.
+    frames_dropped : int
+        frames descartados por falta de slots, por llegar tarde o por ser viejos.
+    error : str
+        error que detuvo el pipeline, o None.
+    """
+
+    def __init__(self, camera_index=0, max_frame_size=(1920, 1080), slots=6, workers=1,
+                 max_hands=2, min_detection_confidence=0.5, min_tracking_confidence=0.5,
+                 roi_params=None, fps=0, model_complexity=None, capture_size=None,
+                 read_failure_timeout=5.0):
+        """
+        Parameters
+        ----------
+        camera_index : int o str
+            Índice de la cámara de OpenCV, o video o imágenes (ver `open_source`).
+        max_frame_size : tuple(int, int)
+            (ancho, alto) máximo de un frame; los mayores se reducen al copiarlos al slot.
+        slots : int
+            Número de slots del anillo de memoria compartida.
+        workers : int
+            Número de procesos de inferencia.
+        roi_params : dict, optional
+            Parámetros de `RoiTracker` para recortar la entrada del modelo; None lo desactiva.
+        fps : float
+            Frames por segundo publicados por la captura (0 sin límite).
+        model_complexity : int, optional
+            Complejidad del modelo de MediaPipe; por defecto la de MediaPipe.
+        capture_size : tuple(int, int), optional
+            (ancho, alto) solicitado a la cámara; por defecto su resolución.
+        read_failure_timeout : float
+            Segundos que la cámara puede fallar al leer antes de detener el pipeline.
+        """
+        self.camera_index = camera_index
+        self.max_frame_size = max_frame_size
+        self.slots = max(slots, workers + 3)
+        self.workers = workers
+        self.max_hands = max_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.roi_params = roi_params
+        self.model_complexity = model_complexity
+        self.capture_size = capture_size
+        self.read_failure_timeout = read_failure_timeout
+        self._error = None
+        self._dtype = session_dtype(max_hands)
+        self._fps = _CTX.Value('d', fps, lock=False)
+        self._stats = _CTX.Array('q', 3)  # Capturados, sin slot libre, viejos
+        self._late = 0  # Resultados fuera de orden descartados en este proceso
+        self._last_seq = 0
+        self._stop = _CTX.Event()
+        self._free_slots = _CTX.Queue()
+        self._jobs = _CTX.Queue()
+        self._results = _CTX.Queue()
+        self._errors = _CTX.Queue()  # Mensajes de error de los procesos hijos
+        self._shm = None
+        self._ring = None
+        self._processes = []
+
+    def start(self):
+        """Crea la memoria compartida y lanza los procesos de captura e inferencia."""
+        width, height = self.max_frame_size
+        slot_bytes = width * height * 3
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * slot_bytes)
+        self._ring = _ring_view(self._shm, self.slots, slot_bytes)
+        for slot in range(self.slots):
+            self._free_slots.put(slot)
+
+        self._processes.append(_CTX.Process(
+            target=_capture_main, name="PipelineCapture", daemon=True,
+            args=(self._shm.name, self.slots, self.max_frame_size, self.camera_index,
+                  self._free_slots, self._jobs, self._stop, self._fps, self._stats, self._errors,
+                  self.capture_size, self.read_failure_timeout)
+        ))
+        for idx in range(self.workers):
+            self._processes.append(_CTX.Process(
+                target=_inference_main, name=f"PipelineInference-{idx}", daemon=True,
+                args=(self._shm.name, self.slots, self.max_frame_size, self._free_slots,
+                      self._jobs, self._results, self._stop, self._stats, self._errors, self.max_hands,
+                      self.min_detection_confidence, self.min_tracking_confidence, self.roi_params,
+                      self.model_complexity)
+            ))
+        for process in self._processes:
+            process.start()
+        return self
+
+    @property
+    def running(self):
+        """True mientras sigan activos el proceso de captura y alguno de inferencia."""
+        processes = self._processes
+        return (bool(processes) and not self._stop.is_set() and processes[0].is_alive()
+                and any(process.is_alive() for process in processes[1:]))
+
+    @property
+    def error(self):
+        """
+        Error que detuvo el pipeline: el mensaje enviado por un proceso hijo o,
+        si terminó sin enviarlo, su código de salida. None si no hubo error.
+        """
+        if self._error is None:
+            self._check_errors()
+        if self._error is None:
+            for process in self._processes:
+                if process.exitcode not in (None, 0):
+                    self._error = f"El proceso {process.name} terminó con código {process.exitcode}."
+                    break
+        return self._error
+
+    def _check_errors(self):
+        """Recoge el primer error enviado por los procesos hijos y detiene el pipeline."""
+        try:
+            message = self._errors.get_nowait()
+        except queue.Empty:
+            return
+        if self._error is None:
+            self._error = message
+        self._stop.set()
+
+    @property
+    def frames_captured(self):
+        return self._stats[0]
+
+    @property
+    def frames_dropped(self):
+        return self._stats[1] + self._stats[2] + self._late
+
+    def set_fps(self, fps):
+        """Cambia los frames por segundo publicados por la captura (0 sin límite)."""
+        self._fps.value = fps
+
+    def read(self, timeout=None):
+        """
+        Devuelve el resultado más reciente, o None si no llegó ninguno antes del timeout.
+
+        Los resultados más viejos que el último entregado se descartan y sus
+        slots se liberan. El slot del frame devuelto se debe liberar con `release`.
+        """
+        try:
+            item = self._results.get(timeout=timeout)
+        except queue.Empty:
+            # Sin frames: puede que un proceso haya fallado
+            self._check_errors()
+            return None
+        while True:
+            try:
+                newer = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(item)
+            item = newer
+        if item[0] <= self._last_seq:
+            # Llegó después de un frame posterior (con varios procesos de inferencia)
+            self._discard(item)
+            return None
+        self._last_seq = item[0]
+        seq, timestamp, slot, height, width, inference_ns, data = item
+        record = np.frombuffer(data, dtype=self._dtype)
+        return PipelineFrame(seq, timestamp, slot, height, width, inference_ns, record)
+
+    def _discard(self, item):
+        self._free_slots.put(item[2])
+        self._late += 1
+
+    def image(self, frame):
+        """Vista RGB (sin copiar) de la imagen del frame; válida hasta `release(frame)`."""
+        return _slot_image(self._ring, frame.slot, frame.height, frame.width)
+
+    def release(self, frame):
+        """Devuelve el slot del frame al anillo."""
+        self._free_slots.put(frame.slot)
+
+    def stop(self):
+        """Detiene los procesos y libera la memoria compartida."""
+        self._stop.set()
+        for process in self._processes:
+            process.join(timeout=2.0)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+        if self._shm is not None:
+            self._ring = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
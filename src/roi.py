@@ -0,0 +1,233 @@
+import cv2
+import numpy as np
+
+
+class RoiTracker:
+    """
+    Recorta la entrada de `hands.process` a la región donde estaban las manos en
+    el frame anterior y la reduce de tamaño, para que la inferencia procese menos
+    píxeles.
+
+    Los landmarks obtenidos sobre el recorte se transforman de vuelta a
+    coordenadas normalizadas del frame completo, de modo que `HandRecog` y
+    `Controller` reciben los mismos valores que sin recorte.
+
+    La región solo se mueve cuando las manos se acercan a su borde o cambian
+    mucho de tamaño; mientras tanto se mantiene fija para que el seguimiento
+    interno de MediaPipe trabaje sobre un sistema de coordenadas estable. Si se
+    pierden las manos, o si con el margen no caben en un recorte cuadrado, el
+    siguiente frame se procesa completo. Los recortes y los frames completos
+    deben ir a modelos distintos (ver `RoiHands`).
+
+    Atributos
+    ----------
+    margin : float
+        margen añadido alrededor de las manos, como fracción del tamaño de la caja.
+    max_side : int
+        lado máximo en píxeles del recorte que se envía al modelo.
+    min_fraction : float
+        lado mínimo del recorte como fracción del lado menor del frame.
+    full_frame_interval : int
+        cada cuántos frames se procesa el frame completo para detectar manos nuevas;
+        0 lo desactiva.
+    roi_frames : int
+        frames procesados con recorte.
+    full_frames : int
+        frames procesados completos.
+    """
+
+    def __init__(self, margin=0.3, max_side=320, min_fraction=0.25, full_frame_interval=30):
+        self.margin = margin
+        self.max_side = max_side
+        self.min_fraction = min_fraction
+        self.full_frame_interval = full_frame_interval
+        self.roi_frames = 0
+        self.full_frames = 0
+        self._box = None  # (x0, y0, x1, y1) en píxeles del frame completo
+        self._since_full = 0
+
+    def reset(self):
+        """Olvida la región actual; el siguiente frame se procesa completo."""
+        self._box = None
+
+    def prepare(self, image):
+        """
+        Devuelve la imagen que se debe pasar a `hands.process` y la caja usada.
+
+        Parameters
+        ----------
+        image : ndarray
+            Frame completo (ya volteado y en RGB).
+
+        Returns
+        -------
+        tuple(ndarray, tuple o None)
+            (imagen de entrada, caja (x0, y0, x1, y1)) o (image, None) si se usa
+            el frame completo.
+        """
+        self._since_full += 1
+        if self._box is None or (self.full_frame_interval and self._since_full >= self.full_frame_interval):
+            self._since_full = 0
+            self.full_frames += 1
+            return image, None
+
+        x0, y0, x1, y1 = self._box
+        crop = image[y0:y1, x0:x1]
+        side = max(x1 - x0, y1 - y0)
+        if side > self.max_side:
+            scale = self.max_side / side
+            size = (max(1, int(round((x1 - x0) * scale))), max(1, int(round((y1 - y0) * scale))))
+            crop = cv2.resize(crop, size, interpolation=cv2.INTER_AREA)
+        else:
+            crop = np.ascontiguousarray(crop)
+        self.roi_frames += 1
+        return crop, self._box
+
+    def finish(self, results, box, frame_shape):
+        """
+        Lleva los landmarks de `results` a coordenadas del frame completo y
+        actualiza la región para el siguiente frame.
+
+        Parameters
+        ----------
+        results : Object
+            Resultado de `hands.process` sobre la imagen devuelta por `prepare`.
+        box : tuple o None
+            Caja devuelta por `prepare`.
+        frame_shape : tuple
+            Forma del frame completo (alto, ancho, ...).
+        """
+        height, width = frame_shape[:2]
+        if not results.multi_hand_landmarks:
+            self._box = None
+            return
+
+        if box is not None:
+            x0, y0, x1, y1 = box
+            sx = (x1 - x0) / width
+            sy = (y1 - y0) / height
+            ox = x0 / width
+            oy = y0 / height
+            for hand_landmarks in results.multi_hand_landmarks:
+                for lm in hand_landmarks.landmark:
+                    lm.x = lm.x * sx + ox
+                    lm.y = lm.y * sy + oy
+                    lm.z = lm.z * sx  # z usa la misma escala que x en MediaPipe
+
+        self._update_box(results, width, height)
+
+    def _update_box(self, results, width, height):
+        """Recalcula la región si las manos salen de la zona interior de la actual."""
+        xs = [lm.x for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        ys = [lm.y for hand in results.multi_hand_landmarks for lm in hand.landmark]
+        hx0, hx1 = min(xs) * width, max(xs) * width
+        hy0, hy1 = min(ys) * height, max(ys) * height
+        hand_side = max(hx1 - hx0, hy1 - hy0)
+        side = max(hand_side * (1 + 2 * self.margin), self.min_fraction * min(width, height))
+        if side > min(width, height):
+            # Las manos no caben en un recorte cuadrado (por ejemplo, dos manos
+            # separadas más que el alto del frame): un recorte dejaría una fuera
+            self._box = None
+            return
+
+        if self._box is not None:
+            x0, y0, x1, y1 = self._box
+            inner = (x1 - x0) * self.margin / 2
+            inside = (hx0 >= x0 + inner and hx1 <= x1 - inner
+                      and hy0 >= y0 + inner and hy1 <= y1 - inner)
+            # Se conserva la caja si las manos siguen dentro y no sobra demasiado espacio
+            if inside and (x1 - x0) <= 2 * side:
+                return
+
+        cx = (hx0 + hx1) / 2
+        cy = (hy0 + hy1) / 2
+        x0 = int(round(min(max(cx - side / 2, 0), width - side)))
+        y0 = int(round(min(max(cy - side / 2, 0), height - side)))
+        x1 = min(width, x0 + int(round(side)))
+        y1 = min(height, y0 + int(round(side)))
+        if x1 - x0 < 2 or y1 - y0 < 2:
+            self._box = None
+            return
+        self._box = (x0, y0, x1, y1)
+
+
+def reset_tracking(hands):
+    """
+    Hace que un modelo `Hands` en modo seguimiento olvide las manos del frame
+    anterior, de modo que el siguiente frame pase por el detector de palmas.
+
+    Usa `reset()` si la versión de MediaPipe lo tiene (reinicia el grafo en
+    ~1 ms); si no, procesa una imagen vacía, tras la cual no queda ninguna mano
+    que seguir.
+    """
+    reset = getattr(hands, "reset", None)
+    if reset is not None:
+        reset()
+        return
+    blank = np.zeros((64, 64, 3), dtype=np.uint8)
+    blank.flags.writeable = False
+    hands.process(blank)
+
+
+class RoiHands:
+    """
+    Par de modelos de manos para la entrada que prepara `RoiTracker`: uno
+    procesa los frames completos y otro los recortes.
+
+    En modo seguimiento, MediaPipe usa los landmarks normalizados del frame
+    anterior como región del frame actual, así que un mismo modelo alimentado
+    con recortes y frames completos, o con recortes de otra geometría, aplica
+    esa región a una imagen con otra extensión. Con un modelo por tipo de
+    entrada cada uno solo sigue manos sobre imágenes de la misma extensión.
+    Cuando la caja del recorte cambia, o un modelo vuelve a recibir entrada
+    tras frames del otro, su seguimiento se reinicia (ver `reset_tracking`) en
+    lugar de arrastrar coordenadas de otra caja o de varios frames atrás.
+
+    Atributos
+    ----------
+    full : Object
+        modelo `Hands` para los frames completos.
+    crop : Object
+        modelo `Hands` para los recortes.
+    resets : int
+        veces que se reinició el seguimiento de alguno de los dos modelos.
+    """
+
+    def __init__(self, full, crop):
+        self.full = full
+        self.crop = crop
+        self.resets = 0
+        self._geometry = None  # (caja, forma del frame) del último recorte; None si fue un frame completo
+
+    def process(self, image, box=None, frame_shape=None):
+        """
+        Procesa la imagen devuelta por `RoiTracker.prepare`.
+
+        Parameters
+        ----------
+        image : ndarray
+            Frame completo o recorte.
+        box : tuple o None
+            Caja devuelta por `prepare`; None si `image` es el frame completo.
+        frame_shape : tuple, optional
+            Forma del frame completo del que sale el recorte.
+        """
+        if box is None:
+            if self._geometry is not None:
+                # Entre dos frames completos hubo recortes: lo que recuerda el
+                # modelo es de varios frames atrás
+                reset_tracking(self.full)
+                self.resets += 1
+                self._geometry = None
+            return self.full.process(image)
+        geometry = (box, frame_shape[:2] if frame_shape is not None else None)
+        if geometry != self._geometry:
+            # Otra caja, o la primera tras frames completos: se empieza a seguir de cero
+            reset_tracking(self.crop)
+            self.resets += 1
+            self._geometry = geometry
+        return self.crop.process(image)
+
+    def close(self):
+        self.full.close()
+        self.crop.close()
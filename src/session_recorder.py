@@ -0,0 +1,153 @@
+import os
+import struct
+import numpy as np
+from .landmarks import NUM_LANDMARKS, landmarks_to_array
+
+# Formato del archivo de sesión:
+#   cabecera de HEADER_SIZE bytes: MAGIC (8 bytes) + versión (uint32) + manos por frame (uint32)
+#   seguida de un registro de tamaño fijo por frame con el dtype de `session_dtype`,
+#   por lo que el archivo completo se puede abrir con `np.memmap` sin copiarlo.
+MAGIC = b"GCSESS\x00\x01"
+VERSION = 1
+HEADER_SIZE = 16
+_HEADER = struct.Struct("<8sII")
+
+# Valores del campo `label`
+LABEL_NONE = -1
+LABEL_LEFT = 0
+LABEL_RIGHT = 1
+
+
+def session_dtype(max_hands=2):
+    """
+    Devuelve el dtype estructurado de un frame grabado.
+
+    Campos
+    ------
+    t : float64
+        instante de captura del frame, en segundos.
+    num_hands : uint8
+        número de manos detectadas en el frame.
+    label : int8 (max_hands,)
+        lateralidad de cada mano según MediaPipe (`LABEL_LEFT`, `LABEL_RIGHT` o `LABEL_NONE`).
+    score : float32 (max_hands,)
+        confianza de la lateralidad.
+    landmarks : float32 (max_hands, 21, 3)
+        landmarks normalizados (x, y, z) de cada mano.
+    """
+    return np.dtype([
+        ('t', '<f8'),
+        ('num_hands', 'u1'),
+        ('label', 'i1', (max_hands,)),
+        ('score', '<f4', (max_hands,)),
+        ('landmarks', '<f4', (max_hands, NUM_LANDMARKS, 3)),
+    ])
+
+
+def results_to_record(results, timestamp, rec, max_hands):
+    """
+    Copia un resultado de `hands.process` a un registro con el dtype de `session_dtype`.
+
+    Parameters
+    ----------
+    results : Object
+        Resultado de `hands.process`, o None para un frame sin manos.
+    timestamp : float
+        Instante de captura del frame.
+    rec : ndarray
+        Arreglo de forma (1,) con el dtype de `session_dtype(max_hands)`.
+    max_hands : int
+        Número máximo de manos que caben en el registro.
+    """
+    rec['t'][0] = timestamp
+    rec['label'][0] = LABEL_NONE
+    rec['score'][0] = 0.0
+    num_hands = 0
+    if results is not None and results.multi_hand_landmarks:
+        hands = results.multi_hand_landmarks[:max_hands]
+        handedness = results.multi_handedness or []
+        for idx, hand_landmarks in enumerate(hands):
+            landmarks_to_array(hand_landmarks, rec['landmarks'][0, idx])
+            if idx < len(handedness):
+                classification = handedness[idx].classification[0]
+                rec['label'][0, idx] = LABEL_RIGHT if classification.label == 'Right' else LABEL_LEFT
+                rec['score'][0, idx] = classification.score
+        num_hands = len(hands)
+    rec['num_hands'][0] = num_hands
+
+
+class SessionRecorder:
+    """
+    Graba por frame el instante, la lateralidad y los landmarks de cada mano
+    detectada por MediaPipe en un archivo binario compacto.
+
+    Atributos
+    ----------
+    path : str
+        ruta del archivo de sesión.
+    max_hands : int
+        número máximo de manos guardadas por frame.
+    frames : int
+        número de frames escritos.
+    """
+
+    def __init__(self, path, max_hands=2):
+        self.path = path
+        self.max_hands = max_hands
+        self.frames = 0
+        self._record = np.zeros(1, dtype=session_dtype(max_hands))
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, max_hands))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, timestamp, results):
+        """
+        Escribe un frame.
+
+        Parameters
+        ----------
+        timestamp : float
+            Instante de captura del frame.
+        results : Object
+            Resultado de `hands.process`. Si no hay manos se graba un frame vacío.
+        """
+        results_to_record(results, timestamp, self._record, self.max_hands)
+        self.write_record(self._record)
+
+    def write_record(self, record):
+        """Escribe un frame ya convertido con `results_to_record` (dtype de `session_dtype`)."""
+        self._file.write(record.tobytes())
+        self.frames += 1
+
+    def close(self):
+        """Cierra el archivo de sesión."""
+        if not self._file.closed:
+            self._file.close()
+
+
+def load_session(path):
+    """
+    Abre un archivo de sesión como arreglo estructurado mapeado en memoria.
+
+    Un último registro incompleto (por ejemplo, de una grabación interrumpida)
+    se ignora.
+
+    Returns
+    -------
+    np.memmap
+        Arreglo de forma (N,) con el dtype de `session_dtype`.
+    """
+    with open(path, "rb") as f:
+        magic, version, max_hands = _HEADER.unpack(f.read(HEADER_SIZE))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} no es un archivo de sesión válido.")
+    dtype = session_dtype(max_hands)
+    count = (os.path.getsize(path) - HEADER_SIZE) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_SIZE, shape=(count,))
@@ -0,0 +1,141 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .gesture_handlers import Controller
+from .gesture_session import GestureSession
+from .session_recorder import load_session
+from .frame_results import results_from_frame
+from .system_backends import recording_backends
+
+
+class ReplayReport:
+    """
+    Resumen de una reproducción.
+
+    Atributos
+    ----------
+    frames : int
+        número de frames reproducidos.
+    elapsed : float
+        tiempo de reloj empleado, en segundos.
+    duration : float
+        duración original de la sesión, en segundos.
+    gestures : list
+        (instante, gesto principal, gesto secundario) por frame.
+    calls : list
+        llamadas registradas por los backends de grabación.
+    """
+
+    def __init__(self, frames, elapsed, duration, gestures, calls):
+        self.frames = frames
+        self.elapsed = elapsed
+        self.duration = duration
+        self.gestures = gestures
+        self.calls = calls
+
+    @property
+    def speedup(self):
+        """Veces más rápido que el tiempo real."""
+        return self.duration / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def summary(self):
+        """Devuelve una línea de texto con el resumen de la reproducción."""
+        return (f"{self.frames} frames ({self.duration:.1f} s de sesión) en {self.elapsed:.3f} s, "
+                f"{self.speedup:.0f}x tiempo real, {len(self.calls)} acciones")
+
+
+class SessionReplay:
+    """
+    Reproduce una sesión grabada con `SessionRecorder` a través de una
+    `GestureSession` propia, sin cámara ni modelo de MediaPipe.
+
+    Las acciones van a los backends indicados (por defecto, de grabación) y se
+    ejecutan en el mismo hilo, por lo que la reproducción es determinista. Cada
+    reproducción tiene su propio estado, por lo que varias pueden ejecutarse a
+    la vez (ver `replay_many`).
+    """
+
+    def __init__(self, path, backends=None, classifier=None):
+        """
+        Parameters
+        ----------
+        path : str
+            Ruta del archivo de sesión.
+        backends : SystemBackends, optional
+            Backends que reciben las acciones. Por defecto `recording_backends()`.
+        classifier : LearnedClassifier, optional
+            Clasificador aprendido de gestos; por defecto se usan las reglas.
+        """
+        self.path = path
+        self.frames = load_session(path)
+        self.backends = backends if backends is not None else recording_backends()
+        self.classifier = classifier
+
+    def __len__(self):
+        return len(self.frames)
+
+    def results_at(self, idx):
+        """Reconstruye el resultado de MediaPipe del frame `idx`."""
+        return results_from_frame(self.frames[idx])
+
+    def run(self, realtime=False):
+        """
+        Reproduce la sesión completa.
+
+        Parameters
+        ----------
+        realtime : bool, optional
+            Si es True respeta los tiempos originales; si es False reproduce
+            tan rápido como sea posible.
+
+        Returns
+        -------
+        ReplayReport
+        """
+        # El dispatcher no se inicia: las acciones se ejecutan en este mismo hilo
+        session = GestureSession(controller=Controller(backends=self.backends), classifier=self.classifier)
+
+        timestamps = self.frames['t']
+        gestures = []
+        start = time.perf_counter()
+        for idx in range(len(self.frames)):
+            t = float(timestamps[idx])
+            if realtime:
+                delay = start + (t - timestamps[0]) - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            results = self.results_at(idx)
+            major, minor = session.process_results(results, t)
+            gestures.append((t, major, minor))
+        elapsed = time.perf_counter() - start
+
+        duration = float(timestamps[-1] - timestamps[0]) if len(timestamps) else 0.0
+        recorder = self.backends.recorder
+        calls = list(recorder.calls) if recorder is not None else []
+        return ReplayReport(len(self.frames), elapsed, duration, gestures, calls)
+
+
+def replay_many(paths, workers=None, realtime=False, classifier=None):
+    """
+    Reproduce varias sesiones a la vez en un grupo de hilos.
+
+    Parameters
+    ----------
+    paths : list(str)
+        Rutas de los archivos de sesión.
+    workers : int, optional
+        Número máximo de hilos. Por defecto, el de `ThreadPoolExecutor`.
+    realtime : bool, optional
+        Si es True cada sesión respeta sus tiempos originales.
+    classifier : LearnedClassifier, optional
+        Clasificador aprendido compartido por todas las reproducciones.
+
+    Returns
+    -------
+    list(ReplayReport)
+        Un informe por sesión, en el orden de `paths`.
+    """
+    def replay(path):
+        return SessionReplay(path, classifier=classifier).run(realtime=realtime)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="SessionReplay") as pool:
+        return list(pool.map(replay, paths))
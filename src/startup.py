@@ -0,0 +1,175 @@
+import inspect
+import threading
+import time
+import numpy as np
+
+
+class BackgroundTask:
+    """
+    Ejecuta una función en un hilo daemon y guarda su resultado, para solapar
+    trabajo lento del arranque (cargar el modelo, crear backends) con otro.
+
+    Atributos
+    ----------
+    name : str
+        nombre del hilo.
+    elapsed : float
+        segundos que tardó la función, None si no ha terminado.
+    """
+
+    def __init__(self, func, *args, name="startup-task", **kwargs):
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+        self.name = name
+        self.elapsed = None
+        self._result = None
+        self._error = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def _run(self):
+        start = time.perf_counter()
+        try:
+            self._result = self._func(*self._args, **self._kwargs)
+        except BaseException as exc:
+            self._error = exc
+        with self._lock:
+            self.elapsed = time.perf_counter() - start
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def start(self):
+        """Lanza la función en segundo plano y devuelve la tarea."""
+        self._thread.start()
+        return self
+
+    def done(self):
+        """True si la función ya terminó."""
+        return self.elapsed is not None
+
+    def add_done_callback(self, callback):
+        """
+        Llama a `callback(tarea)` cuando termine la función, desde el hilo de la
+        tarea; si ya terminó, de inmediato desde el hilo que llama.
+        """
+        with self._lock:
+            if self.elapsed is None:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def result(self, timeout=None):
+        """
+        Espera a que termine la función y devuelve su resultado.
+
+        Raises
+        ------
+        TimeoutError
+            Si no termina en `timeout` segundos.
+        Exception
+            La excepción que lanzó la función, si falló.
+        """
+        if self.elapsed is None:
+            # Si ya terminó (también dentro de un `add_done_callback`) no se espera al hilo
+            self._thread.join(timeout)
+        if self.elapsed is None:
+            raise TimeoutError(f"La tarea {self.name} no terminó en {timeout} s")
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class StartupTimer:
+    """
+    Registra el instante de cada fase del arranque respecto a un origen común
+    (normalmente el inicio del proceso en `main.py`).
+
+    Atributos
+    ----------
+    origin : float
+        instante de referencia (`time.perf_counter()`).
+    phases : dict
+        {fase: segundos desde `origin`} en orden de registro.
+    """
+
+    def __init__(self, origin=None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.phases = {}
+
+    def mark(self, phase):
+        """Registra el instante de `phase` si no se había registrado ya."""
+        if phase not in self.phases:
+            self.phases[phase] = time.perf_counter() - self.origin
+        return self.phases[phase]
+
+    def summary(self):
+        """Texto de una línea con el tiempo de cada fase en ms."""
+        return ", ".join(f"{phase} {1000 * t:.0f} ms" for phase, t in self.phases.items())
+
+
+def close_when_done(task):
+    """
+    Cierra el modelo que crea `task` en cuanto esté listo, sin esperarlo, para
+    descartar una carga que ya no se necesita.
+    """
+    def close(done):
+        try:
+            done.result().close()
+        except Exception as exc:
+            print(f"Error al cerrar el modelo descartado ({done.name}): {exc}")
+    task.add_done_callback(close)
+
+
+def create_hands_model(max_num_hands, min_detection_confidence, min_tracking_confidence, model_complexity=None,
+                       warmup_size=(64, 64)):
+    """
+    Importa MediaPipe, crea el modelo de manos y procesa una imagen vacía para
+    que la primera inferencia real no pague la inicialización del grafo.
+
+    Pensado para ejecutarse en una `BackgroundTask` mientras se abre la cámara.
+
+    Parameters
+    ----------
+    max_num_hands : int
+        Número máximo de manos a detectar.
+    min_detection_confidence : float
+        Confianza mínima de detección.
+    min_tracking_confidence : float
+        Confianza mínima de seguimiento.
+    model_complexity : int, optional
+        Complejidad del modelo de landmarks (0 ligero, 1 completo). Por defecto la de MediaPipe.
+        Se ignora, con un aviso, en versiones de MediaPipe sin ese parámetro (como 0.8.6).
+    warmup_size : tuple(int, int), optional
+        Ancho y alto de la imagen de calentamiento; None para no calentar.
+
+    Returns
+    -------
+    Object
+        Modelo `mp.solutions.hands.Hands`; quien lo usa debe llamar a `close()`.
+    """
+    import mediapipe as mp
+
+    hands_class = mp.solutions.hands.Hands
+    params = {}
+    if model_complexity is not None:
+        if "model_complexity" in inspect.signature(hands_class).parameters:
+            params["model_complexity"] = model_complexity
+        else:
+            print(f"MediaPipe {getattr(mp, '__version__', '?')} no admite model_complexity; "
+                  f"se ignora la complejidad {model_complexity} del perfil.")
+    hands = hands_class(
+        max_num_hands=max_num_hands,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
+        **params
+    )
+    if warmup_size is not None:
+        width, height = warmup_size
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        blank.flags.writeable = False
+        # Sin manos en la imagen, el primer frame real vuelve a pasar por el detector
+        hands.process(blank)
+    return hands
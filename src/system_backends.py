@@ -0,0 +1,439 @@
+import re
+import subprocess
+import sys
+import time
+
+
+class CursorBackend:
+    """Interfaz para mover el cursor y generar clics."""
+
+    def size(self):
+        """Devuelve (ancho, alto) de la pantalla en píxeles."""
+        raise NotImplementedError
+
+    def position(self):
+        """Devuelve la posición (x, y) actual del cursor."""
+        raise NotImplementedError
+
+    def move_to(self, x, y, duration=0.0):
+        """Mueve el cursor a (x, y)."""
+        raise NotImplementedError
+
+    def mouse_down(self, button="left"):
+        """Mantiene presionado un botón del ratón."""
+        raise NotImplementedError
+
+    def mouse_up(self, button="left"):
+        """Suelta un botón del ratón."""
+        raise NotImplementedError
+
+    def click(self, button="left"):
+        """Realiza un clic."""
+        raise NotImplementedError
+
+    def double_click(self):
+        """Realiza un doble clic izquierdo."""
+        raise NotImplementedError
+
+
+class ScrollBackend:
+    """Interfaz para el desplazamiento en pantalla."""
+
+    def scroll(self, amount):
+        """Desplazamiento vertical; positivo hacia arriba."""
+        raise NotImplementedError
+
+    def hscroll(self, amount):
+        """Desplazamiento horizontal; positivo hacia la izquierda."""
+        raise NotImplementedError
+
+
+class LevelBackend:
+    """Interfaz para un nivel del sistema en el rango [0.0, 1.0] (volumen, brillo)."""
+
+    def get_level(self):
+        """Devuelve el nivel actual."""
+        raise NotImplementedError
+
+    def set_level(self, level):
+        """Fija el nivel."""
+        raise NotImplementedError
+
+
+class PyAutoGUICursor(CursorBackend):
+    """
+    Cursor del sistema mediante `pyautogui`.
+
+    El tamaño de la pantalla se lee una vez al crear el objeto. La posición se
+    lee del sistema operativo en cada llamada; mientras la mano mueve el cursor,
+    `Controller` usa el último destino que envió y no la consulta.
+    """
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+        self._size = tuple(pyautogui.size())
+
+    def refresh(self):
+        """Vuelve a leer la geometría de la pantalla."""
+        self._size = tuple(self._pyautogui.size())
+
+    def size(self):
+        return self._size
+
+    def position(self):
+        return tuple(self._pyautogui.position())
+
+    def move_to(self, x, y, duration=0.0):
+        self._pyautogui.moveTo(x, y, duration=duration)
+
+    def mouse_down(self, button="left"):
+        self._pyautogui.mouseDown(button=button)
+
+    def mouse_up(self, button="left"):
+        self._pyautogui.mouseUp(button=button)
+
+    def click(self, button="left"):
+        self._pyautogui.click(button=button)
+
+    def double_click(self):
+        self._pyautogui.doubleClick()
+
+
+class PyAutoGUIScroll(ScrollBackend):
+    """Desplazamiento mediante `pyautogui`; el horizontal usa Shift + rueda."""
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def scroll(self, amount):
+        self._pyautogui.scroll(amount)
+
+    def hscroll(self, amount):
+        self._pyautogui.keyDown('shift')
+        self._pyautogui.scroll(amount)
+        self._pyautogui.keyUp('shift')
+
+
+class PycawVolume(LevelBackend):
+    """
+    Volumen maestro de Windows mediante `pycaw`.
+
+    El dispositivo de audio se abre una sola vez y el último nivel conocido se
+    guarda en caché; solo se vuelve a leer del sistema cuando la caché tiene más
+    de `max_age` segundos.
+    """
+
+    def __init__(self, max_age=2.0):
+        from ctypes import cast, POINTER
+        from comtypes import CLSCTX_ALL
+        from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+        devices = AudioUtilities.GetSpeakers()
+        interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+        self._volume = cast(interface, POINTER(IAudioEndpointVolume))
+        self.max_age = max_age
+        self._level = None
+        self._read_time = 0.0
+
+    def get_level(self):
+        now = time.monotonic()
+        if self._level is None or now - self._read_time > self.max_age:
+            self._level = self._volume.GetMasterVolumeLevelScalar()
+            self._read_time = now
+        return self._level
+
+    def set_level(self, level):
+        if level == self._level:
+            return
+        self._volume.SetMasterVolumeLevelScalar(level, None)
+        self._level = level
+        self._read_time = time.monotonic()
+
+
+class SbcBrightness(LevelBackend):
+    """
+    Brillo de la pantalla mediante `screen_brightness_control`.
+
+    Igual que `PycawVolume`, guarda el último nivel conocido y solo lo vuelve a
+    leer del sistema cuando tiene más de `max_age` segundos.
+    """
+
+    def __init__(self, display=0, max_age=2.0):
+        import screen_brightness_control as sbcontrol
+        self._sbcontrol = sbcontrol
+        self.display = display
+        self.max_age = max_age
+        self._percent = None
+        self._read_time = 0.0
+
+    def _get_percent(self):
+        now = time.monotonic()
+        if self._percent is None or now - self._read_time > self.max_age:
+            self._percent = int(self._sbcontrol.get_brightness(display=self.display))
+            self._read_time = now
+        return self._percent
+
+    def get_level(self):
+        return self._get_percent() / 100.0
+
+    def set_level(self, level):
+        target = int(round(100 * level))
+        start = self._get_percent()
+        if target == start:
+            return
+        self._sbcontrol.fade_brightness(target, start=start)
+        self._percent = target
+        self._read_time = time.monotonic()
+
+
+class CommandVolume(LevelBackend):
+    """
+    Volumen maestro mediante comandos del sistema (`pactl` en Linux, `osascript`
+    en macOS), con la misma caché de nivel que `PycawVolume`.
+
+    Parameters
+    ----------
+    get_command : list(str)
+        Comando que imprime el volumen; se toma el primer porcentaje o número de la salida.
+    set_command : list(str)
+        Comando que fija el volumen; `{percent}` se reemplaza por el nivel en 0-100.
+    max_age : float
+        Segundos durante los cuales el último nivel leído se considera válido.
+    """
+
+    def __init__(self, get_command, set_command, max_age=2.0):
+        self.get_command = get_command
+        self.set_command = set_command
+        self.max_age = max_age
+        self._level = None
+        self._read_time = 0.0
+        self.get_level()  # Falla al crear el backend si el comando no existe
+
+    def get_level(self):
+        now = time.monotonic()
+        if self._level is None or now - self._read_time > self.max_age:
+            output = subprocess.run(self.get_command, capture_output=True, text=True, check=True).stdout
+            match = re.search(r"(\d+)%", output) or re.search(r"(\d+)", output)
+            if match is None:
+                raise RuntimeError(f"No se pudo leer el volumen de: {output!r}")
+            self._level = min(int(match.group(1)), 100) / 100.0
+            self._read_time = now
+        return self._level
+
+    def set_level(self, level):
+        if level == self._level:
+            return
+        percent = str(int(round(100 * level)))
+        command = [arg.replace("{percent}", percent) for arg in self.set_command]
+        subprocess.run(command, check=True, capture_output=True)
+        self._level = level
+        self._read_time = time.monotonic()
+
+
+def pactl_volume():
+    """Volumen del sumidero por defecto de PulseAudio/PipeWire (Linux)."""
+    return CommandVolume(
+        ["pactl", "get-sink-volume", "@DEFAULT_SINK@"],
+        ["pactl", "set-sink-volume", "@DEFAULT_SINK@", "{percent}%"],
+    )
+
+
+def osascript_volume():
+    """Volumen de salida de macOS."""
+    return CommandVolume(
+        ["osascript", "-e", "output volume of (get volume settings)"],
+        ["osascript", "-e", "set volume output volume {percent}"],
+    )
+
+
+class RecordingBackend:
+    """
+    Registro compartido de las llamadas hechas a los backends de grabación.
+
+    Cada entrada es (instante, backend, método, argumentos). No requiere pantalla
+    ni COM de Windows, por lo que sirve para ejecutar y medir el control en Linux
+    sin interfaz gráfica.
+    """
+
+    def __init__(self, record=True):
+        self.record = record
+        self.calls = []
+
+    def log(self, target, method, *args):
+        """Añade una llamada al registro si la grabación está activa."""
+        if self.record:
+            self.calls.append((time.perf_counter(), target, method, args))
+
+    def clear(self):
+        """Vacía el registro."""
+        self.calls.clear()
+
+
+class RecordingCursor(CursorBackend):
+    """Cursor simulado que registra las llamadas en un `RecordingBackend`."""
+
+    def __init__(self, recorder, screen_size=(1920, 1080)):
+        self._recorder = recorder
+        self._size = tuple(screen_size)
+        self._position = (self._size[0] // 2, self._size[1] // 2)
+
+    def size(self):
+        return self._size
+
+    def position(self):
+        return self._position
+
+    def move_to(self, x, y, duration=0.0):
+        self._position = (x, y)
+        self._recorder.log("cursor", "move_to", x, y)
+
+    def mouse_down(self, button="left"):
+        self._recorder.log("cursor", "mouse_down", button)
+
+    def mouse_up(self, button="left"):
+        self._recorder.log("cursor", "mouse_up", button)
+
+    def click(self, button="left"):
+        self._recorder.log("cursor", "click", button)
+
+    def double_click(self):
+        self._recorder.log("cursor", "double_click")
+
+
+class RecordingScroll(ScrollBackend):
+    """Scroll simulado que registra las llamadas en un `RecordingBackend`."""
+
+    def __init__(self, recorder):
+        self._recorder = recorder
+
+    def scroll(self, amount):
+        self._recorder.log("scroll", "scroll", amount)
+
+    def hscroll(self, amount):
+        self._recorder.log("scroll", "hscroll", amount)
+
+
+class RecordingLevel(LevelBackend):
+    """Nivel simulado (volumen o brillo) que registra los cambios en un `RecordingBackend`."""
+
+    def __init__(self, recorder, name, level=0.5):
+        self._recorder = recorder
+        self.name = name
+        self._level = level
+
+    def get_level(self):
+        return self._level
+
+    def set_level(self, level):
+        if level == self._level:
+            return
+        self._level = level
+        self._recorder.log(self.name, "set_level", level)
+
+
+class SystemBackends:
+    """
+    Agrupa los backends de cursor, scroll, volumen y brillo que usa `Controller`.
+
+    Atributos
+    ----------
+    cursor : CursorBackend
+    scroll : ScrollBackend
+    volume : LevelBackend
+    brightness : LevelBackend
+    recorder : RecordingBackend o None
+        registro de llamadas cuando se usan backends de grabación.
+    """
+
+    def __init__(self, cursor, scroll, volume, brightness, recorder=None):
+        self.cursor = cursor
+        self.scroll = scroll
+        self.volume = volume
+        self.brightness = brightness
+        self.recorder = recorder
+
+
+# Constructores de cada backend nativo por plataforma (`sys.platform`), en orden de preferencia
+NATIVE_BACKENDS = {
+    "win32": {
+        "cursor": [PyAutoGUICursor],
+        "scroll": [PyAutoGUIScroll],
+        "volume": [PycawVolume],
+        "brightness": [SbcBrightness],
+    },
+    "linux": {
+        "cursor": [PyAutoGUICursor],
+        "scroll": [PyAutoGUIScroll],
+        "volume": [pactl_volume],
+        "brightness": [SbcBrightness],
+    },
+    "darwin": {
+        "cursor": [PyAutoGUICursor],
+        "scroll": [PyAutoGUIScroll],
+        "volume": [osascript_volume],
+        "brightness": [],
+    },
+}
+
+
+def _first_available(kind, factories, fallback):
+    """Devuelve el primer backend de `factories` que se pueda crear, o `fallback()`."""
+    for factory in factories:
+        try:
+            return factory()
+        except Exception as exc:
+            # Falta el módulo, no hay pantalla o el comando del sistema no existe
+            print(f"Backend de {kind} no disponible ({getattr(factory, '__name__', factory)}): {exc}")
+    print(f"Usando un backend de {kind} sin efecto.")
+    return fallback()
+
+
+def native_backends(platform=None):
+    """
+    Crea los backends que actúan sobre el sistema real según la plataforma.
+
+    Los módulos de cada backend se importan al crearlo, de modo que en Linux o
+    macOS nunca se cargan los de Windows. Un backend que no se puede crear (por
+    ejemplo, sin pantalla o sin control de brillo) se reemplaza por uno sin
+    efecto en lugar de impedir el arranque.
+
+    Parameters
+    ----------
+    platform : str, optional
+        Clave de `NATIVE_BACKENDS`. Por defecto `sys.platform`.
+    """
+    platform = sys.platform if platform is None else platform
+    if platform.startswith("linux"):
+        platform = "linux"
+    factories = NATIVE_BACKENDS.get(platform, NATIVE_BACKENDS["linux"])
+    null = RecordingBackend(record=False)
+    return SystemBackends(
+        cursor=_first_available("cursor", factories["cursor"], lambda: RecordingCursor(null)),
+        scroll=_first_available("scroll", factories["scroll"], lambda: RecordingScroll(null)),
+        volume=_first_available("volumen", factories["volume"], lambda: RecordingLevel(null, "volume")),
+        brightness=_first_available("brillo", factories["brightness"],
+                                    lambda: RecordingLevel(null, "brightness")),
+    )
+
+
+def recording_backends(screen_size=(1920, 1080), record=True):
+    """
+    Crea backends simulados que solo registran las llamadas.
+
+    Parameters
+    ----------
+    screen_size : tuple(int, int), optional
+        Tamaño de pantalla simulado.
+    record : bool, optional
+        Si es False, las llamadas no se guardan (backend sin efecto).
+    """
+    recorder = RecordingBackend(record=record)
+    return SystemBackends(
+        cursor=RecordingCursor(recorder, screen_size),
+        scroll=RecordingScroll(recorder),
+        volume=RecordingLevel(recorder, "volume"),
+        brightness=RecordingLevel(recorder, "brightness"),
+        recorder=recorder,
+    )